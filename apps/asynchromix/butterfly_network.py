@@ -6,11 +6,11 @@ from time import time
 
 
 async def batch_switch(ctx, xs, ys, n):
-    sbits = [ctx.preproc.get_one_minus_ones(ctx).v for _ in range(n // 2)]
+    sbits = ctx.preproc.get_one_minus_ones_array(ctx, n // 2)
     ns = [1 / ctx.field(2) for _ in range(n // 2)]
 
     assert len(xs) == len(ys) == len(sbits) == n // 2
-    xs, ys, sbits = list(map(ctx.ShareArray, [xs, ys, sbits]))
+    xs, ys = ctx.ShareArray(xs), ctx.ShareArray(ys)
     ms = (await (sbits * (xs - ys)))._shares
 
     t1s = [n * (x + y + m).v for x, y, m, n in zip(xs._shares, ys._shares, ms, ns)]
@@ -108,6 +108,33 @@ def test_benchmark_hbavss_dealer(test_router, benchmark, t, k):
     benchmark(_prog)
 
 
+@mark.parametrize(
+    "t, k, preprocess",
+    [(32, 25, True), (32, 25, False), (64, 25, True), (64, 25, False),],
+)
+def test_benchmark_hbavss_dealer_preprocessing(
+    test_router, benchmark, t, k, preprocess
+):
+    # Compares dealing with fixed-base tables for the CRS against dealing with
+    # multi-exponentiations over the plain CRS.
+    loop = asyncio.get_event_loop()
+    n = 3 * t + 1
+    field = GF(Subgroup.BLS12_381)
+    g, h, pks, sks = get_avss_params(n + 1, t)
+    crs = gen_pc_const_crs(t, g=g, h=h)
+    pc = PolyCommitConst(crs, field=field)
+    if preprocess:
+        pc.preprocess_prover(8)
+    pc.preprocess_verifier(8)
+    values = [field.random() for _ in range(k)]
+    params = (t, n, g, h, pks, sks, crs, pc, values, field)
+
+    def _prog():
+        loop.run_until_complete(hbavss_multibatch_dealer(test_router, params))
+
+    benchmark(_prog)
+
+
 @mark.parametrize(
     "t, k",
     [
@@ -14,3 +14,10 @@ def test_benchmark_generate_powers(benchmark, n, t, k, z):
     pp_elements = PreProcessedElements()
     pp_elements.clear_preprocessing()
     benchmark(pp_elements.generate_powers, k, n, t, z)
+
+
+@mark.parametrize("n,t,k,processes", [(4, 1, 1 << 16, None), (4, 1, 1 << 16, 4)])
+def test_benchmark_generate_triples(benchmark, n, t, k, processes):
+    pp_elements = PreProcessedElements()
+    pp_elements.clear_preprocessing()
+    benchmark(pp_elements._triples.generate_values, k, n, t, processes=processes)
@@ -1,6 +1,6 @@
 from honeybadgermpc.field import GF
 from honeybadgermpc.elliptic_curve import Subgroup
-from honeybadgermpc.reed_solomon import GaoRobustDecoder
+from honeybadgermpc.reed_solomon import GaoRobustDecoder, WelchBerlekampRobustDecoder
 from honeybadgermpc.polynomial import EvalPoint, polynomials_over
 from random import randint
 from pytest import mark
@@ -55,3 +55,35 @@ def test_benchmark_gao_robust_decode_fft(benchmark, t, galois_field):
         else:
             shares_with_faults.append(int(truepoly(omega ** (i) % p)))
     benchmark(dec.robust_decode, parties, shares_with_faults)
+
+
+def _shares_with_faults(galois_field, n, t):
+    poly = polynomials_over(galois_field)
+    truepoly = poly.random(degree=t)
+    faults = set()
+    while len(faults) < t:
+        faults.add(randint(0, n - 1))
+    return [
+        int(galois_field.random()) if i in faults else int(truepoly(i + 1))
+        for i in range(n)
+    ]
+
+
+@mark.parametrize("decoder", [GaoRobustDecoder, WelchBerlekampRobustDecoder])
+@mark.parametrize("t", [1, 3, 5, 10, 25, 33])
+def test_benchmark_robust_decode_gao_vs_wb(benchmark, decoder, t, galois_field):
+    n = 3 * t + 1
+    dec = decoder(t, EvalPoint(galois_field, n))
+    parties = list(range(n))
+    shares_with_faults = _shares_with_faults(galois_field, n, t)
+    benchmark(dec.robust_decode, parties, shares_with_faults)
+
+
+@mark.parametrize("batch_size", [1, 16, 64])
+@mark.parametrize("t", [1, 5, 10])
+def test_benchmark_wb_robust_decode_batch(benchmark, batch_size, t, galois_field):
+    n = 3 * t + 1
+    dec = WelchBerlekampRobustDecoder(t, EvalPoint(galois_field, n))
+    parties = list(range(n))
+    batch = [_shares_with_faults(galois_field, n, t) for _ in range(batch_size)]
+    benchmark(dec.robust_decode_batch, parties, batch)
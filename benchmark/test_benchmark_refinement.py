@@ -1,5 +1,5 @@
 from pytest import mark
-from honeybadgermpc.progs.random_refinement import refine_randoms
+from honeybadgermpc.progs.random_refinement import get_random_refiner, refine_randoms
 
 
 @mark.parametrize("n", [4, 10, 16, 50, 100])
@@ -7,3 +7,14 @@ def test_benchmark_random_refinement(benchmark, n, galois_field):
     t = (n - 1) // 3
     random_shares_int = [galois_field.random().value for _ in range(n)]
     benchmark(refine_randoms, n, t, galois_field, random_shares_int)
+
+
+@mark.parametrize("n", [4, 10, 16, 50, 100])
+@mark.parametrize("batches", [100])
+def test_benchmark_random_refinement_batches(benchmark, n, batches, galois_field):
+    t = (n - 1) // 3
+    random_shares_int = [
+        [galois_field.random().value for _ in range(n)] for _ in range(batches)
+    ]
+    refiner = get_random_refiner(n, t, galois_field)
+    benchmark(refiner.refine, random_shares_int)
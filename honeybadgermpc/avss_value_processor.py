@@ -8,21 +8,50 @@ from honeybadgermpc.utils.sequencer import Sequencer
 
 
 class AvssValueProcessor(object):
-    # How long to wait before running another instance of ACS?
+    # Default latency deadline: how long values received but not yet agreed upon
+    # wait for acs_batch_size values to accumulate before an instance of ACS is
+    # run on them anyway.
     ACS_PERIOD_IN_SECONDS = 1
 
-    # Delimiter to separate two batches in the output queue.
-    BATCH_DELIMITER = None
-
-    def __init__(self, pk, sk, n, t, my_id, send, recv, get_input, chunk_size=1):
+    ACS_SID_PREFIX = "AVSS-ACS-"
+
+    def __init__(
+        self,
+        pk,
+        sk,
+        n,
+        t,
+        my_id,
+        send,
+        recv,
+        get_input,
+        chunk_size=1,
+        acs_batch_size=1,
+        min_acs_interval=0,
+        max_acs_latency=None,
+    ):
+        """
+        args:
+            acs_batch_size: number of new AVSS values to receive before an instance of
+                ACS is started
+            min_acs_interval: minimum number of seconds between the starts of two
+                instances of ACS
+            max_acs_latency: maximum number of seconds a received value waits for an
+                instance of ACS when fewer than acs_batch_size values are pending.
+                Defaults to ACS_PERIOD_IN_SECONDS
+
+        Values which arrive while an instance of ACS runs are proposed together in
+        the next one, so the number of values agreed per instance grows with the
+        rate at which they arrive.
+        """
         # This stores the AVSSed values which have been received from each dealer.
         self.inputs_per_dealer = [list() for _ in range(n)]
 
-        # This stores the AVSSed values for each dealer which have been agreed.
-        # This is a list of Futures which are marked done when the value is received.
-        # The Future gurantees that the AVSS value has been agreed by at least `t+1`
-        # parties and will resolve to a share once it is received by this node.
-        self.outputs_per_dealer = [list() for _ in range(n)]
+        # This stores the number of AVSSed values from each dealer which have been
+        # agreed, i.e. received by at least `t+1` parties. The agreed values of a
+        # dealer are the first ones of inputs_per_dealer, though this node may not
+        # have received all of them yet.
+        self.agreed_counts_per_dealer = [0] * n
 
         # This stores a list of the indices of the next AVSS value to be returned
         # when a consumer requests a value dealt from a particular dealer.
@@ -35,8 +64,9 @@ class AvssValueProcessor(object):
         # received out of order and delivers them in an order based on the AVSS Id.
         self.sequencers = defaultdict(Sequencer)
 
-        # This queue contains values AVSSed from all nodes such that at least `n-t`
-        # nodes have received a value corresponding to a particular batch.
+        # This queue contains batches of values AVSSed from all nodes such that at
+        # least `n-t` nodes have received a value corresponding to a particular batch.
+        # Each batch is a list of (dealer_id, start, end) slices of inputs_per_dealer.
         # Eg: Let the following be the set of values received by all nodes:
         #
         #   |  0  |  1  |  2  |  3  |
@@ -53,7 +83,27 @@ class AvssValueProcessor(object):
         # when they are coupled to each other. This is true for triples and powers.
         self.chunk_size = chunk_size
 
-        subscribe_recv_task, subscribe = subscribe_recv(recv)
+        # ACS instances started by other parties, which this party must join even
+        # if it hasn't received any new values itself.
+        self._acs_sids_started = set()
+
+        # Number of ACS instances this party has completed. Messages of these
+        # instances which arrive late must not start them again.
+        self._acs_completed = 0
+
+        async def _recv():
+            sender_id, (tag, message) = await recv()
+            if tag.startswith(AvssValueProcessor.ACS_SID_PREFIX):
+                acs_counter = int(tag[len(AvssValueProcessor.ACS_SID_PREFIX) :])
+                if (
+                    acs_counter >= self._acs_completed
+                    and tag not in self._acs_sids_started
+                ):
+                    self._acs_sids_started.add(tag)
+                    self._acs_trigger.set()
+            return sender_id, (tag, message)
+
+        subscribe_recv_task, subscribe = subscribe_recv(_recv)
         self.tasks = [subscribe_recv_task]
 
         def _get_send_recv(tag):
@@ -65,8 +115,56 @@ class AvssValueProcessor(object):
         self.n, self.t, self.my_id = n, t, my_id
         self.get_input = get_input
 
+        self.acs_batch_size = acs_batch_size
+        self.min_acs_interval = min_acs_interval
+
+        self.max_acs_latency = (
+            max_acs_latency
+            if max_acs_latency is not None
+            else AvssValueProcessor.ACS_PERIOD_IN_SECONDS
+        )
+
+        # Set whenever a new AVSS value is received or another party starts an
+        # instance of ACS, to wake up the ACS runner.
+        self._acs_trigger = asyncio.Event()
+
+        # Set whenever a new AVSS value is received, to wake up consumers waiting
+        # for agreed values which this node hasn't received yet.
+        self._input_received = asyncio.Event()
+
+        # Set whenever an instance of ACS agrees on new values.
+        self._values_agreed = asyncio.Event()
+
+        # Time at which the oldest value not yet proposed to ACS, or proposed but
+        # not agreed upon, started waiting. None if there is no such value.
+        self._pending_since = None
+
+    async def _wait_for_inputs(self, dealer_id, count):
+        while len(self.inputs_per_dealer[dealer_id]) < count:
+            self._input_received.clear()
+            await self._input_received.wait()
+
+    async def wait_for_agreed(self, dealer_id, count):
+        """ Wait until at least count values dealt by dealer_id have been agreed.
+        """
+        while self.agreed_counts_per_dealer[dealer_id] < count:
+            self._values_agreed.clear()
+            await self._values_agreed.wait()
+
     async def get(self):
-        return await self.output_queue.get()
+        """ Get the next batch of agreed values: chunk_size consecutive values from
+        each of at least `n-t` dealers, ordered by dealer. This waits until this node
+        has received all the values of the batch.
+        """
+        batch = await self.output_queue.get()
+        for dealer_id, _, end in batch:
+            await self._wait_for_inputs(dealer_id, end)
+
+        return [
+            value
+            for dealer_id, start, end in batch
+            for value in self.inputs_per_dealer[dealer_id][start:end]
+        ]
 
     async def _recv_loop(self):
         logging.debug("[%d] Starting _recv_loop", self.my_id)
@@ -85,25 +183,75 @@ class AvssValueProcessor(object):
 
                 # Add the value to the input list based on who dealt the value
                 self.inputs_per_dealer[dealer_id].append(avss_value)
+                if self._pending_since is None:
+                    self._pending_since = asyncio.get_event_loop().time()
+                self._acs_trigger.set()
 
-                # If this value has already been agreed upon by other parties
-                # then it means that its Future has been added to the output list.
-                # So we need to set the result of that future to be equal to this value.
-                idx = len(self.inputs_per_dealer[dealer_id]) - 1
-                if idx < len(self.outputs_per_dealer[dealer_id]):
-                    assert not self.outputs_per_dealer[dealer_id][idx].done()
-                    self.outputs_per_dealer[dealer_id][idx].set_result(avss_value)
+                # This value may already have been agreed upon by other parties,
+                # and a consumer may be waiting for it.
+                self._input_received.set()
+
+    def _count_unproposed_values(self, proposed_counts):
+        return sum(
+            len(self.inputs_per_dealer[i]) - proposed_counts[i] for i in range(self.n)
+        )
+
+    def _has_unagreed_values(self):
+        return any(
+            len(self.inputs_per_dealer[i]) > self.agreed_counts_per_dealer[i]
+            for i in range(self.n)
+        )
+
+    async def _wait_for_acs_inputs(self, sid, proposed_counts):
+        """ Wait until there is something for ACS to agree on: acs_batch_size values
+        received since the last ACS input, or any values received which haven't been
+        agreed upon yet once the oldest of them has waited max_acs_latency seconds.
+        Also return as soon as another party starts the instance sid, so that all
+        parties run the same instances. When nothing is pending, this waits without
+        any deadline.
+        """
+        loop = asyncio.get_event_loop()
+        while self._count_unproposed_values(proposed_counts) < self.acs_batch_size:
+            if sid in self._acs_sids_started:
+                return
+
+            timeout = None
+            if self._pending_since is not None:
+                timeout = self._pending_since + self.max_acs_latency - loop.time()
+                if timeout <= 0:
+                    return
+
+            self._acs_trigger.clear()
+            try:
+                await asyncio.wait_for(self._acs_trigger.wait(), timeout)
+            except asyncio.TimeoutError:
+                return
 
     async def _acs_runner(self):
         logging.debug("[%d] Starting ACS runner", self.my_id)
         acs_counter = 0
+        proposed_counts = [0] * self.n
         while True:
-            # Sleep first, then run so that you wait until some values are received
-            await asyncio.sleep(AvssValueProcessor.ACS_PERIOD_IN_SECONDS)
-            sid = f"AVSS-ACS-{acs_counter}"
+            # Run only once some values are received, rather than periodically
+            sid = f"{AvssValueProcessor.ACS_SID_PREFIX}{acs_counter}"
+            await self._wait_for_acs_inputs(sid, proposed_counts)
+
+            start_time = asyncio.get_event_loop().time()
             logging.debug("[%d] ACS Id: %s", self.my_id, sid)
-            await self._run_acs_to_process_values(sid)
+            # Values which arrive from now on are proposed in the next instance, and
+            # values proposed in this one which don't get agreed upon are proposed
+            # again, so both wait from the start of this instance.
+            self._pending_since = start_time
+            proposed_counts = await self._run_acs_to_process_values(sid)
+            self._acs_sids_started.discard(sid)
             acs_counter += 1
+            self._acs_completed = acs_counter
+            if not self._has_unagreed_values():
+                self._pending_since = None
+
+            elapsed = asyncio.get_event_loop().time() - start_time
+            if elapsed < self.min_acs_interval:
+                await asyncio.sleep(self.min_acs_interval - elapsed)
 
     def _process_acs_output(self, pickled_acs_outputs):
         # Do a transpose of the AVSS counts from each party.
@@ -123,7 +271,7 @@ class AvssValueProcessor(object):
         # indicates that the parties which were late are treated as if it has not seen
         # any new values.
         acs_outputs = [None] * self.n
-        default_acs_output = [len(self.outputs_per_dealer[j]) for j in range(self.n)]
+        default_acs_output = list(self.agreed_counts_per_dealer)
         for i, pickled_acs_output in enumerate(pickled_acs_outputs):
             if pickled_acs_output is not None:
                 acs_outputs[i] = loads(pickled_acs_output)
@@ -148,46 +296,27 @@ class AvssValueProcessor(object):
 
             # This agreed count should always be more than the number
             # of outputs which are available at any instant on any node.
-            assert len(self.outputs_per_dealer[i]) <= agreed_value_count
-
-            # You take the total number of values which have already been agreed upon
-            # and are present in the output and compare it with the new agreed count.
-            # If more values have been agreed upon then you add them to the output list
-            # by adding a Future object.
-            for j in range(len(self.outputs_per_dealer[i]), agreed_value_count):
-                future = asyncio.Future()
-                self.outputs_per_dealer[i].append(future)
-                # If the output value has already been recieved by this node then
-                # you also set the result of the future to the corresponding value.
-                if j < len(self.inputs_per_dealer[i]):
-                    future.set_result(self.inputs_per_dealer[i][j])
+            assert self.agreed_counts_per_dealer[i] <= agreed_value_count
+            self.agreed_counts_per_dealer[i] = agreed_value_count
 
+        self._values_agreed.set()
         self._add_to_output_queue()
 
     def _add_to_output_queue(self):
-        # TODO: This can definitelt be optimized for space.
-        # The first loop is probably not needed.
-
-        # Get all the values dealt by each dealer which have been agreed and not
-        # yet added to the output queue. i_th row represents the set of values
-        # dealt by the i_th dealer.
-        pending_values = [None] * self.n
-        pending_counts = [0] * self.n
-        for i in range(self.n):
-            s, e = (
-                self.next_idx_to_return_per_dealer[i],
-                len(self.outputs_per_dealer[i]),
-            )
-            assert e - s >= 0
-            pending_values[i] = list(self.outputs_per_dealer[i][s:])
-            pending_counts[i] = len(pending_values[i])
-
-        pending_counts.sort()
+        # Get the number of chunks of values dealt by each dealer which have been
+        # agreed and not yet added to the output queue.
+        pending_counts = [
+            (self.agreed_counts_per_dealer[i] - self.next_idx_to_return_per_dealer[i])
+            // self.chunk_size
+            for i in range(self.n)
+        ]
+        assert all(count >= 0 for count in pending_counts)
+
         # The t_th index represents the maximum values which at least `n-t` nodes have
-        # received. So we can add at max `pending_counts[t]` values to the output queue
-        # from the `n-t` nodes. We pick all the values from the nodes which have less
-        # than `pending_counts[t]`. Values are added in a round robin order from all
-        # nodes until all the required values have been added.
+        # received. So we can add at max `pending_counts[t]` batches to the output
+        # queue from the `n-t` nodes. We pick all the values from the nodes which have
+        # less than `pending_counts[t]`. Each batch takes one chunk from each dealer
+        # with chunks left, until all the required batches have been added.
 
         # |  0  |  1  |  2  |  3  |
         # -------------------------
@@ -201,25 +330,24 @@ class AvssValueProcessor(object):
         # Counts => [2, 3, 4, 6]
 
         # Sorted in ascending order:
-        # max_values_to_output_per_dealer = pending_counts[t] = t_th idx value = 3
+        # batch_count = pending_counts[t] = t_th idx value = 3
         # Batch 1 => 00, 10, 20, 30
         # Batch 2 => 01, 11, 21, 31
         # Batch 3 => 12, 22, 32
 
-        # We want values from at least `n-t` nodes in one batch.
-
-        # AVSS Value Proessor Output Order =>
-        # 00, 10, 20, 30, None, 01, 11, 21, 31, None, 12, 22, 32, None
-        # `None` is the batch delimiter here.
-        max_values_to_output_per_dealer = pending_counts[self.t] // self.chunk_size
-        for i in range(max_values_to_output_per_dealer):
+        # We want values from at least `n-t` nodes in one batch. Batches are added
+        # as slices of the values of each dealer rather than as individual values:
+        # Batch 1 => [(0, 0, 1), (1, 0, 1), (2, 0, 1), (3, 0, 1)]
+        batch_count = sorted(pending_counts)[self.t]
+        for i in range(batch_count):
+            batch = []
             for j in range(self.n):
-                if len(pending_values[j]) // self.chunk_size > i:
-                    for k in range(self.chunk_size):
-                        self.output_queue.put_nowait(pending_values[j][i + k])
-                        # Increment the index of the next return value for this dealer
-                        self.next_idx_to_return_per_dealer[j] += 1
-            self.output_queue.put_nowait(AvssValueProcessor.BATCH_DELIMITER)
+                if pending_counts[j] > i:
+                    start = self.next_idx_to_return_per_dealer[j]
+                    batch.append((j, start, start + self.chunk_size))
+                    # Increment the index of the next return value for this dealer
+                    self.next_idx_to_return_per_dealer[j] += self.chunk_size
+            self.output_queue.put_nowait(batch)
 
     async def _run_acs_to_process_values(self, sid):
         # Get a count of all values which have been received
@@ -250,6 +378,7 @@ class AvssValueProcessor(object):
         self._process_acs_output(acs_outputs)
 
         logging.debug("[%d] All values processed [%s]", self.my_id, sid)
+        return value_counts_per_dealer
 
     def __enter__(self):
         self.tasks.append(asyncio.create_task(self._recv_loop()))
@@ -51,7 +51,7 @@ async def incremental_decode(
     )
 
     async for idx, d in fetch_one(receivers):
-        inc_decoder.add(idx, d)
+        await inc_decoder.add_async(idx, d)
         if inc_decoder.done():
             result, _ = inc_decoder.get_results()
             return result
@@ -1,4 +1,5 @@
 ﻿from pypairing import PyFq, PyFq2, PyFq12, PyFqRepr, PyG1, PyG2, PyFr
+from pypairing import g1_multiexp, g2_multiexp, py_multi_pairing
 import random
 import re
 import struct
@@ -15,6 +16,17 @@ def pair(g1, g2):
     return GT(fq12)
 
 
+def multi_pair(g1s, g2s):
+    """ Product of pair(g1s[i], g2s[i]), with a single Miller loop and final
+    exponentiation shared by all pairs.
+    """
+    assert len(g1s) == len(g2s)
+    assert all(type(g1) is G1 for g1 in g1s) and all(type(g2) is G2 for g2 in g2s)
+    fq12 = PyFq12()
+    py_multi_pairing([g1.pyg1 for g1 in g1s], [g2.pyg2 for g2 in g2s], fq12)
+    return GT(fq12)
+
+
 def dupe_pyg1(pyg1):
     out = PyG1()
     out.copy(pyg1)
@@ -33,6 +45,17 @@ def dupe_pyfr(pyfr):
     return out
 
 
+def _to_pyfr(scalar):
+    if type(scalar) is ZR:
+        return scalar.val
+    try:
+        return ZR(int(scalar)).val
+    except ValueError:
+        raise TypeError(
+            "Invalid exponentiation param. Expected ZR or int. Got " + str(type(scalar))
+        )
+
+
 def dupe_pyfq12(pyfq12):
     out = PyFq12("1")
     out.copy(pyfq12)
@@ -177,6 +200,13 @@ class G1:
         assert type(level) is int
         self.pyg1.preprocess(level)
 
+    def save_preprocessed(self, path):
+        self.pyg1.save_pp(path)
+
+    def load_preprocessed(self, path, level=4):
+        assert type(level) is int
+        self.pyg1.load_pp(path, level)
+
     def invert(self):
         negone = PyFr(str(1))
         negone.negate()
@@ -199,6 +229,16 @@ class G1:
         one.pyg1.zero()
         return one
 
+    @staticmethod
+    def multiexp(bases, scalars):
+        """ Product of bases[i] ** scalars[i], computed with a single Pippenger
+        multi-exponentiation rather than one exponentiation per base.
+        """
+        assert len(bases) == len(scalars)
+        out = G1.one()
+        g1_multiexp([b.pyg1 for b in bases], [_to_pyfr(s) for s in scalars], out.pyg1)
+        return out
+
     @staticmethod
     def rand(seed=None):
         out = PyG1()
@@ -386,6 +426,13 @@ class G2:
         assert type(level) is int
         self.pyg2.preprocess(level)
 
+    def save_preprocessed(self, path):
+        self.pyg2.save_pp(path)
+
+    def load_preprocessed(self, path, level=4):
+        assert type(level) is int
+        self.pyg2.load_pp(path, level)
+
     def invert(self):
         negone = PyFr(str(1))
         negone.negate()
@@ -403,6 +450,16 @@ class G2:
         one.pyg2.zero()
         return one
 
+    @staticmethod
+    def multiexp(bases, scalars):
+        """ Product of bases[i] ** scalars[i], computed with a single Pippenger
+        multi-exponentiation rather than one exponentiation per base.
+        """
+        assert len(bases) == len(scalars)
+        out = G2.one()
+        g2_multiexp([b.pyg2 for b in bases], [_to_pyfr(s) for s in scalars], out.pyg2)
+        return out
+
     @staticmethod
     def rand(seed=None):
         out = PyG2()
@@ -553,6 +610,13 @@ class GT:
         assert type(level) is int
         self.pyfq12.preprocess(level)
 
+    def save_preprocessed(self, path):
+        self.pyfq12.save_pp(path)
+
+    def load_preprocessed(self, path, level=4):
+        assert type(level) is int
+        self.pyfq12.load_pp(path, level)
+
     @staticmethod
     # Generating a random fq12 in rust doesn't guarantee you get something in GT
     # Instead, exponentiate something that is with a random exponent
@@ -570,6 +634,13 @@ class GT:
         out **= exp
         return out
 
+    def duplicate(self):
+        return GT(dupe_pyfq12(self.pyfq12))
+
+    @staticmethod
+    def one():
+        return GT(1)
+
 
 class ZR:
     def __init__(self, val=None):
@@ -804,7 +875,7 @@ def interpolate_g1_at_x(coords, x, order=-1):
     for coord in sortedcoords:
         xs.append(coord[0])
     s = set(xs[0:order])
-    out = G1.one()
-    for i in range(order):
-        out = out * (sortedcoords[i][1] ** (lagrange_at_x(s, xs[i], x)))
-    return out
+    return G1.multiexp(
+        [sortedcoords[i][1] for i in range(order)],
+        [lagrange_at_x(s, xs[i], x) for i in range(order)],
+    )
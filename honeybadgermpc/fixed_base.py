@@ -0,0 +1,83 @@
+"""
+Fixed-base precomputation tables for the group elements of a CRS, shared by all
+users of the CRS in a process and saved to disk for later runs.
+
+Preprocessing a G1, G2 or GT element builds a table which speeds up
+exponentiations with that element as the base. Building the tables of a large CRS
+takes seconds, and each AVSS instance used to build them again for its own copy.
+`preprocessed(element, level)` returns a preprocessed copy of the element instead.
+Its table is built at most once per process, and is loaded from disk if an
+earlier run has saved it.
+
+Preprocessed copies are shared, so they must not be modified in place.
+
+Example:
+
+    gs = preprocessed_all(crs[0], level=4)
+"""
+import logging
+import os
+from hashlib import sha256
+
+# Directory which tables are saved to, one file per element and level.
+TABLES_DIRECTORY = "sharedata/pp_tables/"
+
+# Preprocessed copies of elements, by table_key
+_tables = {}
+
+
+def table_key(element, level):
+    """ Name of the table of an element at the given level, from a hash of the
+    element.
+    """
+    kind = type(element).__name__
+    digest = sha256(f"{kind}:{element}".encode()).hexdigest()
+    return f"{kind}-{digest}-{level}"
+
+
+def _load(element, path, level):
+    if not os.path.exists(path):
+        return False
+    try:
+        element.load_preprocessed(path, level)
+    except OSError as e:
+        logging.warning("Could not load preprocessing table %s: %s", path, e)
+        return False
+    return True
+
+
+def _save(element, directory, path):
+    try:
+        os.makedirs(directory, exist_ok=True)
+        element.save_preprocessed(path)
+    except OSError as e:
+        logging.warning("Could not save preprocessing table %s: %s", path, e)
+
+
+def preprocessed(element, level=4, directory=TABLES_DIRECTORY):
+    """ Copy of element with a fixed-base table at the given level.
+
+    args:
+        element: G1, G2 or GT element to preprocess
+        directory: directory to load the table from and save it to. If None, the
+            table is built and not saved.
+    """
+    key = table_key(element, level)
+    if key in _tables:
+        return _tables[key]
+
+    copy = element.duplicate()
+    path = os.path.join(directory, key) if directory is not None else None
+    if path is None or not _load(copy, path, level):
+        copy.preprocess(level)
+        if path is not None:
+            _save(copy, directory, path)
+
+    _tables[key] = copy
+    return copy
+
+
+def preprocessed_all(elements, level=4, directory=TABLES_DIRECTORY):
+    """ Preprocessed copies of all the given elements, as by preprocessed.
+    """
+    return [preprocessed(element, level, directory) for element in elements]
@@ -19,6 +19,10 @@ logger.setLevel(logging.ERROR)
 logger.setLevel(logging.NOTSET)
 
 
+# Errors raised when verifying malformed shares, e.g. of the wrong type
+_MALFORMED_SHARE_ERRORS = (AssertionError, TypeError, ValueError)
+
+
 class HbAVSSMessageType:
     OK = "OK"
     IMPLICATE = "IMPLICATE"
@@ -34,7 +38,6 @@ class HbAvssLight:
     ):  # (# noqa: E501)
         self.public_keys, self.private_key = public_keys, private_key
         self.n, self.t, self.my_id = n, t, my_id
-        self.g = crs[0]
 
         # Create a mechanism to split the `recv` channels based on `tag`
         self.subscribe_recv_task, self.subscribe_recv = subscribe_recv(recv)
@@ -56,6 +59,9 @@ class HbAvssLight:
             self.poly_commit.preprocess(5)
         else:
             self.poly_commit = pc
+        # The copy of g held by the polynomial commitment has its fixed-base table
+        # if it has been preprocessed.
+        self.g = self.poly_commit.g
 
     def __enter__(self):
         return self
@@ -324,14 +330,38 @@ class HbAvssLight:
 
 
 class HbAvssBatch:
+    # Default number of seconds shares wait for those of other AVSS instances, so
+    # that they are verified together.
+    VERIFY_BATCH_DELAY = 0.05
+
     def __init__(
-        self, public_keys, private_key, crs, n, t, my_id, send, recv, pc=None, field=ZR
-    ):  # (# noqa: E501)
+        self,
+        public_keys,
+        private_key,
+        crs,
+        n,
+        t,
+        my_id,
+        send,
+        recv,
+        pc=None,
+        field=ZR,
+        verify_batch_size=None,
+        verify_batch_delay=None,
+    ):
+        """
+        args:
+            verify_batch_size: number of AVSS instances whose shares are verified
+                together as soon as they are all waiting. Defaults to n, i.e. one
+                instance per dealer
+            verify_batch_delay: maximum number of seconds the shares of an AVSS
+                instance wait for other instances to be verified together.
+                Defaults to VERIFY_BATCH_DELAY
+        """
         self.public_keys, self.private_key = public_keys, private_key
         self.n, self.t, self.my_id = n, t, my_id
         assert len(crs) == 3
         assert len(crs[0]) == t + 1
-        self.g = crs[0][0]
 
         # Create a mechanism to split the `recv` channels based on `tag`
         self.subscribe_recv_task, self.subscribe_recv = subscribe_recv(recv)
@@ -350,11 +380,27 @@ class HbAvssBatch:
             self.poly_commit = PolyCommitConst(crs, field=self.field)
             self.poly_commit.preprocess_prover()
             self.poly_commit.preprocess_verifier()
+        # The copy of g held by the polynomial commitment has its fixed-base table
+        # if the prover has been preprocessed.
+        self.g = self.poly_commit.gs[0]
 
         self.avid_msg_queue = asyncio.Queue()
         self.tasks = []
         self.shares_future = asyncio.Future()
         self.output_queue = asyncio.Queue()
+        # Shares waiting to be verified together, as (evals, future) pairs
+        self.pending_verifications = []
+        self.verify_batch_size = (
+            verify_batch_size if verify_batch_size is not None else n
+        )
+        self.verify_batch_delay = (
+            verify_batch_delay
+            if verify_batch_delay is not None
+            else HbAvssBatch.VERIFY_BATCH_DELAY
+        )
+        # Timer verifying the pending shares once the first of them has waited
+        # verify_batch_delay seconds
+        self._verify_timer = None
 
     async def _recv_loop(self, q):
         while True:
@@ -370,6 +416,8 @@ class HbAvssBatch:
     def __exit__(self, typ, value, traceback):
         self.subscribe_recv_task.cancel()
         self.avid_recv_task.cancel()
+        if self._verify_timer is not None:
+            self._verify_timer.cancel()
         for task in self.tasks:
             task.cancel()
 
@@ -397,6 +445,63 @@ class HbAvssBatch:
             commitments[j_k], j + 1, j_share, j_aux, j_witnesses
         )
 
+    async def _verify_shares(self, commitments, shares, auxes, witnesses):
+        """
+        Verify this node's shares of the secrets of one AVSS instance.
+        Return the index of the first invalid share, or None if all are valid.
+
+        Shares of the AVSS instances waiting for verification, e.g. from different
+        dealers, are checked together by one batch verification. This happens once
+        verify_batch_size instances are waiting, or once the first of them has
+        waited verify_batch_delay seconds.
+        """
+        evals = [
+            (commitments[k], self.my_id + 1, shares[k], auxes[k], witnesses[k])
+            for k in range(len(commitments))
+        ]
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        self.pending_verifications.append((evals, future))
+        if len(self.pending_verifications) >= self.verify_batch_size:
+            self._verify_pending_shares()
+        elif self._verify_timer is None:
+            self._verify_timer = loop.call_later(
+                self.verify_batch_delay, self._verify_pending_shares
+            )
+        return await future
+
+    def _verify_pending_shares(self):
+        if self._verify_timer is not None:
+            self._verify_timer.cancel()
+            self._verify_timer = None
+
+        pending, self.pending_verifications = self.pending_verifications, []
+        try:
+            valid = self.poly_commit.batch_verify_evals(
+                [item for evals, _ in pending for item in evals]
+            )
+        except _MALFORMED_SHARE_ERRORS:
+            # Malformed shares of one instance must not fail the others
+            valid = None
+
+        start = 0
+        for evals, future in pending:
+            end = start + len(evals)
+            try:
+                if valid is None:
+                    evals_valid = self.poly_commit.batch_verify_evals(evals)
+                else:
+                    evals_valid = valid[start:end]
+            except _MALFORMED_SHARE_ERRORS as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(
+                        next((k for k, v in enumerate(evals_valid) if not v), None)
+                    )
+            start = end
+
     async def _process_avss_msg(self, avss_id, dealer_id, rbc_msg, avid):
         tag = f"{dealer_id}-{avss_id}-B-AVSS"
         send, recv = self.get_send(tag), self.subscribe_recv(tag)
@@ -431,21 +536,14 @@ class HbAvssBatch:
 
         # call if decryption was successful
         if all_shares_valid:
-            if not self.poly_commit.batch_verify_eval(
-                commitments, self.my_id + 1, shares, auxes, witnesses
-            ):
+            invalid_share = await self._verify_shares(
+                commitments, shares, auxes, witnesses
+            )
+            if invalid_share is not None:
                 all_shares_valid = False
-                # Find which share was invalid and implicate
-                for k in range(secret_count):
-                    if not self.poly_commit.verify_eval(
-                        commitments[k],
-                        self.my_id + 1,
-                        shares[k],
-                        auxes[k],
-                        witnesses[k],
-                    ):  # (# noqa: E501)
-                        multicast((HbAVSSMessageType.IMPLICATE, self.private_key, k))
-                        break
+                multicast(
+                    (HbAVSSMessageType.IMPLICATE, self.private_key, invalid_share)
+                )
         if all_shares_valid:
             logger.info(f"OK_timestamp: {time.time()}")
             multicast((HbAVSSMessageType.OK, ""))
@@ -584,12 +682,16 @@ class HbAvssBatch:
         # for each party Pi and each k ∈ [t+1]
         #   1. w[i][k] <- CreateWitnesss(Ck,auxk,i)
         #   2. z[i][k] <- EncPKi(φ(i,k), w[i][k])
+        witnesses = [
+            self.poly_commit.batch_create_witness(phi[k], aux_poly[k], n)
+            for k in range(secret_count)
+        ]
         dispersal_msg_list = [None] * n
         for i in range(n):
             shared_key = pow(self.public_keys[i], ephemeral_secret_key)
             z = [None] * secret_count
             for k in range(secret_count):
-                witness = self.poly_commit.create_witness(phi[k], aux_poly[k], i + 1)
+                witness = witnesses[k][i]
                 z[k] = (int(phi[k](i + 1)), int(aux_poly[k](i + 1)), witness)
             zz = SymmetricCrypto.encrypt(str(shared_key).encode(), z)
             dispersal_msg_list[i] = zz
@@ -6,14 +6,18 @@
 from .ntlwrapper cimport ZZ, ZZ_p, mat_ZZ_p, vec_ZZ_p, ZZ_pX_c
 from .ntlwrapper cimport mat_ZZ_p_mul, ZZ_p_init, SqrRootMod
 from .ntlwrapper cimport ZZFromBytes, bytesFromZZ, to_ZZ_p, to_ZZ, ZZNumBytes
+from .ntlwrapper cimport vec_ZZ_p_from_bytes, bytes_from_vec_ZZ_p
+from .ntlwrapper cimport mat_ZZ_p_from_bytes, bytes_from_mat_ZZ_p
 from .ntlwrapper cimport SetNTLNumThreads_c, AvailableThreads
 from .ntlwrapper cimport ZZ_pX_get_coeff, ZZ_pX_set_coeff, ZZ_pX_eval
 from .rsdecode cimport interpolate_c, vandermonde_inverse_c, set_vm_matrix_c, fft_c, fft_partial_c, fnt_decode_step1_c, fnt_decode_step2_c, gao_interpolate_c, gao_interpolate_fft_c
+from .rsdecode cimport welch_berlekamp_c
 from .ccobject cimport ccrepr, ccreadstr
 from cpython.int cimport PyInt_AS_LONG
 from cython.parallel import parallel, prange
 from libc.stdlib cimport free
 from libcpp.vector cimport vector
+from libcpp cimport bool
 cimport openmp
 
 
@@ -56,17 +60,113 @@ cdef ZZ_p py_obj_to_ZZ_p(object v):
 
     return result
 
-cdef vec_ZZ_p py_list_to_vec_ZZ_p(object v):
-    cdef vec_ZZ_p result
-    if not isinstance(v, list) and not isinstance(v, tuple):
+cdef long element_width(modulus):
+    """Number of bytes used for each element when packing values mod `modulus`"""
+    return (modulus.bit_length() + 7) // 8
+
+def ints_to_bytes(values, modulus):
+    """Pack integers into a single buffer of fixed width little-endian elements
+    :param values: integers to pack. Each one is reduced modulo `modulus`
+    :type values: list of integers
+    :param modulus: Field modulus
+    :type modulus: integer
+    :return: bytes of length len(values) * element width
+    """
+    cdef long width = element_width(modulus)
+    return b"".join([(v % modulus).to_bytes(width, "little") for v in values])
+
+def bytes_to_ints(buf, modulus):
+    """Inverse of `ints_to_bytes`
+    :param buf: packed elements
+    :type buf: any object supporting the buffer protocol
+    :param modulus: Field modulus
+    :type modulus: integer
+    :return: list of integers
+    """
+    cdef long width = element_width(modulus)
+    view = memoryview(buf).cast("B")
+    from_bytes = int.from_bytes
+    return [from_bytes(view[i:i + width], "little")
+            for i in range(0, len(view), width)]
+
+cdef long num_elements(object v, long width):
+    if isinstance(v, (list, tuple)):
+        return len(v)
+    return memoryview(v).nbytes // width
+
+cdef const unsigned char[:] as_packed_buffer(object v, modulus, long width):
+    """Lists and tuples of integers get packed, anything else must already be
+    a buffer of packed elements as produced by `ints_to_bytes`
+    """
+    if isinstance(v, (list, tuple)):
+        return ints_to_bytes(v, modulus)
+    elif v is None:
         raise ValueError("Invalid arguments")
 
-    result.SetLength(len(v))
-    cdef int i
-    for i in range(len(v)):
-        result[i] = intToZZp(v[i])
+    view = memoryview(v).cast("B")
+    if len(view) % width != 0:
+        raise ValueError(f"Buffer length must be a multiple of {width}")
+    return view
+
+cdef vec_ZZ_p py_list_to_vec_ZZ_p(object v, modulus):
+    cdef vec_ZZ_p result
+    cdef long width = element_width(modulus)
+    cdef const unsigned char[:] buf = as_packed_buffer(v, modulus, width)
+    cdef long count = buf.shape[0] // width
+
+    if count > 0:
+        with nogil:
+            vec_ZZ_p_from_bytes(result, &buf[0], count, width)
     return result
 
+cdef list vec_ZZ_p_to_py_list(vec_ZZ_p& v, modulus):
+    cdef long width = element_width(modulus)
+    cdef bytearray packed = bytearray(v.length() * width)
+    cdef unsigned char[:] buf = packed
+
+    if v.length() > 0:
+        with nogil:
+            bytes_from_vec_ZZ_p(&buf[0], v, width)
+    return bytes_to_ints(packed, modulus)
+
+cdef void py_lists_to_mat_ZZ_p(mat_ZZ_p& m, object columns, long rows, modulus) except *:
+    """Set m to a (rows x len(columns)) matrix whose i'th column holds
+    columns[i], padded with zeros.
+    """
+    cdef long width = element_width(modulus)
+    cdef long cols = len(columns)
+    cdef long i, start, size
+    cdef bytearray packed = bytearray(rows * cols * width)
+    cdef unsigned char[:] buf = packed
+    cdef const unsigned char[:] column
+
+    for i in range(cols):
+        column = as_packed_buffer(columns[i], modulus, width)
+        size = column.shape[0]
+        if size > rows * width:
+            raise ValueError("Column does not fit in the matrix")
+        start = i * rows * width
+        buf[start:start + size] = column
+
+    if rows * cols > 0:
+        with nogil:
+            mat_ZZ_p_from_bytes(m, &buf[0], rows, cols, width, True)
+    else:
+        m.SetDims(rows, cols)
+
+cdef list mat_ZZ_p_to_py_lists(mat_ZZ_p& m, modulus):
+    """Returns the columns of m as lists of integers"""
+    cdef long width = element_width(modulus)
+    cdef long rows = m.NumRows(), cols = m.NumCols()
+    cdef bytearray packed = bytearray(rows * cols * width)
+    cdef unsigned char[:] buf = packed
+
+    if rows * cols > 0:
+        with nogil:
+            bytes_from_mat_ZZ_p(&buf[0], m, width, True)
+    values = bytes_to_ints(packed, modulus)
+    return [values[i * rows:(i + 1) * rows] for i in range(cols)]
+
 cdef str ZZ_to_str(ZZ x):
     return ccrepr(x)
 
@@ -91,7 +191,8 @@ cpdef lagrange_interpolate(x, y, modulus):
         y_vec.push_back(py_obj_to_ZZ(y[i]))
 
     cdef ZZ zz_modulus = py_obj_to_ZZ(modulus)
-    interpolate_c(r_vec, x_vec, y_vec, zz_modulus)
+    with nogil:
+        interpolate_c(r_vec, x_vec, y_vec, zz_modulus)
 
     result = []
     for i in range(r_vec.size()):
@@ -152,7 +253,7 @@ cpdef vandermonde_batch_interpolate(x, data_list, modulus):
     :type x: list of integers
     :param data_list: evaluations of polynomials
                       data_list[i][j] = evaluation of polynomial i at point x[j]
-    :type data_list: list of lists
+    :type data_list: list of lists, or list of buffers packed by `ints_to_bytes`
     :param modulus: field modulus
     :type modulus: integer
     :return:
@@ -164,33 +265,22 @@ cpdef vandermonde_batch_interpolate(x, data_list, modulus):
 
     cdef ZZ zz_modulus = py_obj_to_ZZ(modulus)
     cdef mat_ZZ_p r
-    d = vandermonde_inverse_c(r, x_vec, zz_modulus)
-    if d is False:
+    cdef bool success
+    with nogil:
+        success = vandermonde_inverse_c(r, x_vec, zz_modulus)
+    if not success:
         raise InterpolationError("Interpolation failed")
 
     cdef mat_ZZ_p m
-    cdef int k = max([len(d) for d in data_list])
-    cdef int n_chunks = len(data_list)
-    m.SetDims(k, n_chunks)
+    cdef long width = element_width(modulus)
+    cdef int k = max([num_elements(data, width) for data in data_list])
+    py_lists_to_mat_ZZ_p(m, data_list, k, modulus)
 
-    for i in range(n_chunks):
-        l = len(data_list[i])
-        for j in range(l):
-            m[j][i] = intToZZp(data_list[i][j])
-        for j in range(l, k):
-            m[j][i] = intToZZp(0)
     cdef mat_ZZ_p reconstructions
-    mat_ZZ_p_mul(reconstructions, r, m)
-
-    polynomials = [[None] * k for _ in range(n_chunks)]
+    with nogil:
+        mat_ZZ_p_mul(reconstructions, r, m)
 
-    for i in range(n_chunks):
-        for j in range(k):
-            polynomials[i][j] = 0
-
-    for i in range(n_chunks):
-        for j in range(k):
-            polynomials[i][j] = ZZpToInt(reconstructions[j][i])
+    polynomials = mat_ZZ_p_to_py_lists(reconstructions, modulus)
     reconstructions.kill()
     m.kill()
     r.kill()
@@ -203,88 +293,62 @@ cpdef vandermonde_batch_evaluate(x, polynomials, modulus):
     :type x: list of integers
     :param polynomials: polynomial coefficients. polynomials[i] = coefficients of the
         i'th polynomial
-    :type x: list of list of integers
+    :type x: list of list of integers, or list of buffers packed by `ints_to_bytes`
     :param modulus: field modulus
     :type modulus: integer
     :return:
     """
     cdef mat_ZZ_p vm_matrix, poly_matrix, res_matrix
     cdef int n = len(x)
-    cdef int i, j
-    # Number of chunks
-    cdef int k = len(polynomials)
+    cdef long width = element_width(modulus)
     # Degree of polynomial. Actually number of coefficients.
-    cdef int d = max([len(poly) for poly in polynomials])
+    cdef int d = max([num_elements(poly, width) for poly in polynomials])
 
     cdef ZZ zz_modulus = py_obj_to_ZZ(modulus)
     ZZ_p_init(zz_modulus)
 
     # Set vm_matrix
-    cdef vec_ZZ_p x_vec = py_list_to_vec_ZZ_p(x)
-    set_vm_matrix_c(vm_matrix, x_vec, d)
+    cdef vec_ZZ_p x_vec = py_list_to_vec_ZZ_p(x, modulus)
+    with nogil:
+        set_vm_matrix_c(vm_matrix, x_vec, d)
 
     # Set matrix with polynomial coefficients
-    poly_matrix.SetDims(d, k)
-    for i in range(k):
-        l = len(polynomials[i])
-        for j in range(l):
-            poly_matrix[j][i] = intToZZp(polynomials[i][j])
-        for j in range(l, d):
-            poly_matrix[j][i] = intToZZp(0)
+    py_lists_to_mat_ZZ_p(poly_matrix, polynomials, d, modulus)
 
     # Finally multiply matrices. This gives evaluation of polynomials at
     # all points chosen
-    mat_ZZ_p_mul(res_matrix, vm_matrix, poly_matrix)
+    with nogil:
+        mat_ZZ_p_mul(res_matrix, vm_matrix, poly_matrix)
 
     # Convert back to python friendly formats
-    result = [[None] * n for _ in range(k)]
-    for i in range(n):
-        for j in range(k):
-            result[j][i] = ZZpToInt(res_matrix[i][j])
-    return result
+    return mat_ZZ_p_to_py_lists(res_matrix, modulus)
 
 cpdef fft(coeffs, omega, modulus, int n):
-    cdef int i, d;
     cdef vec_ZZ_p coeffs_vec, result_vec;
 
     ZZ_p_init(intToZZ(modulus))
-
-    d = len(coeffs)
-    coeffs_vec.SetLength(d)
-    for i in range(d):
-        coeffs_vec[i] = intToZZp(coeffs[i])
+    coeffs_vec = py_list_to_vec_ZZ_p(coeffs, modulus)
 
     cdef ZZ_p zz_omega = intToZZp(omega)
-    fft_c(result_vec, coeffs_vec, zz_omega, n)
-
-    result = [None] * n
-    for i in range(n):
-        result[i] = ZZpToInt(result_vec[i])
+    with nogil:
+        fft_c(result_vec, coeffs_vec, zz_omega, n)
 
-    return result
+    return vec_ZZ_p_to_py_list(result_vec, modulus)
 
 cpdef partial_fft(coeffs, omega, modulus, int n, int k):
-    cdef int i, d;
     cdef vec_ZZ_p coeffs_vec, result_vec;
 
     ZZ_p_init(intToZZ(modulus))
-
-    d = len(coeffs)
-    coeffs_vec.SetLength(d)
-    for i in range(d):
-        coeffs_vec[i] = intToZZp(coeffs[i])
+    coeffs_vec = py_list_to_vec_ZZ_p(coeffs, modulus)
 
     cdef ZZ_p zz_omega = intToZZp(omega)
-    fft_partial_c(result_vec, coeffs_vec, zz_omega, n, k)
-
-    result = [None] * k
-    for i in range(k):
-        result[i] = ZZpToInt(result_vec[i])
+    with nogil:
+        fft_partial_c(result_vec, coeffs_vec, zz_omega, n, k)
 
-    return result
+    return vec_ZZ_p_to_py_list(result_vec, modulus)
 
 cpdef fft_batch_evaluate(coeffs, omega, modulus, int n, int k):
-    cdef int i, d;
+    cdef int i
     cdef vector[vec_ZZ_p] coeffs_vec_list, result_vec_list
     cdef ZZ zz_modulus
 
@@ -292,15 +356,12 @@ cpdef fft_batch_evaluate(coeffs, omega, modulus, int n, int k):
     ZZ_p_init(zz_modulus)
 
     batch_size = len(coeffs)
-    d = len(coeffs[0])
 
     coeffs_vec_list.resize(batch_size)
     result_vec_list.resize(batch_size)
 
     for i in range(batch_size):
-        coeffs_vec_list[i].SetLength(d)
-        for j in range(d):
-            coeffs_vec_list[i][j] = intToZZp(coeffs[i][j])
+        coeffs_vec_list[i] = py_list_to_vec_ZZ_p(coeffs[i], modulus)
 
     cdef ZZ_p zz_omega = intToZZp(omega)
     with nogil, parallel():
@@ -308,12 +369,7 @@ cpdef fft_batch_evaluate(coeffs, omega, modulus, int n, int k):
         for i in prange(batch_size):
             fft_partial_c(result_vec_list[i], coeffs_vec_list[i], zz_omega, n, k)
 
-    result = [[None] * k for _ in range(batch_size)]
-    for i in range(batch_size):
-        for j in range(k):
-            result[i][j] = ZZpToInt(result_vec_list[i][j])
-
-    return result
+    return [vec_ZZ_p_to_py_list(result_vec_list[i], modulus) for i in range(batch_size)]
 
 def fft_interpolate(zs, ys, omega, modulus, int n):
     cdef int i
@@ -326,18 +382,15 @@ def fft_interpolate(zs, ys, omega, modulus, int n):
     ZZ_p_init(intToZZ(modulus))
     zz_omega = intToZZp(omega)
     z_vec.resize(k)
-    y_vec.SetLength(k)
     for i in range(k):
         z_vec[i] = PyInt_AS_LONG(zs[i])
-        y_vec[i] = intToZZp(ys[i])
+    y_vec = py_list_to_vec_ZZ_p(ys, modulus)
 
-    fnt_decode_step1_c(A, Ad_evals_vec, z_vec, zz_omega, n)
-    fnt_decode_step2_c(P_coeffs, A, Ad_evals_vec, z_vec, y_vec, zz_omega, n)
+    with nogil:
+        fnt_decode_step1_c(A, Ad_evals_vec, z_vec, zz_omega, n)
+        fnt_decode_step2_c(P_coeffs, A, Ad_evals_vec, z_vec, y_vec, zz_omega, n)
 
-    result = [None] * k
-    for i in range(k):
-        result[i] = int(ccrepr(P_coeffs[i]))
-    return result
+    return vec_ZZ_p_to_py_list(P_coeffs, modulus)
 
 def fft_batch_interpolate(zs, ys_list, omega, modulus, int n):
     cdef int i, j
@@ -355,16 +408,15 @@ def fft_batch_interpolate(zs, ys_list, omega, modulus, int n):
     for i in range(k):
         z_vec[i] = PyInt_AS_LONG(zs[i])
 
-    fnt_decode_step1_c(A, Ad_evals_vec, z_vec, zz_omega, n)
+    with nogil:
+        fnt_decode_step1_c(A, Ad_evals_vec, z_vec, zz_omega, n)
 
     cdef vector[vec_ZZ_p] y_vec_list, result_vec_list;
     y_vec_list.resize(n_chunks)
     result_vec_list.resize(n_chunks)
 
     for i in range(n_chunks):
-        y_vec_list[i].SetLength(k)
-        for j in range(k):
-            y_vec_list[i][j] = intToZZp(ys_list[i][j])
+        y_vec_list[i] = py_list_to_vec_ZZ_p(ys_list[i], modulus)
 
     with nogil, parallel():
 
@@ -373,12 +425,8 @@ def fft_batch_interpolate(zs, ys_list, omega, modulus, int n):
             fnt_decode_step2_c(result_vec_list[i], A, Ad_evals_vec, z_vec, y_vec_list[i],
                                zz_omega, n)
 
-    result = [[None] * k for _ in range(n_chunks)]
-    for i in range(n_chunks):
-        for j in range(k):
-            result[i][j] = ZZpToInt(result_vec_list[i][j])
-
-    return result
+    return [vec_ZZ_p_to_py_list(result_vec_list[i], modulus)
+            for i in range(n_chunks)]
 
 cpdef SetNTLNumThreads(int x):
     SetNTLNumThreads_c(x)
@@ -403,12 +451,8 @@ cpdef gao_interpolate(x, y, int k, modulus, z=None, omega=None, order=None,
         z = [z[i] for i in range(len(z)) if not is_null[i]]
 
     n = len(x)
-    x_vec.SetLength(n)
-    y_vec.SetLength(n)
-
-    for i in range(n):
-        x_vec[i] = intToZZp(x[i])
-        y_vec[i] = intToZZp(y[i])
+    x_vec = py_list_to_vec_ZZ_p(x, modulus)
+    y_vec = py_list_to_vec_ZZ_p(y, modulus)
 
     if use_omega_powers is True:
         assert z is not None
@@ -421,23 +465,81 @@ cpdef gao_interpolate(x, y, int k, modulus, z=None, omega=None, order=None,
         for i in range(n):
             z_vec[i] = int(z[i])
 
-        success = gao_interpolate_fft_c(res_vec, err_vec, x_vec, z_vec, y_vec,
-                                        zz_omega, k, n, order)
+        with nogil:
+            success = gao_interpolate_fft_c(res_vec, err_vec, x_vec, z_vec, y_vec,
+                                            zz_omega, k, n, int_order)
     else:
-        success = gao_interpolate_c(res_vec, err_vec, x_vec, y_vec, k, n)
+        with nogil:
+            success = gao_interpolate_c(res_vec, err_vec, x_vec, y_vec, k, n)
 
     if success:
-        result = [None] * res_vec.length()
-        error_poly = [None] * err_vec.length()
-
-        for i in range(res_vec.length()):
-            result[i] = int(ccrepr(res_vec[i]))
-        for i in range(err_vec.length()):
-            error_poly[i] = int(ccrepr(err_vec[i]))
+        result = vec_ZZ_p_to_py_list(res_vec, modulus)
+        error_poly = vec_ZZ_p_to_py_list(err_vec, modulus)
         return result, error_poly
 
     return None, None
 
+cpdef wb_batch_interpolate(x, ys_list, int k, modulus):
+    """Decode a batch of received words with the Welch-Berlekamp algorithm.
+    All words must share the same evaluation points, i.e. the same erasure
+    pattern, which lets them share the powers of x used to set up the linear
+    systems. Each system is solved with NTL's gaussian elimination.
+
+    :param x: evaluation points of the received (non-erased) symbols
+    :type x: list of integers
+    :param ys_list: received words. ys_list[i][j] = symbol j of word i
+    :type ys_list: list of lists, or list of buffers packed by `ints_to_bytes`
+    :param k: number of coefficients of the polynomials (degree + 1)
+    :param modulus: field modulus
+    :type modulus: integer
+    :return: list with the k decoded coefficients of each word, or None for
+        words which could not be decoded
+    """
+    cdef int i
+    cdef int m = len(x)
+    cdef int max_e = (m - k) // 2
+    cdef int n_chunks = len(ys_list)
+    cdef ZZ zz_modulus = intToZZ(modulus)
+    cdef vec_ZZ_p x_vec
+    cdef mat_ZZ_p x_powers
+    cdef vector[vec_ZZ_p] y_vec_list, result_vec_list
+    cdef vector[int] success
+
+    if m < k:
+        return [None] * n_chunks
+
+    ZZ_p_init(zz_modulus)
+    x_vec = py_list_to_vec_ZZ_p(x, modulus)
+    with nogil:
+        set_vm_matrix_c(x_powers, x_vec, max_e + k)
+
+    y_vec_list.resize(n_chunks)
+    result_vec_list.resize(n_chunks)
+    success.resize(n_chunks)
+    for i in range(n_chunks):
+        y_vec_list[i] = py_list_to_vec_ZZ_p(ys_list[i], modulus)
+        if y_vec_list[i].length() != m:
+            raise ValueError("Each received word must have one symbol per point")
+
+    with nogil, parallel():
+        ZZ_p_init(zz_modulus)
+        for i in prange(n_chunks):
+            success[i] = welch_berlekamp_c(result_vec_list[i], x_powers,
+                                           y_vec_list[i], k, max_e)
+
+    return [vec_ZZ_p_to_py_list(result_vec_list[i], modulus) if success[i] else None
+            for i in range(n_chunks)]
+
+cpdef wb_interpolate(x, y, int k, modulus):
+    """Decode a single received word with the Welch-Berlekamp algorithm.
+    Erasures can be marked by setting the corresponding y value to None.
+    :return: the k decoded coefficients, or None if decoding failed
+    """
+    assert len(x) == len(y)
+    x = [x[i] for i in range(len(x)) if y[i] is not None]
+    y = [yi for yi in y if yi is not None]
+    return wb_batch_interpolate(x, [y], k, modulus)[0]
+
 def sqrt_mod(a, n):
     cdef ZZ x
     SqrRootMod(x, intToZZ(a), intToZZ(n))
@@ -1,4 +1,5 @@
 from libcpp.vector cimport vector
+from libcpp cimport bool
 
 cdef extern from "ntlwrapper_impl.h":
     cdef cppclass ZZ "ZZ":
@@ -23,13 +24,15 @@ cdef extern from "ntlwrapper_impl.h":
         size_t length()
     cdef cppclass mat_ZZ_p:
         void SetDims(int m, int n)
+        long NumRows()
+        long NumCols()
         vec_ZZ_p& operator[](size_t)
         void kill()
 
 
     void ZZ_p_init "ZZ_p::init"(ZZ x) nogil
     void SetNTLNumThreads_c "SetNumThreads"(int n)
-    void mat_ZZ_p_mul "mul"(mat_ZZ_p x, mat_ZZ_p a, mat_ZZ_p b)
+    void mat_ZZ_p_mul "mul"(mat_ZZ_p x, mat_ZZ_p a, mat_ZZ_p b) nogil
     void mat_ZZ_p_mul_vec "mul"(vec_ZZ_p x, mat_ZZ_p a, vec_ZZ_p b) nogil
     void ZZ_pX_get_coeff "GetCoeff"(ZZ_p r, ZZ_pX_c x, int i)
     void ZZ_pX_set_coeff "SetCoeff"(ZZ_pX_c x, int i, ZZ_p a)
@@ -40,4 +43,11 @@ cdef extern from "ntlwrapper_impl.h":
     unsigned char* bytesFromZZ(ZZ x)
     ZZ_p to_ZZ_p(ZZ)
     ZZ to_ZZ "rep"(ZZ_p)
-    int ZZNumBytes "NumBytes"(ZZ)
\ No newline at end of file
+    int ZZNumBytes "NumBytes"(ZZ)
+    void vec_ZZ_p_from_bytes(vec_ZZ_p r, const unsigned char* buf, long count,
+                             long width) nogil
+    void bytes_from_vec_ZZ_p(unsigned char* buf, vec_ZZ_p v, long width) nogil
+    void mat_ZZ_p_from_bytes(mat_ZZ_p r, const unsigned char* buf, long rows,
+                             long cols, long width, bool transposed) nogil
+    void bytes_from_mat_ZZ_p(unsigned char* buf, mat_ZZ_p m, long width,
+                             bool transposed) nogil
@@ -13,4 +13,47 @@ unsigned char* bytesFromZZ(const ZZ& a) {
    BytesFromZZ(p, a, n);
    return p;
 }
+
+// Bulk conversions between NTL types and packed buffers of `width`-byte
+// little-endian integers. These avoid a Python round trip per element.
+void vec_ZZ_p_from_bytes(vec_ZZ_p& r, const unsigned char* buf, long count,
+                         long width) {
+   ZZ tmp;
+   r.SetLength(count);
+   for (long i = 0; i < count; i++) {
+      ZZFromBytes(tmp, buf + i * width, width);
+      conv(r[i], tmp);
+   }
+}
+
+void bytes_from_vec_ZZ_p(unsigned char* buf, const vec_ZZ_p& v, long width) {
+   for (long i = 0; i < v.length(); i++) {
+      BytesFromZZ(buf + i * width, rep(v[i]), width);
+   }
+}
+
+// If `transposed` is set, buf holds the matrix column by column.
+void mat_ZZ_p_from_bytes(mat_ZZ_p& r, const unsigned char* buf, long rows,
+                         long cols, long width, bool transposed) {
+   ZZ tmp;
+   r.SetDims(rows, cols);
+   for (long i = 0; i < rows; i++) {
+      for (long j = 0; j < cols; j++) {
+         long offset = transposed ? j * rows + i : i * cols + j;
+         ZZFromBytes(tmp, buf + offset * width, width);
+         conv(r[i][j], tmp);
+      }
+   }
+}
+
+void bytes_from_mat_ZZ_p(unsigned char* buf, const mat_ZZ_p& m, long width,
+                         bool transposed) {
+   long rows = m.NumRows(), cols = m.NumCols();
+   for (long i = 0; i < rows; i++) {
+      for (long j = 0; j < cols; j++) {
+         long offset = transposed ? j * rows + i : i * cols + j;
+         BytesFromZZ(buf + offset * width, rep(m[i][j]), width);
+      }
+   }
+}
 #endif
\ No newline at end of file
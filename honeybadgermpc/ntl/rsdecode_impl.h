@@ -2,6 +2,7 @@
 #include <NTL/ZZ_p.h>
 #include <NTL/ZZ_pX.h>
 #include <NTL/vec_ZZ_p.h>
+#include <NTL/mat_ZZ_p.h>
 #include <vector>
 #include <iostream>
 #include <map>
@@ -15,8 +16,10 @@ using namespace std;
 // Determined experimentally based on minimising time taken by fft
 #define FFT_VAN_THRESHOLD 16
 
-map <pair<int, ZZ>, mat_ZZ_p> _fft_van_matrices;
-ZZ _fft_van_modulus;
+// Vandermonde matrices of FFT evaluation points, by (modulus, (n, omega)).
+// Entries are never removed, so references to them stay valid while other
+// threads add matrices for other moduli.
+map <pair<ZZ, pair<int, ZZ>>, mat_ZZ_p> _fft_van_matrices;
 mutex _interp_mutex;
 
 
@@ -35,7 +38,7 @@ void set_vm_matrix(mat_ZZ_p &result, vec_ZZ_p &x_list, int d)
     }
 }
 
-void _set_fft_vandermonde_matrix(ZZ_p omega, int n)
+mat_ZZ_p& _set_fft_vandermonde_matrix(ZZ_p omega, int n)
 {
     vec_ZZ_p x;
     x.SetLength(n);
@@ -46,22 +49,19 @@ void _set_fft_vandermonde_matrix(ZZ_p omega, int n)
     mat_ZZ_p interpolator;
     set_vm_matrix(interpolator, x, n);
 
-    _fft_van_matrices.emplace(make_pair(make_pair(n, rep(omega)), interpolator));
+    auto key = make_pair(ZZ_p::modulus(), make_pair(n, rep(omega)));
+    return _fft_van_matrices.emplace(key, interpolator).first->second;
 }
 
 mat_ZZ_p& get_fft_vandermonde_matrix(ZZ_p omega, int n)
 {
     lock_guard<mutex> lock(_interp_mutex);
-    if (ZZ_p::modulus() != _fft_van_modulus) {
-        _fft_van_modulus = ZZ_p::modulus();
-        _fft_van_matrices.clear();
+    auto it = _fft_van_matrices.find(make_pair(ZZ_p::modulus(), make_pair(n, rep(omega))));
+    if (it == _fft_van_matrices.end()) {
+        return _set_fft_vandermonde_matrix(omega, n);
     }
 
-    if (_fft_van_matrices.find(make_pair(n, rep(omega))) == _fft_van_matrices.end()) {
-        _set_fft_vandermonde_matrix(omega, n);
-    }
-
-    return (_fft_van_matrices.find(make_pair(n, rep(omega))))->second;
+    return it->second;
 }
 
 void interpolate(vector<ZZ> &result, vector<ZZ> &x, vector<ZZ> &y, ZZ &modulus)
@@ -402,4 +402,98 @@ bool gao_interpolate_fft(vec_ZZ_p &res_vec, vec_ZZ_p &err_vec,
     }
 
     return true;
-}
\ No newline at end of file
+}
+
+// Solve the Welch-Berlekamp system for exactly e errors.
+// Unknowns are the e lower coefficients of the monic error locator E(x) followed
+// by the e + k coefficients of Q(x), and row i encodes y_i * E(x_i) = Q(x_i).
+// Free variables are set to zero since any solution yields Q = P * E.
+bool welch_berlekamp_solve(ZZ_pX &E, ZZ_pX &Q, mat_ZZ_p &x_powers,
+                           vec_ZZ_p &y_vec, int k, int e)
+{
+    int m = y_vec.length();
+    int num_vars = 2 * e + k;
+    if (m < num_vars) {
+        return false;
+    }
+
+    mat_ZZ_p system;
+    system.SetDims(m, num_vars + 1);
+    for (int i=0; i < m; i++) {
+        for (int j=0; j < e; j++) {
+            mul(system[i][j], y_vec[i], x_powers[i][j]);
+        }
+        for (int j=0; j < e + k; j++) {
+            negate(system[i][e + j], x_powers[i][j]);
+        }
+        // The monic x^e term of E moves to the right hand side
+        mul(system[i][num_vars], y_vec[i], x_powers[i][e]);
+        negate(system[i][num_vars], system[i][num_vars]);
+    }
+
+    long rank = gauss(system);
+
+    // Back substitution over the row echelon form
+    vec_ZZ_p solution;
+    solution.SetLength(num_vars);
+    for (long i=rank - 1; i >= 0; i--) {
+        int pivot = 0;
+        while (IsZero(system[i][pivot])) {
+            pivot++;
+        }
+
+        // A pivot in the constant column means the system is inconsistent
+        if (pivot == num_vars) {
+            return false;
+        }
+
+        ZZ_p acc = system[i][num_vars];
+        for (int j=pivot + 1; j < num_vars; j++) {
+            acc -= system[i][j] * solution[j];
+        }
+        div(solution[pivot], acc, system[i][pivot]);
+    }
+
+    E = 0;
+    for (int j=0; j < e; j++) {
+        SetCoeff(E, j, solution[j]);
+    }
+    SetCoeff(E, e, 1);
+
+    Q = 0;
+    for (int j=0; j < e + k; j++) {
+        SetCoeff(Q, j, solution[e + j]);
+    }
+    return true;
+}
+
+// Decode a single received word with Welch-Berlekamp, trying up to max_e errors.
+// x_powers[i][j] = x_i ^ j for j < max_e + k, where x_i is the evaluation point of
+// y_vec[i]. It only depends on the erasure pattern so it can be shared by a batch.
+bool welch_berlekamp(vec_ZZ_p &res_vec, mat_ZZ_p &x_powers, vec_ZZ_p &y_vec,
+                     int k, int max_e)
+{
+    ZZ_pX E, Q, P, r;
+    for (int e=max_e; e >= 0; e--) {
+        // Skip plain interpolation unless it is all we can do, as in the python
+        // implementation in reed_solomon_wb
+        if (e == 0 && max_e > 0) {
+            break;
+        }
+
+        if (!welch_berlekamp_solve(E, Q, x_powers, y_vec, k, e)) {
+            continue;
+        }
+
+        DivRem(P, r, Q, E);
+        if (IsZero(r) && deg(P) < k) {
+            res_vec.SetLength(k);
+            for (int i=0; i < k; i++) {
+                res_vec[i] = coeff(P, i);
+            }
+            return true;
+        }
+    }
+
+    return false;
+}
@@ -1,14 +1,24 @@
 import time
 import asyncio
 import logging
+import operator
+from abc import ABC, abstractmethod
+from collections import deque
+from itertools import repeat
 from honeybadgermpc.config import HbmpcConfig
 from honeybadgermpc.exceptions import HoneyBadgerMPCError
 from honeybadgermpc.field import GF
 from honeybadgermpc.elliptic_curve import Subgroup
-from honeybadgermpc.polynomial import EvalPoint, polynomials_over
+from honeybadgermpc.polynomial import EvalPoint
 from honeybadgermpc.reed_solomon import EncoderFactory, DecoderFactory
 from honeybadgermpc.mpc import Mpc
 from honeybadgermpc.ipc import ProcessProgramRunner
+from honeybadgermpc.preprocessing import (
+    PreProcessedElements,
+    PreProcessingConstants,
+    random_ints,
+)
+from honeybadgermpc.preprocessing_metrics import RateMeter
 from honeybadgermpc.utils.misc import (
     wrap_send,
     transpose_lists,
@@ -17,11 +27,38 @@ from honeybadgermpc.utils.misc import (
 )
 
 
+# Number of values each party shares per chunk in randousha_stream.
+RANDOUSHA_CHUNK_SIZE = 1024
+
+# Number of random linear combinations of the received sharings each checking party
+# decodes in randousha. A combination of sharings which aren't all valid is itself
+# invalid except with probability 1/p, so one is enough for large fields.
+RANDOUSHA_CHECKS = 1
+
+
 class HyperInvMessageType(object):
     SUCCESS = "S"
     ABORT = "A"
 
 
+def _combine_shares(shares, coeffs, modulus):
+    """ Given shares[j][i], the share of party j of the i'th sharing, return the
+    shares of the linear combination of the sharings with the given coefficients.
+    """
+    return [sum(map(operator.mul, coeffs, s)) % modulus for s in shares]
+
+
+def _random_coeffs(secrets, degree, modulus):
+    """ Coefficients of random polynomials of the given degree, one per secret,
+    with the secret as the constant term.
+    """
+    randoms = random_ints(modulus, len(secrets) * degree)
+    return [
+        [secret] + randoms[i * degree : (i + 1) * degree]
+        for i, secret in enumerate(secrets)
+    ]
+
+
 async def _recv_loop(n, recv, s=0):
     results = [None] * n
     for _ in range(n):
@@ -34,20 +71,16 @@ async def randousha(n, t, k, my_id, _send, _recv, field):
     """
     Generates a batch of (n-2t)k secret sharings of random elements
     """
-    poly = polynomials_over(field)
     eval_point = EvalPoint(field, n, use_omega_powers=False)
     big_t = n - (2 * t) - 1  # This is same as `T` in the HyperMPC paper.
     encoder = EncoderFactory.get(eval_point)
 
     # Pick k random elements
-    def to_int(coeffs):
-        return tuple(map(int, coeffs))
-
-    my_randoms = [field.random() for _ in range(k)]
+    my_randoms = random_ints(field.modulus, k)
 
     # Generate t and 2t shares of the random element.
-    coeffs_t = [to_int(poly.random(t, r).coeffs) for r in my_randoms]
-    coeffs_2t = [to_int(poly.random(2 * t, r).coeffs) for r in my_randoms]
+    coeffs_t = _random_coeffs(my_randoms, t, field.modulus)
+    coeffs_2t = _random_coeffs(my_randoms, 2 * t, field.modulus)
     unref_t = encoder.encode(coeffs_t)
     unref_2t = encoder.encode(coeffs_2t)
 
@@ -101,30 +134,37 @@ async def randousha(n, t, k, my_id, _send, _recv, field):
                     return i
             return 0
 
-        def get_degree_and_secret(shares):
+        def get_degree_and_secret(sharings):
             decoder = DecoderFactory.get(eval_point)
-            polys = decoder.decode(list(range(n)), transpose_lists(list(shares)))
+            polys = decoder.decode(list(range(n)), sharings)
             secrets = [p[0] for p in polys]
             degrees = [get_degree(p) for p in polys]
             return degrees, secrets
 
-        degree_t, secret_t = get_degree_and_secret(shares_t)
-        degree_2t, secret_2t = get_degree_and_secret(shares_2t)
+        # Rather than decoding each of the k sharings, decode random linear
+        # combinations of them. The coefficients are picked after all the shares
+        # have been received, so they can't be anticipated by the dealers.
+        combined_t, combined_2t = [], []
+        for _ in range(RANDOUSHA_CHECKS):
+            coeffs = random_ints(field.modulus, len(shares_t[0]))
+            combined_t.append(_combine_shares(shares_t, coeffs, field.modulus))
+            combined_2t.append(_combine_shares(shares_2t, coeffs, field.modulus))
+
+        degree_t, secret_t = get_degree_and_secret(combined_t)
+        degree_2t, secret_2t = get_degree_and_secret(combined_2t)
 
         # Verify that the shares are in-fact `t` and `2t` shared.
         # Verify that both `t` and `2t` shares of the same value.
-        if (
-            all(deg == t for deg in degree_t)
-            and all(deg == 2 * t for deg in degree_2t)
-            and secret_t == secret_2t
-        ):
+        degree_check = all(deg <= t for deg in degree_t) and all(
+            deg <= 2 * t for deg in degree_2t
+        )
+        if degree_check and secret_t == secret_2t:
             response = HyperInvMessageType.SUCCESS
 
         logging.debug(
             "[%d] Degree check: %s, Secret Check: %s",
             my_id,
-            all(deg == t for deg in degree_t)
-            and all(deg == 2 * t for deg in degree_2t),
+            degree_check,
             secret_t == secret_2t,
         )
 
@@ -150,6 +190,99 @@ async def randousha(n, t, k, my_id, _send, _recv, field):
     return tuple(zip(out_t, out_2t))
 
 
+async def randousha_stream(
+    n,
+    t,
+    k,
+    my_id,
+    _send,
+    _recv,
+    field,
+    chunk_size=RANDOUSHA_CHUNK_SIZE,
+    pipeline_depth=2,
+):
+    """
+    Generates (n-2t)k secret sharings of random elements like randousha, by running
+    randousha on chunks of chunk_size values at a time. Up to pipeline_depth chunks
+    run concurrently, so that the sharing of the next chunk overlaps with the
+    verification of the current one, and memory use and message sizes only depend
+    on chunk_size.
+
+    If k is None, chunks are generated until the generator is closed.
+
+    outputs:
+        Async generator yielding the (t, 2t) shares of each chunk, in order, as soon
+        as the chunk passes verification
+    """
+    assert chunk_size > 0 and pipeline_depth > 0
+    subscribe_recv_task, subscribe = subscribe_recv(_recv)
+
+    def _get_send_recv(tag):
+        return wrap_send(tag, _send), subscribe(tag)
+
+    if k is None:
+        chunks = repeat(chunk_size)
+    else:
+        chunks = [min(chunk_size, k - i) for i in range(0, k, chunk_size)]
+    pending = deque()
+    try:
+        for i, chunk in enumerate(chunks):
+            send, recv = _get_send_recv(f"chunk-{i}")
+            pending.append(
+                asyncio.create_task(randousha(n, t, chunk, my_id, send, recv, field))
+            )
+            if len(pending) >= pipeline_depth:
+                yield await pending.popleft()
+
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+        subscribe_recv_task.cancel()
+
+
+async def _triples_from_double_shares(ctx, field, double_shares):
+    """ Multiply pairs of random t sharings, reducing the degree of each product
+    with a double sharing. Uses 3 double sharings per triple.
+    """
+    k = len(double_shares) // 3
+    as_t, _ = zip(*double_shares[0 * k : 1 * k])
+    bs_t, _ = zip(*double_shares[1 * k : 2 * k])
+    as_t = list(map(field, as_t))
+    bs_t = list(map(field, bs_t))
+    rs_t, rs_2t = zip(*double_shares[2 * k : 3 * k])
+
+    assert len(rs_2t) == len(rs_t) == len(as_t) == len(bs_t)
+
+    abrs_2t = [a * b + r for a, b, r in zip(as_t, bs_t, rs_2t)]
+    abrs = await ctx.ShareArray(abrs_2t, 2 * ctx.t).open()
+    abs_t = [abr - r for abr, r in zip(abrs, rs_t)]
+    return list(zip(as_t, bs_t, abs_t))
+
+
+async def _bits_from_double_shares(ctx, field, double_shares):
+    """ Turn random t sharings into sharings of random values in {-1, 1}. Uses 2
+    double sharings per value.
+    """
+    # To generate bits, we generate a batch of `t,2t` sharings of
+    # [u]_t, [u]_2t, [r]_t, [r]_2t. The goal is to recontruct `u^2`
+    # so we can return `[u]/sqrt(u^2)`. The [r] sharings are used
+    # for publicly reconstructing:
+    #    u^2 = open([u]_t * [u]_t + [r]_2t) - [r]_t
+    k = len(double_shares) // 2
+    us_t, _ = zip(*double_shares[0:k])
+    us_t = list(map(field, us_t))
+    rs_t, rs_2t = zip(*double_shares[k : 2 * k])
+
+    u2rs_2t = [u * u + r for u, r in zip(us_t, rs_2t)]
+    assert len(u2rs_2t) == len(rs_t)
+    u2rs = await ctx.ShareArray(u2rs_2t, 2 * ctx.t).open()
+    u2s_t = [u2r - r for u2r, r in zip(u2rs, rs_t)]
+    u2s = await ctx.ShareArray(u2s_t).open()
+    return [u / u2.sqrt() for u, u2 in zip(us_t, u2s)]
+
+
 async def generate_triples(n, t, k, my_id, _send, _recv, field):
     subscribe_recv_task, subscribe = subscribe_recv(_recv)
 
@@ -160,27 +293,10 @@ async def generate_triples(n, t, k, my_id, _send, _recv, field):
     send, recv = _get_send_recv("randousha")
     rs_t2t = await randousha(n, t, 3 * k, my_id, send, recv, field)
 
-    as_t2t = rs_t2t[0 * k : 1 * k]
-    bs_t2t = rs_t2t[1 * k : 2 * k]
-    rs_t2t = rs_t2t[2 * k : 3 * k]
-
-    as_t, _ = zip(*as_t2t)
-    bs_t, _ = zip(*bs_t2t)
-    as_t = list(map(field, as_t))
-    bs_t = list(map(field, bs_t))
-    rs_t, rs_2t = zip(*rs_t2t)
-
     # Compute degree reduction to get triples
-    # TODO: Use the mixins and preprocessing system
     async def prog(ctx):
-        assert len(rs_2t) == len(rs_t) == len(as_t) == len(bs_t)
+        return await _triples_from_double_shares(ctx, field, rs_t2t[: 3 * k])
 
-        abrs_2t = [a * b + r for a, b, r in zip(as_t, bs_t, rs_2t)]
-        abrs = await ctx.ShareArray(abrs_2t, 2 * t).open()
-        abs_t = [abr - r for abr, r in zip(abrs, rs_t)]
-        return list(zip(as_t, bs_t, abs_t))
-
-    # TODO: compute triples through degree reduction
     send, recv = _get_send_recv("opening")
     ctx = Mpc(f"mpc:opening", n, t, my_id, send, recv, prog, {})
 
@@ -200,37 +316,204 @@ async def generate_bits(n, t, k, my_id, _send, _recv, field):
     send, recv = _get_send_recv("randousha")
     rs_t2t = await randousha(n, t, 2 * k, my_id, send, recv, field)
 
-    # To generate bits, we generate a batch of `t,2t` sharings of
-    # [u]_t, [u]_2t, [r]_t, [r]_2t. The goal is to recontruct `u^2`
-    # so we can return `[u]/sqrt(u^2)`. The [r] sharings are used
-    # for publicly reconstructing:
-    #    u^2 = open([u]_t * [u]_t + [r]_2t) - [r]_t
-    us_t2t = rs_t2t[0:k]
-    rs_t2t = rs_t2t[k : 2 * k]
-
-    us_t, _ = zip(*us_t2t)
-    us_t = list(map(field, us_t))
-    rs_t, rs_2t = zip(*rs_t2t)
-
     # Compute degree reduction to get the bit
     async def prog(ctx):
-        u2rs_2t = [u * u + r for u, r in zip(us_t, rs_2t)]
-        assert len(u2rs_2t) == len(rs_t)
-        u2rs = await ctx.ShareArray(u2rs_2t, 2 * t).open()
-        u2s_t = [u2r - r for u2r, r in zip(u2rs, rs_t)]
-        u2s = await ctx.ShareArray(u2s_t).open()
-        bits = [u / u2.sqrt() for u, u2 in zip(us_t, u2s)]
-        return bits
-
-    # TODO: compute triples through degree reduction
+        return await _bits_from_double_shares(ctx, field, rs_t2t[: 2 * k])
+
     send, recv = _get_send_recv("opening")
     ctx = Mpc(f"mpc:opening", n, t, my_id, send, recv, prog, {})
     result = await ctx._run()
-    # print(f'[{my_id}] Generate triples complete')
     subscribe_recv_task.cancel()
     return result
 
 
+class RandoushaFactory(ABC):
+    """ Long running generator of preprocessing from randousha.
+
+    randousha runs in pipelined chunks (see randousha_stream), and the double
+    sharings of each chunk are turned into preprocessing while the next chunks are
+    still being shared and verified. All of it runs over channels and an Mpc
+    context which are set up once. Outputs are added to a PreProcessedElements.
+
+    Use run to produce a given number of elements, or use as a context manager to
+    produce elements in the background until exit.
+    """
+
+    # Kind of preprocessing produced, and double sharings used per element.
+    kind = None
+    double_shares_per_element = None
+
+    def __init__(
+        self,
+        n,
+        t,
+        my_id,
+        send,
+        recv,
+        field=None,
+        preproc=None,
+        chunk_size=RANDOUSHA_CHUNK_SIZE,
+        pipeline_depth=2,
+        high_watermark=None,
+    ):
+        """
+        args:
+            preproc: PreProcessedElements to add the elements to. Defaults to
+                PreProcessedElements()
+            chunk_size, pipeline_depth: see randousha_stream
+            high_watermark: if set, production pauses while at least this many
+                elements are left in preproc
+        """
+        self.n, self.t, self.my_id = n, t, my_id
+        self.send, self.recv = send, recv
+        self.field = field if field is not None else GF(Subgroup.BLS12_381)
+        self.preproc = preproc if preproc is not None else PreProcessedElements()
+        self.chunk_size = chunk_size
+        self.pipeline_depth = pipeline_depth
+        self.high_watermark = high_watermark
+
+        # Elements produced per second, measured over a sliding window.
+        self._throughput = RateMeter()
+        self._task = None
+
+    @abstractmethod
+    async def _produce(self, ctx, double_shares):
+        """ Turn the given double sharings into elements, each a tuple of the share
+        values making it up.
+        """
+        raise NotImplementedError
+
+    @property
+    def produced(self):
+        """ Number of elements produced so far.
+        """
+        return self._throughput.total
+
+    def throughput(self):
+        """ Steady state throughput, in elements per second over a sliding window.
+        """
+        return self._throughput.rate()
+
+    def _available(self):
+        mixin = self.preproc._get_mixin(self.kind)
+        return mixin.available(self.my_id, self.n, self.t)
+
+    async def _wait_below_high_watermark(self):
+        if self.high_watermark is None:
+            return
+
+        while self._available() >= self.high_watermark:
+            await self.preproc.wait_for_change(self.my_id, self.n, self.t, self.kind)
+
+    async def _prog(self, ctx, k, randousha_send, randousha_recv):
+        per_element = self.double_shares_per_element
+
+        # Number of values each party needs to share in randousha, which outputs
+        # n - 2t double sharings per value shared.
+        randousha_k = None
+        if k is not None:
+            randousha_k = -(-k * per_element // (self.n - 2 * self.t))
+
+        stream = randousha_stream(
+            self.n,
+            self.t,
+            randousha_k,
+            self.my_id,
+            randousha_send,
+            randousha_recv,
+            self.field,
+            chunk_size=self.chunk_size,
+            pipeline_depth=self.pipeline_depth,
+        )
+
+        produced, leftover = 0, []
+        try:
+            async for chunk in stream:
+                double_shares = leftover + list(chunk)
+                count = len(double_shares) // per_element
+                if k is not None:
+                    count = min(count, k - produced)
+                leftover = double_shares[count * per_element :]
+
+                elements = await self._produce(
+                    ctx, double_shares[: count * per_element]
+                )
+                values = [int(v) for element in elements for v in element]
+                self.preproc.add_values(self.my_id, self.n, self.t, self.kind, values)
+                self._throughput.add(len(elements))
+                produced += len(elements)
+
+                if k is not None and produced >= k:
+                    break
+                await self._wait_below_high_watermark()
+        finally:
+            await stream.aclose()
+
+        return produced
+
+    async def run(self, k=None):
+        """ Produce k elements, or keep producing elements if k is None.
+
+        outputs:
+            Number of elements produced
+        """
+        subscribe_recv_task, subscribe = subscribe_recv(self.recv)
+
+        def _get_send_recv(tag):
+            return wrap_send(tag, self.send), subscribe(tag)
+
+        randousha_send, randousha_recv = _get_send_recv("randousha")
+        send, recv = _get_send_recv("opening")
+        ctx = Mpc(
+            f"mpc:{self.kind}-factory",
+            self.n,
+            self.t,
+            self.my_id,
+            send,
+            recv,
+            self._prog,
+            {},
+            k=k,
+            randousha_send=randousha_send,
+            randousha_recv=randousha_recv,
+        )
+
+        try:
+            return await ctx._run()
+        finally:
+            subscribe_recv_task.cancel()
+
+    def __enter__(self):
+        self._task = asyncio.create_task(self.run())
+        return self
+
+    def __exit__(self, *args):
+        self._task.cancel()
+
+
+class TripleFactory(RandoushaFactory):
+    """ Produces beaver triples, see RandoushaFactory.
+    """
+
+    kind = PreProcessingConstants.TRIPLES
+    double_shares_per_element = 3
+
+    async def _produce(self, ctx, double_shares):
+        return await _triples_from_double_shares(ctx, self.field, double_shares)
+
+
+class OneMinusOneFactory(RandoushaFactory):
+    """ Produces sharings of random values in {-1, 1}, see RandoushaFactory.
+    """
+
+    kind = PreProcessingConstants.ONE_MINUS_ONE
+    double_shares_per_element = 2
+
+    async def _produce(self, ctx, double_shares):
+        bits = await _bits_from_double_shares(ctx, self.field, double_shares)
+        return [(b,) for b in bits]
+
+
 ########################
 # Process runner
 ########################
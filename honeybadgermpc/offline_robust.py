@@ -4,7 +4,7 @@ from honeybadgermpc.hbavss import HbAvssLight
 from honeybadgermpc.avss_value_processor import AvssValueProcessor
 from honeybadgermpc.broadcast.crypto.boldyreva import dealer
 from honeybadgermpc.betterpairing import G1, ZR
-from honeybadgermpc.progs.random_refinement import refine_randoms
+from honeybadgermpc.progs.random_refinement import get_random_refiner
 from honeybadgermpc.field import GF
 from honeybadgermpc.elliptic_curve import Subgroup
 from honeybadgermpc.utils.misc import wrap_send, subscribe_recv
@@ -21,8 +21,6 @@ def get_avss_params(n, t, my_id):
 
 
 class PreProcessingBase(ABC):
-    PERIOD_IN_SECONDS = 3
-
     def __init__(
         self,
         n,
@@ -33,18 +31,41 @@ class PreProcessingBase(ABC):
         tag,
         batch_size=10,
         avss_value_processor_chunk_size=1,
+        low_watermark=None,
+        min_batch_interval=0,
+        acs_batch_size=1,
     ):
+        """
+        args:
+            batch_size: number of values to AVSS from this node in each batch
+            low_watermark: number of values in the output queue below which another
+                batch of AVSSes is triggered. Defaults to batch_size
+            min_batch_interval: minimum number of seconds between the starts of two
+                batches of AVSSes
+            acs_batch_size: passed on to the AvssValueProcessor
+        """
         self.n, self.t, self.my_id = n, t, my_id
         self.tag = tag
         self.avss_value_processor_chunk_size = avss_value_processor_chunk_size
+        self.acs_batch_size = acs_batch_size
 
         # Batch size of values to AVSS from a node
         self.batch_size = batch_size
         # Minimum number of values before triggering another set of AVSSes
-        self.low_watermark = self.batch_size
+        self.low_watermark = low_watermark if low_watermark is not None else batch_size
+        self.min_batch_interval = min_batch_interval
 
         self.output_queue = asyncio.Queue()
 
+        # Set whenever the number of values in the output queue changes, so that
+        # the runner checks it against the low watermark. It starts out set so that
+        # the first batch is triggered straight away.
+        self._output_changed = asyncio.Event()
+        self._output_changed.set()
+
+        # Number of values this node has dealt with AVSS so far
+        self._values_dealt = 0
+
         # Create a mechanism to split the `send` and `recv` channels based on `tag`
         subscribe_recv_task, subscribe = subscribe_recv(recv)
         self.tasks = [subscribe_recv_task]
@@ -55,15 +76,39 @@ class PreProcessingBase(ABC):
         self.get_send_recv = _get_send_recv
 
     async def get(self):
-        return await self.output_queue.get()
+        value = await self.output_queue.get()
+        self._output_changed.set()
+        return value
+
+    def _put(self, value):
+        self.output_queue.put_nowait(value)
+        self._output_changed.set()
 
     @abstractmethod
     def _get_input_batch(self):
         raise NotImplementedError
 
+    def _count_values_in_flight(self):
+        """ Lower bound on the number of values which will be added to the output
+        queue from the values this node has dealt and which haven't been agreed yet.
+        Each chunk of them ends up in a different batch of agreed values, which
+        yields at least one value.
+        """
+        agreed = self.avss_value_processor.agreed_counts_per_dealer[self.my_id]
+        return (self._values_dealt - agreed) // self.avss_value_processor_chunk_size
+
+    async def _track_agreed_values(self):
+        # Wake up the runner whenever values dealt by this node are agreed, since
+        # they no longer count as in flight.
+        while True:
+            agreed = self.avss_value_processor.agreed_counts_per_dealer[self.my_id]
+            await self.avss_value_processor.wait_for_agreed(self.my_id, agreed + 1)
+            self._output_changed.set()
+
     async def _trigger_and_wait_for_avss(self, avss_id):
         inputs = self._get_input_batch()
         assert type(inputs) in [tuple, list]
+        self._values_dealt += len(inputs)
         avss_tasks = []
         avss_tasks.append(
             asyncio.create_task(
@@ -87,24 +132,30 @@ class PreProcessingBase(ABC):
         counter = 0
         logging.debug("[%d] Starting preprocessing runner: %s", self.my_id, self.tag)
         while True:
-            # If the number of values in the output queue are below the lower
+            # Wait for values to be consumed or produced rather than polling.
+            await self._output_changed.wait()
+            self._output_changed.clear()
+
+            # If the number of values in the output queue, and of values dealt by
+            # this node which are still being agreed upon, is below the lower
             # watermark then we want to trigger the next set of AVSSes.
-            if self.output_queue.qsize() < self.low_watermark:
-                logging.debug("[%d] Starting AVSS Batch: %d", self.my_id, counter)
-                await self._trigger_and_wait_for_avss(counter)
-                logging.debug("[%d] AVSS Batch Completed: %d", self.my_id, counter)
-                counter += 1
-            # Wait for sometime before checking again.
-            await asyncio.sleep(PreProcessingBase.PERIOD_IN_SECONDS)
+            available = self.output_queue.qsize() + self._count_values_in_flight()
+            if available >= self.low_watermark:
+                continue
+
+            start_time = asyncio.get_event_loop().time()
+            logging.debug("[%d] Starting AVSS Batch: %d", self.my_id, counter)
+            await self._trigger_and_wait_for_avss(counter)
+            logging.debug("[%d] AVSS Batch Completed: %d", self.my_id, counter)
+            counter += 1
+
+            elapsed = asyncio.get_event_loop().time() - start_time
+            if elapsed < self.min_batch_interval:
+                await asyncio.sleep(self.min_batch_interval - elapsed)
 
     async def _get_output_batch(self, group_size=1):
         for i in range(self.batch_size):
-            batch = []
-            while True:
-                value = await self.avss_value_processor.get()
-                if value is None:
-                    break
-                batch.append(value)
+            batch = await self.avss_value_processor.get()
             assert len(batch) / group_size >= self.n - self.t
             assert len(batch) / group_size <= self.n
             yield batch
@@ -133,9 +184,11 @@ class PreProcessingBase(ABC):
             recv,
             self.avss_instance.output_queue.get,
             self.avss_value_processor_chunk_size,
+            acs_batch_size=self.acs_batch_size,
         )
         self.avss_value_processor.__enter__()
         self.tasks.append(asyncio.create_task(self._extract()))
+        self.tasks.append(asyncio.create_task(self._track_agreed_values()))
         return self
 
     def __exit__(self, *args):
@@ -146,28 +199,29 @@ class PreProcessingBase(ABC):
 
 
 class RandomGenerator(PreProcessingBase):
-    def __init__(self, n, t, my_id, send, recv, batch_size=10):
+    def __init__(self, n, t, my_id, send, recv, batch_size=10, **kwargs):
         super(RandomGenerator, self).__init__(
-            n, t, my_id, send, recv, "rand", batch_size
+            n, t, my_id, send, recv, "rand", batch_size, **kwargs
         )
         self.field = GF(Subgroup.BLS12_381)
+        self.refiner = get_random_refiner(n, t, self.field)
 
     def _get_input_batch(self):
         return [self.field.random().value for _ in range(self.batch_size)]
 
     async def _extract(self):
         while True:
+            # The batches of an AVSS round are refined together, with the refiner
+            # set up once for this n and t.
+            batches = []
             async for batch in self._get_output_batch():
-                random_shares_int = await asyncio.gather(*batch)
-                output_shares_int = refine_randoms(
-                    self.n, self.t, self.field, random_shares_int
-                )
-                for value in output_shares_int:
-                    self.output_queue.put_nowait(self.field(value))
+                batches.append(batch)
+            for value in self.refiner.refine(batches):
+                self._put(self.field(value))
 
 
 class TripleGenerator(PreProcessingBase):
-    def __init__(self, n, t, my_id, send, recv, batch_size=10):
+    def __init__(self, n, t, my_id, send, recv, batch_size=10, **kwargs):
         super(TripleGenerator, self).__init__(
             n,
             t,
@@ -177,6 +231,7 @@ class TripleGenerator(PreProcessingBase):
             "triple",
             batch_size,
             avss_value_processor_chunk_size=3,
+            **kwargs,
         )
         self.field = GF(Subgroup.BLS12_381)
 
@@ -190,15 +245,14 @@ class TripleGenerator(PreProcessingBase):
 
     async def _extract(self):
         while True:
-            async for batch in self._get_output_batch(3):
-                triple_shares_int = await asyncio.gather(*batch)
+            async for triple_shares_int in self._get_output_batch(3):
                 # Number of nodes which have contributed values to this batch
                 n = len(triple_shares_int)
                 assert n % 3 == 0
 
                 for i in range(0, n, 3):
                     a, b, ab = triple_shares_int[i : i + 3]
-                    self.output_queue.put_nowait((a, b, ab))
+                    self._put((a, b, ab))
 
 
 async def get_random(n, t, my_id, send, recv):
@@ -1,4 +1,5 @@
-from honeybadgermpc.betterpairing import ZR, G1, G2, pair
+from honeybadgermpc.betterpairing import ZR, G1, G2, GT, pair, multi_pair
+from honeybadgermpc.fixed_base import preprocessed_all
 from honeybadgermpc.polynomial import polynomials_over
 
 
@@ -11,18 +12,28 @@ class PolyCommitConst:
         self.gg = self.gs[0].pair_with(self.ghats[0])
         self.gh = self.hs[0].pair_with(self.ghats[0])
         self.field = field
+        # Whether gs and hs have fixed-base tables, set by preprocess_prover
+        self.prover_preprocessed = False
 
-    def commit(self, phi):
+    def _commit_to(self, coeffs, hat_coeffs):
+        # Returns prod gs[k] ** coeffs[k] * hs[k] ** hat_coeffs[k]. Exponentiations
+        # with preprocessed bases use their tables, which is faster than a
+        # multi-exponentiation over the same bases.
+        if not self.prover_preprocessed:
+            return G1.multiexp(
+                self.gs[: len(coeffs)] + self.hs[: len(hat_coeffs)],
+                coeffs + hat_coeffs,
+            )
         c = G1.one()
+        for g, coeff in zip(self.gs, coeffs):
+            c *= g ** coeff
+        for h, coeff in zip(self.hs, hat_coeffs):
+            c *= h ** coeff
+        return c
+
+    def commit(self, phi):
         phi_hat = polynomials_over(self.field).random(self.t)
-        i = 0
-        for item in self.gs:
-            c *= item ** phi.coeffs[i]
-            i += 1
-        i = 0
-        for item in self.hs:
-            c *= item ** phi_hat.coeffs[i]
-            i += 1
+        c = self._commit_to(phi.coeffs, phi_hat.coeffs)
         # c should equal g **(phi(alpha)) h **(phi_hat(alpha))
         return c, phi_hat
 
@@ -31,16 +42,42 @@ class PolyCommitConst:
         div = poly([-1 * i, 1])
         psi = (phi - poly([phi(i)])) / div
         psi_hat = (phi_hat - poly([phi_hat(i)])) / div
-        witness = G1.one()
-        j = 0
-        for item in self.gs[:-1]:
-            witness *= item ** psi.coeffs[j]
-            j += 1
-        j = 0
-        for item in self.hs[:-1]:
-            witness *= item ** psi_hat.coeffs[j]
-            j += 1
-        return witness
+        return self._commit_to(psi.coeffs, psi_hat.coeffs)
+
+    def batch_create_witness(self, phi, phi_hat, n):
+        """ Create the witnesses of phi and phi_hat at each of the points 1, ..., n,
+        as create_witness does for one of them, and return them in that order.
+
+        The witness at z is prod_m H_m ** (z ** m) for m < t, where
+        H_m = prod_{k > m} gs[k-m-1] ** phi_k * hs[k-m-1] ** phi_hat_k does not
+        depend on z. The H_m are computed once, by fixed-base exponentiations if the
+        prover is preprocessed and by t multi-exponentiations otherwise, after
+        which each witness is evaluated by Horner's rule with exponents of at most
+        log(n) bits, instead of dividing polynomials and doing 2t full
+        exponentiations per point.
+        """
+        t = self.t
+        if t == 0:
+            return [G1.one() for _ in range(n)]
+
+        def _coeffs(poly):
+            coeffs = list(poly.coeffs)
+            return coeffs + [self.field(0)] * (t + 1 - len(coeffs))
+
+        phi_coeffs, phi_hat_coeffs = _coeffs(phi), _coeffs(phi_hat)
+        h = [
+            self._commit_to(phi_coeffs[m + 1 :], phi_hat_coeffs[m + 1 :])
+            for m in range(t)
+        ]
+
+        witnesses = []
+        for z in range(1, n + 1):
+            witness = G1.one() * h[t - 1]
+            for m in range(t - 2, -1, -1):
+                witness **= z
+                witness *= h[m]
+            witnesses.append(witness)
+        return witnesses
 
     # If reusing the same commitment, the lhs of the comparison will be the same.
     # Take advantage of this to save pairings
@@ -76,15 +113,52 @@ class PolyCommitConst:
         )
         return lhs == rhs
 
+    def batch_verify_evals(self, evals):
+        """ Verify evaluation proofs of any commitments at any points, e.g. the shares
+        received from every dealer of several AVSS instances.
+
+        args:
+            evals: list of (c, i, phi_at_i, phi_hat_at_i, witness), as passed to
+                verify_eval
+        returns:
+            list of bools, whether each proof is valid
+
+        A random linear combination of all the proofs is checked first, with a
+        single multi-pairing however many proofs there are. Proofs are only
+        verified one by one, to find the invalid ones, if that check fails.
+        """
+        if not evals:
+            return []
+        coeffs = [ZR.random() for _ in evals]
+        if self._verify_combination(evals, coeffs):
+            return [True] * len(evals)
+        return [self.verify_eval(*item) for item in evals]
+
+    def _verify_combination(self, evals, coeffs):
+        # Each proof satisfies e(c * w ** i * g ** -phi(i) * h ** -phi_hat(i), ghat)
+        # == e(w, ghat ** alpha). Raising both sides to coeffs[j] and multiplying
+        # over all proofs gives e(lhs, ghat) * e(witness_sum, ghat ** alpha) == 1.
+        bases, exponents = [], []
+        share_sum, aux_sum = ZR(0), ZR(0)
+        for (c, i, phi_at_i, phi_hat_at_i, witness), r in zip(evals, coeffs):
+            bases += [c, witness]
+            exponents += [r, r * i]
+            share_sum += r * phi_at_i
+            aux_sum += r * phi_hat_at_i
+        lhs = G1.multiexp(
+            bases + [self.gs[0], self.hs[0]], exponents + [-share_sum, -aux_sum]
+        )
+        witness_sum = G1.multiexp([item[4] for item in evals], [-r for r in coeffs])
+        return multi_pair([lhs, witness_sum], self.ghats[:2]) == GT.one()
+
+    # Tables are shared by all PolyCommitConsts with the same CRS, and saved to disk
     def preprocess_verifier(self, level=4):
-        self.gg.preprocess(level)
-        self.gh.preprocess(level)
+        self.gg, self.gh = preprocessed_all([self.gg, self.gh], level)
 
     def preprocess_prover(self, level=4):
-        for item in self.gs:
-            item.preprocess(level)
-        for item in self.hs:
-            item.preprocess(level)
+        self.gs = preprocessed_all(self.gs, level)
+        self.hs = preprocessed_all(self.hs, level)
+        self.prover_preprocessed = True
 
 
 def gen_pc_const_crs(t, alpha=None, g=None, h=None, ghat=None):
@@ -1,4 +1,5 @@
 from honeybadgermpc.betterpairing import G1, ZR
+from honeybadgermpc.fixed_base import preprocessed_all
 from honeybadgermpc.polynomial import polynomials_over
 
 
@@ -22,9 +23,7 @@ class PolyCommitLin(object):
         return aux(i)
 
     def verify_eval(self, cs, i, phi_at_i, witness):
-        lhs = G1.one()
-        for j in range(len(cs)):
-            lhs *= pow(cs[j], pow(i, j))
+        lhs = G1.multiexp(cs, [pow(i, j) for j in range(len(cs))])
         rhs = pow(self.g, phi_at_i) * pow(self.h, witness)
         return lhs == rhs
 
@@ -36,6 +35,6 @@ class PolyCommitLin(object):
                 return False
         return True
 
+    # Tables are shared by all PolyCommitLins with the same CRS, and saved to disk
     def preprocess(self, level=4):
-        self.g.preprocess(level)
-        self.h.preprocess(level)
+        self.g, self.h = preprocessed_all([self.g, self.h], level)
@@ -1,5 +1,7 @@
 import logging
 import operator
+import sys
+from collections import OrderedDict
 from functools import reduce
 from itertools import zip_longest
 
@@ -20,6 +22,83 @@ def strip_trailing_zeros(a):
     return a[:i]
 
 
+# Default number of entries kept in each Polynomial class's Lagrange cache
+LAGRANGE_CACHE_SIZE = 1024
+
+
+class LagrangeCache(object):
+    """Bounded LRU cache for Lagrange interpolation data.
+
+    Keys are built from integer x-coordinates so that lookups don't have to hash
+    field elements. Once ``maxsize`` entries are stored, the least recently used
+    entry is evicted on every insertion.
+    """
+
+    def __init__(self, maxsize=LAGRANGE_CACHE_SIZE):
+        assert maxsize > 0, "maxsize must be positive"
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, compute):
+        """Return the value stored for ``key``, calling ``compute()`` to create
+        and store it on a miss.
+        """
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+        self.misses += 1
+        value = compute()
+        nbytes = _approx_nbytes(key) + _approx_nbytes(value)
+        self._entries[key] = (value, nbytes)
+        self.nbytes += nbytes
+        while len(self._entries) > self.maxsize:
+            _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+            self.nbytes -= evicted_nbytes
+            self.evictions += 1
+        return value
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "nbytes": self.nbytes,
+        }
+
+
+def _approx_nbytes(obj):
+    """Rough memory footprint of a cache key or value, counting field elements
+    by the size of their integer representation.
+    """
+    if isinstance(obj, (tuple, list)):
+        return sys.getsizeof(obj) + sum(_approx_nbytes(item) for item in obj)
+    if hasattr(obj, "coeffs"):
+        return sys.getsizeof(obj) + _approx_nbytes(obj.coeffs)
+    if isinstance(obj, str):
+        return sys.getsizeof(obj)
+    return sys.getsizeof(int(obj))
+
+
 _poly_cache = {}
 
 
@@ -69,6 +148,10 @@ def polynomials_over(field):
                 x_recomb = field(x_recomb)
             assert type(x_recomb) is field_type
             xs, ys = zip(*shares)
+            if int(x_recomb) == 0:
+                vector = cls.lagrange_coefficients_at_zero(xs)
+                return sum(map(operator.mul, ys, vector))
+
             vector = []
             for i, x_i in enumerate(xs):
                 factors = [
@@ -77,30 +160,49 @@ def polynomials_over(field):
                 vector.append(reduce(operator.mul, factors))
             return sum(map(operator.mul, ys, vector))
 
-        _lagrange_cache = {}  # Cache lagrange polynomials
+        # Cache lagrange polynomials and coefficient vectors
+        _lagrange_cache = LagrangeCache()
+
+        @classmethod
+        def lagrange_coefficients_at_zero(cls, xs):
+            """Returns the coefficients [l_0, ..., l_k] such that
+            f(0) = sum(l_i * f(xs[i])) for any f of degree < len(xs).
+            """
+            int_xs = tuple(int(x) for x in xs)
+
+            def compute():
+                vector = []
+                for i, x_i in enumerate(int_xs):
+                    num, den = field(1), field(1)
+                    for k, x_k in enumerate(int_xs):
+                        if k != i:
+                            num *= x_k
+                            den *= x_k - x_i
+                    vector.append(num / den)
+                return tuple(vector)
+
+            return cls._lagrange_cache.get(("zero", int_xs), compute)
 
         @classmethod
         def interpolate(cls, shares):
             x = cls([field(0), field(1)])  # This is the polynomial f(x) = x
             one = cls([field(1)])  # This is the polynomial f(x) = 1
             xs, ys = zip(*shares)
+            int_xs = tuple(int(xi) for xi in xs)
 
             def lagrange(xi):
-                # Let's cache lagrange values
-                if (xs, xi) in cls._lagrange_cache:
-                    return cls._lagrange_cache[(xs, xi)]
-
                 def mul(a, b):
                     return a * b
 
-                num = reduce(mul, [x - cls([xj]) for xj in xs if xj != xi], one)
-                den = reduce(mul, [xi - xj for xj in xs if xj != xi], field(1))
-                p = num * cls([1 / den])
-                cls._lagrange_cache[(xs, xi)] = p
-                return p
+                def compute():
+                    num = reduce(mul, [x - cls([xj]) for xj in int_xs if xj != xi], one)
+                    den = reduce(mul, [xi - xj for xj in int_xs if xj != xi], field(1))
+                    return num * cls([1 / den])
+
+                return cls._lagrange_cache.get(("basis", int_xs, xi), compute)
 
             f = cls([0])
-            for xi, yi in zip(xs, ys):
+            for xi, yi in zip(int_xs, ys):
                 pi = lagrange(xi)
                 f += cls([yi]) * pi
             return f
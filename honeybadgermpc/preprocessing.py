@@ -1,13 +1,16 @@
+import atexit
 import logging
 import asyncio
 import re
 import os
 from os import makedirs, listdir
 from os.path import isfile, join
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from threading import Lock
 from uuid import uuid4
-from random import randint
-from collections import defaultdict
-from itertools import chain
+from collections import defaultdict, deque
+from itertools import chain, islice
 from enum import Enum
 from abc import ABC, abstractmethod
 from shutil import rmtree
@@ -16,6 +19,8 @@ from .field import GF
 from .polynomial import polynomials_over
 from .ntl import vandermonde_batch_evaluate
 from .elliptic_curve import Subgroup
+from .preprocessing_store import CURSOR_BATCH_SIZE, ConsumptionCursor, ShareFile
+from .preprocessing_metrics import RateMeter, log_metrics, time_to_depletion
 
 
 class PreProcessingConstants(Enum):
@@ -36,6 +41,68 @@ class PreProcessingConstants(Enum):
         return self.value
 
 
+# Number of share values generated at a time by the trusted dealer. A chunk holds
+# DEALER_CHUNK_SIZE // _preprocessing_stride elements.
+DEALER_CHUNK_SIZE = 1 << 14
+
+
+def random_ints(modulus, count):
+    """ Draw count uniformly random integers modulo modulus from the OS CSPRNG.
+    Each value is reduced from 128 more random bits than the modulus has, which
+    makes the bias of the reduction negligible.
+    """
+    width = (modulus.bit_length() + 7) // 8 + 16
+    data = os.urandom(width * count)
+    return [
+        int.from_bytes(data[i : i + width], "little") % modulus
+        for i in range(0, width * count, width)
+    ]
+
+
+def random_bits(count):
+    """ Draw count uniformly random bits from the OS CSPRNG.
+    """
+    data = os.urandom((count + 7) // 8)
+    return [(byte >> i) & 1 for byte in data for i in range(8)][:count]
+
+
+def share_secrets(secrets, n, degrees, modulus):
+    """ Secret share each secret with a random polynomial, and evaluate all of the
+    polynomials with a single vandermonde_batch_evaluate call.
+
+    args:
+        secrets: secrets to share, as integers
+        n: number of parties to share to
+        degrees: degrees of the sharing polynomials, repeated cyclically over the
+            secrets
+        modulus: field modulus
+
+    outputs:
+        List whose i'th entry holds the shares of party i, in the order of secrets
+    """
+    degrees = [degrees[i % len(degrees)] for i in range(len(secrets))]
+    width = max(degrees) + 1
+    randoms = random_ints(modulus, sum(degrees))
+
+    coeffs, offset = [], 0
+    for secret, degree in zip(secrets, degrees):
+        padding = [0] * (width - degree - 1)
+        coeffs.append([secret] + randoms[offset : offset + degree] + padding)
+        offset += degree
+
+    evaluations = vandermonde_batch_evaluate(list(range(1, n + 1)), coeffs, modulus)
+    return [[v[i] for v in evaluations] for i in range(n)]
+
+
+def _deal_shares(mixin_class, modulus, n, t, args, k):
+    """ Generate k elements of the given kind of preprocessing, and return the
+    shares of each party. This is a module level function so that it can run in
+    worker processes.
+    """
+    secrets = mixin_class._generate_secrets(modulus, k, *args)
+    return share_secrets(secrets, n, mixin_class._secret_degrees(t), modulus)
+
+
 class PreProcessingMixin(ABC):
     """ Abstract base class of preprocessing mixins.
     The interface exposed is composed of a few parts:
@@ -51,20 +118,70 @@ class PreProcessingMixin(ABC):
     - generation:
         - generate_values is the public interface to generate preprocessing values from
           the mixin
-        - _generate_polys is the private interface for doing the same thing, which is
-          what is overridden by subclasses.
+        - _generate_secrets is the private interface to generate the secrets to be
+          shared, which is what is overridden by subclasses. Secrets are integers, and
+          are shared in bulk by share_secrets.
+    - loading:
+        - only the names of preprocessing files are indexed up front. The file for a
+          given (context_id, n, t) is opened the first time its values are needed,
+          or when prefetch is called for it.
     - retrieval:
         - get_value is the public interface to retrieve a value from preprocessing
         - _get_value is the private interface for doing the same thing, which is what is
           overridden by subclasses
+        - get_values and _get_values do the same for k values at once, returning
+          ShareArrays
+    - consumption:
+        - every preprocessing file has a ConsumptionCursor stored next to it
+          recording how much of it has been used, so that values are never reused
+          across restarts.
+        - files whose values are mostly used up are compacted in a background
+          thread, dropping the values already used. Files are never removed, as
+          their values may still be cached or appended to.
+    - online production:
+        - add_values appends values for a single party, e.g. as they are produced by
+          the offline protocols, see honeybadgermpc.preprocessing_service.
+        - available and wait_for_change let consumers and producers wait for the
+          values of a party to be added or used.
+    - metrics:
+        - elements used and added are measured for each (context_id, n, t), and
+          metrics reports them together with the number of elements left.
     """
 
+    # Fraction of a file which must be used up before it is compacted.
+    _compaction_threshold = 0.5
+
+    # Single background thread compacting the files of all mixins, and the names
+    # of the files it has been asked to compact.
+    _compaction_executor = ThreadPoolExecutor(max_workers=1)
+    _compacting = set()
+
+    # Consumption cursors by file name, and a lock guarding writes to
+    # preprocessing files. These are shared by all mixins, as several instances
+    # may be reading and writing the same files.
+    _cursors = {}
+    _lock = Lock()
+
+    # Futures of coroutines waiting for the values of a preprocessing file to be
+    # added or used, by file name.
+    _watchers = defaultdict(set)
+
+    # Rates at which elements are used and added, by file name.
+    _consumption = defaultdict(RateMeter)
+    _production = defaultdict(RateMeter)
+
+    # Number of producers, e.g. PreProcessingServices, adding values to each
+    # preprocessing file, by file name.
+    _producers = defaultdict(int)
+
     def __init__(self, field, poly, data_dir):
         self.field = field
         self.poly = poly
         self.cache = defaultdict(chain)
         self.count = defaultdict(int)
         self.data_dir = data_dir
+        self._files = {}
+        self._share_files = {}
         self._refresh_cache()
 
     @property
@@ -77,6 +194,9 @@ class PreProcessingMixin(ABC):
         """ Returns the minimum number of preprocessing stored in the cache across all
         of the keys with the given n, t values.
         """
+        for key in [k for k in self._files if k[1:] == (n, t)]:
+            self._load(key)
+
         counts = []
         for (id_, n_, t_) in self.count:
             if (n_, t_) == (n, t):
@@ -97,30 +217,216 @@ class PreProcessingMixin(ABC):
             Preprocessing value for this mixin
         """
         key = (context.myid, context.N, context.t)
+        self._load(key)
 
         to_return, used = self._get_value(context, key, *args, **kwargs)
         self.count[key] -= used
+        if used > 0:
+            self._consume(key, used)
 
         return to_return
 
-    def _read_preprocessing_file(self, file_name):
-        """ Given the filename of the preprocessing file to read, fetch all of the
-        values stored in the preprocessing file.
-        """
-        with open(file_name, "r") as f:
-            lines = f.read().splitlines()
-            values = list(map(int, lines))
-            assert len(values) >= 3
-
-            modulus = values[0]
-            assert modulus == self.field.modulus, (
-                f"Expected file "
-                f"to have modulus {self.field.modulus}, but found {modulus}"
+    def get_values(self, context, k, *args, **kwargs):
+        """ Given an MPC context, retrieve k preprocessing values at once.
+
+        args:
+            context: MPC context to use when fetching the values
+            k: number of values to fetch
+
+        outputs:
+            ShareArray, or tuple of ShareArrays, holding the k values
+        """
+        key = (context.myid, context.N, context.t)
+        self._load(key)
+
+        to_return, used = self._get_values(context, key, k, *args, **kwargs)
+        self.count[key] -= used
+        if used > 0:
+            self._consume(key, used)
+
+        return to_return
+
+    def _take(self, key, count):
+        """ Take the next count values from the cache for the given key.
+        """
+        assert self.count[key] >= count, (
+            f"Expected "
+            f"{count} elements of {self.preprocessing_name}, "
+            f"but found only {self.count[key]}"
+        )
+
+        return list(islice(self.cache[key], count))
+
+    def _get_values(self, context, key, k, *args, **kwargs):
+        """ Private helper method to retrieve k values from the cache for this mixin.
+        Mixins supporting get_values override this.
+
+        args:
+            context: MPC context to retrieve the values for
+            key: tuple of (n, t, i) used to index the cache
+            k: number of values to retrieve
+
+        outputs:
+            Tuple of the preprocessing values and the number of elements used
+        """
+        raise NotImplementedError
+
+    def _cursor(self, file_name):
+        """ Returns the consumption cursor of the given preprocessing file.
+        """
+        if file_name not in self._cursors:
+            # Reserving whole elements keeps the cursor aligned to the stride
+            self._cursors[file_name] = ConsumptionCursor(
+                f"{file_name}.cursor",
+                batch_size=CURSOR_BATCH_SIZE * self._preprocessing_stride,
+            )
+
+        return self._cursors[file_name]
+
+    def _consume(self, key, used):
+        """ Advance the consumption cursor of the file backing the given key, and
+        whenever the cursor is written to disk, schedule a compaction of the file.
+        """
+        (context_id, n, t) = key
+        file_name = self.build_filename(n, t, context_id)
+        cursor = self._cursor(file_name)
+
+        self._notify(file_name)
+        self._consumption[file_name].add(used // self._preprocessing_stride)
+
+        reserved = cursor.reserved
+        cursor.advance(used)
+        if cursor.reserved == reserved or file_name in self._compacting:
+            return
+
+        self._compacting.add(file_name)
+        self._compaction_executor.submit(self._compact_file, file_name)
+
+    def _notify(self, file_name):
+        """ Wake up the coroutines waiting for the values of the given file to change.
+        """
+        for future in self._watchers.pop(file_name, ()):
+            if not future.done():
+                future.set_result(None)
+
+    def available(self, context_id, n, t):
+        """ Returns the number of elements left for the given context_id, n, t.
+        """
+        key = (context_id, n, t)
+        self._load(key)
+        return self.count[key] // self._preprocessing_stride
+
+    def _remaining(self, key):
+        """ Returns the number of elements left for the given key, like available,
+        but without loading the file backing it. The count of a file which hasn't
+        been loaded yet is read from its header and consumption cursor.
+        """
+        file_name = self._files.get(key)
+        if file_name is None:
+            return self.count[key] // self._preprocessing_stride
+
+        share_file = self._read_preprocessing_file(file_name)
+        count, first_index = len(share_file), share_file.first_index
+        share_file.close()
+
+        used = min(max(self._cursor(file_name).position - first_index, 0), count)
+        return (count - used) // self._preprocessing_stride
+
+    def metrics(self):
+        """ Returns the inventory metrics of each (context_id, n, t) this mixin has
+        preprocessing for, see honeybadgermpc.preprocessing_metrics.
+        """
+        keys = set(self._files) | set(self.count)
+        metrics = []
+        for (context_id, n, t) in sorted(keys):
+            file_name = self.build_filename(n, t, context_id)
+            remaining = self._remaining((context_id, n, t))
+            consumption_rate = self._consumption[file_name].rate()
+            production_rate = self._production[file_name].rate()
+            metrics.append(
+                {
+                    "kind": self.preprocessing_name,
+                    "n": n,
+                    "t": t,
+                    "party": context_id,
+                    "remaining": remaining,
+                    "consumption_rate": consumption_rate,
+                    "production_rate": production_rate,
+                    "time_to_depletion": time_to_depletion(
+                        remaining, consumption_rate, production_rate
+                    ),
+                }
             )
 
-            # The second and third lines of the file contain the degree and context id
-            # correspondingly.
-            return values[3:]
+        return metrics
+
+    async def wait_for_change(self, context_id, n, t):
+        """ Wait until values for the given context_id, n, t are added or used.
+        """
+        file_name = self.build_filename(n, t, context_id)
+        future = asyncio.get_event_loop().create_future()
+        self._watchers[file_name].add(future)
+        try:
+            await future
+        finally:
+            self._watchers[file_name].discard(future)
+
+    def add_producer(self, context_id, n, t):
+        """ Record that values for the given context_id, n, t are being produced.
+        """
+        self._producers[self.build_filename(n, t, context_id)] += 1
+
+    def remove_producer(self, context_id, n, t):
+        """ Record that a producer added with add_producer has stopped, and wake up
+        the coroutines waiting for its values.
+        """
+        file_name = self.build_filename(n, t, context_id)
+        self._producers[file_name] -= 1
+        if self._producers[file_name] == 0:
+            del self._producers[file_name]
+        self._notify(file_name)
+
+    def is_produced(self, context_id, n, t):
+        """ Returns whether values for the given context_id, n, t are being produced.
+        """
+        return self.build_filename(n, t, context_id) in self._producers
+
+    def _compact_file(self, file_name):
+        """ Drop the values already used from the start of a preprocessing file.
+
+        Only values actually used are dropped, not those merely reserved by the
+        consumption cursor. A file whose values are all used is kept, empty, so that
+        values appended to it later follow on from the position recorded in it.
+        """
+        try:
+            with self._lock:
+                # The cursor is read when the job runs rather than when it is
+                # submitted, as the file may have been cleared and recreated since.
+                cursor = self._cursors.get(file_name)
+                if cursor is None or not isfile(file_name):
+                    return
+
+                share_file = ShareFile(file_name)
+                used = min(cursor.position - share_file.first_index, len(share_file))
+                if used > 0 and used >= self._compaction_threshold * len(share_file):
+                    share_file.compact(used).close()
+                share_file.close()
+        except Exception:
+            logging.exception(f"Error compacting preprocessing file {file_name}")
+        finally:
+            self._compacting.discard(file_name)
+
+    def _read_preprocessing_file(self, file_name):
+        """ Given the filename of the preprocessing file to read, return a
+        `ShareFile` giving lazy access to the values stored in it.
+        """
+        share_file = ShareFile(file_name)
+        assert share_file.modulus == self.field.modulus, (
+            f"Expected file "
+            f"to have modulus {self.field.modulus}, but found {share_file.modulus}"
+        )
+
+        return share_file
 
     def _write_preprocessing_file(
         self, file_name, degree, context_id, values, append=False
@@ -129,25 +435,32 @@ class PreProcessingMixin(ABC):
         When append is true, this will append to an existing file, otherwise, it will
         overwrite.
         """
-        if not os.path.isfile(file_name):
-            append = False
-
-        if append:
-            with open(file_name, "r") as f:
-                meta = tuple(int(f.readline()) for _ in range(3))
-                expected_meta = (self.field.modulus, degree, context_id)
-                assert meta == expected_meta, (
-                    f"File {file_name} "
-                    f"expected to have metadata {expected_meta}, but had {meta}"
+        with self._lock:
+            if not os.path.isfile(file_name):
+                append = False
+
+            if not append:
+                # Values in the new file follow on from those already used, so the
+                # consumption cursor stays valid.
+                ShareFile.create(
+                    file_name,
+                    self.field.modulus,
+                    degree,
+                    context_id,
+                    values,
+                    first_index=self._cursor(file_name).position,
                 )
+                return
+
+            share_file = ShareFile(file_name)
+            meta = (share_file.modulus, share_file.degree, share_file.context_id)
+            expected_meta = (self.field.modulus, degree, context_id)
+            assert meta == expected_meta, (
+                f"File {file_name} "
+                f"expected to have metadata {expected_meta}, but had {meta}"
+            )
 
-            f = open(file_name, "a")
-        else:
-            f = open(file_name, "w")
-            print(self.field.modulus, degree, context_id, file=f, sep="\n")
-
-        print(*values, file=f, sep="\n")
-        f.close()
+            share_file.append(values)
 
     def build_filename(self, n, t, context_id, prefix=None):
         """ Given a file prefix, and metadata, return the filename to put
@@ -175,7 +488,7 @@ class PreProcessingMixin(ABC):
         if not file_name.startswith(self.file_prefix):
             return None
 
-        reg = re.compile(f"{self.file_prefix}_(\\d+)_(\\d+)-(\\d+).share")
+        reg = re.compile(f"{self.file_prefix}_(\\d+)_(\\d+)-(\\d+).share$")
         res = reg.search(file_name)
         if res is None:
             return None
@@ -186,11 +499,13 @@ class PreProcessingMixin(ABC):
         return tuple(map(int, res.groups()))
 
     def _refresh_cache(self):
-        """ Refreshes the cache by reading in sharedata files, and
-        updating the cache values and count variables.
+        """ Refreshes the cache by indexing the sharedata files for this mixin.
+        The files themselves are only read when they are first used, see _load.
         """
         self.cache = defaultdict(chain)
         self.count = defaultdict(int)
+        self._files = {}
+        self._share_files = {}
 
         for f in listdir(self.data_dir):
             file_name = join(self.data_dir, f)
@@ -202,54 +517,115 @@ class PreProcessingMixin(ABC):
                 continue
 
             (n, t, context_id) = groups
-            key = (context_id, n, t)
-            values = self._read_preprocessing_file(file_name)
+            self._files[(context_id, n, t)] = file_name
 
-            self.cache[key] = chain(values)
-            self.count[key] = len(values)
+    def _load(self, key):
+        """ Updates the cache and count for the given key from its sharedata file, if
+        the file hasn't been read yet. Values which were already used, according to
+        the consumption cursor of the file, are skipped.
+        """
+        file_name = self._files.pop(key, None)
+        if file_name is None:
+            return
 
-    def _write_polys(self, n, t, polys, append=False, prefix=None):
-        """ Given a file prefix, a list of polynomials, and associated n, t values,
-        write the preprocessing for the share values represented by the polnomials.
+        values = self._read_preprocessing_file(file_name)
+
+        cursor = self._cursor(file_name)
+        cursor.position = max(cursor.position, values.first_index)
+        start = min(cursor.position - values.first_index, len(values))
+
+        self.cache[key] = chain(values.values(start))
+        self.count[key] = len(values) - start
+        self._share_files[key] = values
+
+    def _unload(self, key):
+        """ Drops the values cached for the given key, and closes the file they were
+        read from.
+        """
+        self.cache.pop(key, None)
+        self.count.pop(key, None)
+        share_file = self._share_files.pop(key, None)
+        if share_file is not None:
+            share_file.close()
+
+    def prefetch(self, context_id, n, t):
+        """ Hint that the values for the given context_id, n, t will be used soon,
+        so that the file backing them is opened and read into memory ahead of time.
+        """
+        key = (context_id, n, t)
+        self._load(key)
+        if key in self._share_files:
+            self._share_files[key].prefetch()
+
+    def _write_shares(self, n, t, shares, append=False, prefix=None):
+        """ Given a file prefix, the shares of each party, and associated n, t values,
+        write the preprocessing for each party.
 
         args:
-            prefix: prefix to use when writing the file
             n: number of nodes this is preprocessing for
             t: number of faults tolerated by this preprocessing
-            polys: polynomials corresponding to secret share values to write
+            shares: shares[i] is the list of share values of party i
             append: Whether or not to append shares to an existing file, or to overwrite.
+            prefix: prefix to use when writing the file
         """
-        polys = [[coeff.value for coeff in poly.coeffs] for poly in polys]
-        all_values = vandermonde_batch_evaluate(
-            list(range(1, n + 1)), polys, self.field.modulus
-        )
-
         for i in range(n):
-            values = [v[i] for v in all_values]
-            file_name = self.build_filename(n, t, i, prefix=prefix)
-            self._write_preprocessing_file(file_name, t, i, values, append=append)
-
-            key = (i, n, t)
-            if append:
-                self.cache[key] = chain(self.cache[key], values)
-                self.count[key] += len(values)
-            else:
-                self.cache[key] = chain(values)
-                self.count[key] = len(values)
-
-    def generate_values(self, k, n, t, *args, append=False, **kwargs):
+            self._write_party_shares(i, n, t, shares[i], append=append, prefix=prefix)
+
+    def _write_party_shares(self, context_id, n, t, values, append=False, prefix=None):
+        """ Write the share values of a single party. They aren't kept in memory: the
+        file is indexed again, and read from the consumption cursor on its next use.
+        """
+        file_name = self.build_filename(n, t, context_id, prefix=prefix)
+        self._write_preprocessing_file(file_name, t, context_id, values, append=append)
+
+        if prefix is None:
+            key = (context_id, n, t)
+            self._unload(key)
+            self._files[key] = file_name
+
+        self._notify(file_name)
+        self._production[file_name].add(len(values) // self._preprocessing_stride)
+
+    def add_values(self, context_id, n, t, values):
+        """ Append share values for the party context_id to its preprocessing, e.g.
+        as they are produced by an offline protocol.
+
+        args:
+            values: _preprocessing_stride share values per element, as integers
+        """
+        assert len(values) % self._preprocessing_stride == 0
+        self._write_party_shares(context_id, n, t, list(values), append=True)
+
+    def generate_values(self, k, n, t, *args, append=False, processes=None):
         """ Given some n, t, generate k values and write them to disk.
         If append is true, this will add on to existing preprocessing. Otherwise,
         this will overwrite existing preprocessing.
 
+        Values are generated and written about DEALER_CHUNK_SIZE share values at a
+        time, so memory use grows with neither k nor the stride of the elements.
+
         args:
             k: number of values to generate
             n: number of nodes to generate for
             t: number of faults that should be tolerated in generation
             append: set to true if this should append, or false to overwrite.
+            processes: if set, generate chunks in parallel in a pool of this many
+                processes.
         """
-        polys = self._generate_polys(k, n, t, *args, **kwargs)
-        self._write_polys(n, t, polys, append=append)
+        chunk_size = max(1, DEALER_CHUNK_SIZE // self._preprocessing_stride)
+        chunks = [min(chunk_size, k - i) for i in range(0, k, chunk_size)]
+        deal = partial(_deal_shares, type(self), self.field.modulus, n, t, args)
+
+        if processes is None:
+            self._write_chunks(n, t, map(deal, chunks), append)
+        else:
+            with ProcessPoolExecutor(processes) as pool:
+                self._write_chunks(n, t, pool.map(deal, chunks), append)
+
+    def _write_chunks(self, n, t, chunks, append):
+        for shares in chunks:
+            self._write_shares(n, t, shares, append=append)
+            append = True
 
     @property
     @staticmethod
@@ -267,19 +643,26 @@ class PreProcessingMixin(ABC):
         """
         raise NotImplementedError
 
+    @staticmethod
     @abstractmethod
-    def _generate_polys(self, k, n, t):
-        """ Private helper method to generate polynomials for use in preprocessing.
+    def _generate_secrets(modulus, k):
+        """ Private helper method to generate the secrets to share in preprocessing.
+        This is a static method so that it can run in worker processes.
 
         args:
+            modulus: modulus of the field to generate secrets in
             k: number of elements to generate
-            n: number of nodes to generate for
-            t: number of faults that should be tolerated by preprocessing
 
-        outputs: A list of polynomials corresponding to share values
+        outputs: A list of _preprocessing_stride * k secrets as integers
         """
         raise NotImplementedError
 
+    @staticmethod
+    def _secret_degrees(t):
+        """ Degrees of the sharings of the secrets making up one element.
+        """
+        return (t,)
+
     @abstractmethod
     def _get_value(self, context, key, *args, **kwargs):
         """ Private helper method to retrieve a value from the cache for
@@ -295,6 +678,10 @@ class PreProcessingMixin(ABC):
         raise NotImplementedError
 
 
+# Finish pending compactions before the interpreter exits.
+atexit.register(PreProcessingMixin._compaction_executor.shutdown)
+
+
 class ShareBitsPreProcessing(PreProcessingMixin):
     preprocessing_name = PreProcessingConstants.SHARE_BITS.value
 
@@ -302,20 +689,15 @@ class ShareBitsPreProcessing(PreProcessingMixin):
     def _preprocessing_stride(self):
         return self.field.modulus.bit_length() + 1
 
-    def _generate_polys(self, k, n, t):
-        bit_length = self.field.modulus.bit_length()
-        polys = []
-        for _ in range(k):
-            r = self.field.random()
-            r_bits = [
-                self.field(b)
-                for b in map(int, reversed(f"{{0:0{bit_length}b}}".format(r.value)))
-            ]
-
-            polys.append(self.poly.random(t, r))
-            polys += [self.poly.random(t, b) for b in r_bits]
+    @staticmethod
+    def _generate_secrets(modulus, k):
+        bit_length = modulus.bit_length()
+        secrets = []
+        for r in random_ints(modulus, k):
+            secrets.append(r)
+            secrets += [(r >> i) & 1 for i in range(bit_length)]
 
-        return polys
+        return secrets
 
     def _get_value(self, context, key):
         bit_length = self.field.modulus.bit_length()
@@ -330,14 +712,13 @@ class DoubleSharingPreProcessing(PreProcessingMixin):
     preprocessing_name = PreProcessingConstants.DOUBLE_SHARES.value
     _preprocessing_stride = 2
 
-    def _generate_polys(self, k, n, t):
-        polys = []
-        for _ in range(k):
-            r = self.field.random()
-            polys.append(self.poly.random(t, r))
-            polys.append(self.poly.random(2 * t, r))
+    @staticmethod
+    def _generate_secrets(modulus, k):
+        return [r for r in random_ints(modulus, k) for _ in range(2)]
 
-        return polys
+    @staticmethod
+    def _secret_degrees(t):
+        return (t, 2 * t)
 
     def _get_value(self, context, key):
         assert self.count[key] >= 2
@@ -345,25 +726,33 @@ class DoubleSharingPreProcessing(PreProcessingMixin):
         r_2t = context.Share(next(self.cache[key]), 2 * context.t)
         return (r_t, r_2t), self._preprocessing_stride
 
+    def _get_values(self, context, key, k):
+        used = k * self._preprocessing_stride
+        values = self._take(key, used)
+        r_t = context.ShareArray(values[0::2])
+        r_2t = context.ShareArray(values[1::2], 2 * context.t)
+        return (r_t, r_2t), used
+
 
 class PowersPreProcessing(PreProcessingMixin):
     preprocessing_name = PreProcessingConstants.POWERS.value
     _preprocessing_stride = 1
 
     def generate_values(self, k, n, t, z, append=False):
-        polys_arr = self._generate_polys(k, n, t, z)
-        for i, polys in enumerate(polys_arr):
-            self._write_polys(
-                n, t, polys, append=False, prefix=f"{self.file_prefix}_{i}"
-            )
+        modulus = self.field.modulus
+        powers = self._generate_secrets(modulus, k)
+        for i in range(z):
+            shares = share_secrets(powers, n, [t], modulus)
+            self._write_shares(n, t, shares, prefix=f"{self.file_prefix}_{i}")
 
-    def _generate_polys(self, k, n, t, z):
-        b = self.field.random().value
+    @staticmethod
+    def _generate_secrets(modulus, k):
+        (b,) = random_ints(modulus, 1)
         powers = [b]
         for _ in range(1, k):
-            powers.append(powers[-1] * b)
+            powers.append(powers[-1] * b % modulus)
 
-        return [[self.poly.random(t, power) for power in powers] for _ in range(z)]
+        return powers
 
     def _get_value(self, context, key, pid):
         file_name = (
@@ -381,12 +770,13 @@ class SharePreProcessing(PreProcessingMixin):
 
     def generate_values(self, k, n, t, x, append=False):
         sid = uuid4().hex
-        polys = self._generate_polys(x, n, t)
-        self._write_polys(n, t, polys, prefix=f"{self.file_prefix}_{sid}")
+        shares = share_secrets([self.field(x).value], n, [t], self.field.modulus)
+        self._write_shares(n, t, shares, prefix=f"{self.file_prefix}_{sid}")
         return sid
 
-    def _generate_polys(self, x, n, t):
-        return [self.poly.random(t, x)]
+    @staticmethod
+    def _generate_secrets(modulus, k):
+        raise NotImplementedError("Shares are generated from a given secret")
 
     def _get_value(self, context, key, sid, t=None):
         if t is None:
@@ -405,21 +795,26 @@ class RandomPreProcessing(PreProcessingMixin):
     preprocessing_name = PreProcessingConstants.RANDS.value
     _preprocessing_stride = 1
 
-    def _generate_polys(self, k, n, t):
-        return [self.poly.random(t) for _ in range(k)]
+    @staticmethod
+    def _generate_secrets(modulus, k):
+        return random_ints(modulus, k)
 
     def _get_value(self, context, key, t=None):
         t = t if t is not None else context.t
         assert self.count[key] >= 1
         return context.Share(next(self.cache[key]), t), 1
 
+    def _get_values(self, context, key, k, t=None):
+        t = t if t is not None else context.t
+        return context.ShareArray(self._take(key, k), t), k
+
 
 class SimplePreProcessing(PreProcessingMixin):
     """ Subclass of PreProcessingMixin to be used in the trivial case
     where the only thing required to get a value is to read _preprocessing_stride
     values, turn them in to shares, and return a tuple of them.
 
-    Subclasses of this class must only overwrite _generate_polys
+    Subclasses of this class must only overwrite _generate_secrets
     """
 
     def _get_value(self, context, key):
@@ -439,59 +834,70 @@ class SimplePreProcessing(PreProcessingMixin):
 
         return values, self._preprocessing_stride
 
+    def _get_values(self, context, key, k):
+        stride = self._preprocessing_stride
+        values = self._take(key, k * stride)
+
+        arrays = tuple(context.ShareArray(values[i::stride]) for i in range(stride))
+        if len(arrays) == 1:
+            arrays = arrays[0]
+
+        return arrays, k * stride
+
 
 class CubePreProcessing(SimplePreProcessing):
     preprocessing_name = PreProcessingConstants.CUBES.value
     _preprocessing_stride = 3
 
-    def _generate_polys(self, k, n, t):
-        polys = []
-        for _ in range(k):
-            a = self.field.random()
-            b = a * a
-            c = a * b
-            polys += [self.poly.random(t, v) for v in (a, b, c)]
+    @staticmethod
+    def _generate_secrets(modulus, k):
+        secrets = []
+        for a in random_ints(modulus, k):
+            b = a * a % modulus
+            secrets += [a, b, a * b % modulus]
 
-        return polys
+        return secrets
 
 
 class TriplePreProcessing(SimplePreProcessing):
     preprocessing_name = PreProcessingConstants.TRIPLES.value
     _preprocessing_stride = 3
 
-    def _generate_polys(self, k, n, t):
-        polys = []
-        for _ in range(k):
-            a = self.field.random()
-            b = self.field.random()
-            c = a * b
-            polys += [self.poly.random(t, v) for v in (a, b, c)]
+    @staticmethod
+    def _generate_secrets(modulus, k):
+        values = random_ints(modulus, 2 * k)
+        secrets = []
+        for a, b in zip(values[:k], values[k:]):
+            secrets += [a, b, a * b % modulus]
 
-        return polys
+        return secrets
 
 
 class ZeroPreProcessing(SimplePreProcessing):
     preprocessing_name = PreProcessingConstants.ZEROS.value
     _preprocessing_stride = 1
 
-    def _generate_polys(self, k, n, t):
-        return [self.poly.random(t, 0) for _ in range(k)]
+    @staticmethod
+    def _generate_secrets(modulus, k):
+        return [0] * k
 
 
 class BitPreProcessing(SimplePreProcessing):
     preprocessing_name = PreProcessingConstants.BITS.value
     _preprocessing_stride = 1
 
-    def _generate_polys(self, k, n, t):
-        return [self.poly.random(t, randint(0, 1)) for _ in range(k)]
+    @staticmethod
+    def _generate_secrets(modulus, k):
+        return random_bits(k)
 
 
 class SignedBitPreProcessing(SimplePreProcessing):
     preprocessing_name = PreProcessingConstants.ONE_MINUS_ONE.value
     _preprocessing_stride = 1
 
-    def _generate_polys(self, k, n, t):
-        return [self.poly.random(t, randint(0, 1) * 2 - 1) for _ in range(k)]
+    @staticmethod
+    def _generate_secrets(modulus, k):
+        return [modulus - 1 if b == 0 else 1 for b in random_bits(k)]
 
 
 class PreProcessedElements:
@@ -505,6 +911,10 @@ class PreProcessedElements:
 
     _cached_elements = {}
 
+    # Futures of the consumers waiting in wait_for, in the order they started
+    # waiting, by (data directory, kind, context_id, n, t).
+    _consumers = defaultdict(deque)
+
     def __new__(cls, append=True, data_directory=None, field=None):
         """ Called when a new PreProcessedElements is created.
         This creates a multiton based on the directory used in preprocessing
@@ -581,6 +991,13 @@ class PreProcessedElements:
 
         self._init_data_dir()
 
+        # Forget the deleted files, and the consumption cursors stored next to them
+        for mixin in self._mixins():
+            mixin._refresh_cache()
+        for file_name in list(PreProcessingMixin._cursors):
+            if file_name.startswith(self.data_directory):
+                del PreProcessingMixin._cursors[file_name]
+
     async def wait_for_preprocessing(self, timeout=1):
         """ Block until the ready file is created
         """
@@ -593,6 +1010,119 @@ class PreProcessedElements:
         """
         os.mknod(self._ready_file)
 
+    def prefetch(self, context_id, n, t, kinds=None):
+        """ Hint that the party context_id will soon use preprocessing for the
+        given n, t, so that it is loaded ahead of time rather than on first use.
+
+        args:
+            kinds: kinds of preprocessing to load, e.g. [PreProcessingConstants.TRIPLES].
+                Defaults to all of them.
+        """
+        kinds = None if kinds is None else set(map(str, kinds))
+        for mixin in self._mixins():
+            if kinds is None or mixin.preprocessing_name in kinds:
+                mixin.prefetch(context_id, n, t)
+
+    def metrics(self):
+        """ Returns inventory metrics for every kind of preprocessing: one dictionary
+        per (kind, n, t, party) with the number of elements remaining, the rates
+        at which elements are used and produced, in elements per second over a
+        sliding window, and the estimated time to depletion in seconds (None if
+        elements are not running out).
+        """
+        return [m for mixin in self._mixins() for m in mixin.metrics()]
+
+    def log_metrics(self):
+        """ Write the inventory metrics to the benchmark logger.
+        """
+        log_metrics(self.metrics())
+
+    def _mixins(self):
+        return [m for m in vars(self).values() if isinstance(m, PreProcessingMixin)]
+
+    def _get_mixin(self, kind):
+        """ Returns the mixin for the given kind of preprocessing, e.g.
+        PreProcessingConstants.TRIPLES
+        """
+        for mixin in self._mixins():
+            if mixin.preprocessing_name == str(kind):
+                return mixin
+
+        raise ValueError(f"Unknown kind of preprocessing: {kind}")
+
+    def available(self, context, kind):
+        """ Returns the number of elements of the given kind of preprocessing left
+        for the given context.
+        """
+        return self._get_mixin(kind).available(context.myid, context.N, context.t)
+
+    def add_values(self, context_id, n, t, kind, values):
+        """ Append share values of the given kind of preprocessing for the party
+        context_id, e.g. as they are produced by an offline protocol.
+        """
+        self._get_mixin(kind).add_values(context_id, n, t, values)
+
+    async def wait_for_change(self, context_id, n, t, kind):
+        """ Wait until elements of the given kind of preprocessing are added or used
+        for the given context_id, n, t.
+        """
+        await self._get_mixin(kind).wait_for_change(context_id, n, t)
+
+    async def wait_for(self, context, kind, k=1, if_producing=False):
+        """ Wait until at least k elements of the given kind of preprocessing are
+        available for the given context, for instance while they are being produced
+        by a PreProcessingService.
+
+        args:
+            if_producing: only wait while a PreProcessingService produces the given
+                kind of preprocessing for the context. Used by consumers which
+                would otherwise wait forever without one.
+        """
+        # Consumers get their values in the order they called this, as all parties
+        # must use the same values for the same operation.
+        key = (self.data_directory, str(kind), context.myid, context.N, context.t)
+        queue = PreProcessedElements._consumers[key]
+        if not queue and not self._must_wait(context, kind, k, if_producing):
+            return
+
+        turn = asyncio.get_event_loop().create_future()
+        queue.append(turn)
+        if len(queue) == 1:
+            turn.set_result(None)
+        try:
+            await turn
+            while self._must_wait(context, kind, k, if_producing):
+                await self.wait_for_change(context.myid, context.N, context.t, kind)
+        finally:
+            first = queue[0] is turn
+            queue.remove(turn)
+            if first and queue and not queue[0].done():
+                queue[0].set_result(None)
+
+    def _must_wait(self, context, kind, k, if_producing):
+        # The mixin is looked up again on every check, as it is replaced whenever
+        # this object is initialized again.
+        if self.available(context, kind) >= k:
+            return False
+        return not if_producing or self.is_produced(context, kind)
+
+    def add_producer(self, context_id, n, t, kind):
+        """ Record that elements of the given kind of preprocessing are being
+        produced for the party context_id.
+        """
+        self._get_mixin(kind).add_producer(context_id, n, t)
+
+    def remove_producer(self, context_id, n, t, kind):
+        """ Record that a producer added with add_producer has stopped.
+        """
+        self._get_mixin(kind).remove_producer(context_id, n, t)
+
+    def is_produced(self, context, kind):
+        """ Returns whether elements of the given kind of preprocessing are being
+        produced for the given context.
+        """
+        return self._get_mixin(kind).is_produced(context.myid, context.N, context.t)
+
     def _generate(self, mixin, k, n, t, *args, **kwargs):
         """ Generate k elements with given n, t values for the given kind of
         preprocessing.
@@ -605,29 +1135,29 @@ class PreProcessedElements:
         if k > 0:
             return mixin.generate_values(k, n, t, *args, append=self._append, **kwargs)
 
-    def generate_triples(self, k, n, t):
-        return self._generate(self._triples, k, n, t)
+    def generate_triples(self, k, n, t, processes=None):
+        return self._generate(self._triples, k, n, t, processes=processes)
 
-    def generate_cubes(self, k, n, t):
-        return self._generate(self._cubes, k, n, t)
+    def generate_cubes(self, k, n, t, processes=None):
+        return self._generate(self._cubes, k, n, t, processes=processes)
 
-    def generate_zeros(self, k, n, t):
-        return self._generate(self._zeros, k, n, t)
+    def generate_zeros(self, k, n, t, processes=None):
+        return self._generate(self._zeros, k, n, t, processes=processes)
 
-    def generate_rands(self, k, n, t):
-        return self._generate(self._rands, k, n, t)
+    def generate_rands(self, k, n, t, processes=None):
+        return self._generate(self._rands, k, n, t, processes=processes)
 
-    def generate_bits(self, k, n, t):
-        return self._generate(self._bits, k, n, t)
+    def generate_bits(self, k, n, t, processes=None):
+        return self._generate(self._bits, k, n, t, processes=processes)
 
-    def generate_one_minus_ones(self, k, n, t):
-        return self._generate(self._one_minus_ones, k, n, t)
+    def generate_one_minus_ones(self, k, n, t, processes=None):
+        return self._generate(self._one_minus_ones, k, n, t, processes=processes)
 
-    def generate_double_shares(self, k, n, t):
-        return self._generate(self._double_shares, k, n, t)
+    def generate_double_shares(self, k, n, t, processes=None):
+        return self._generate(self._double_shares, k, n, t, processes=processes)
 
-    def generate_share_bits(self, k, n, t):
-        return self._generate(self._share_bits, k, n, t)
+    def generate_share_bits(self, k, n, t, processes=None):
+        return self._generate(self._share_bits, k, n, t, processes=processes)
 
     def generate_powers(self, k, n, t, z):
         return self._generate(self._powers, k, n, t, z)
@@ -666,3 +1196,26 @@ class PreProcessedElements:
 
     def get_share_bits(self, context):
         return self._share_bits.get_value(context)
+
+    ## Bulk preprocessing retrieval methods, returning ShareArrays of k elements:
+
+    def get_triples_array(self, context, k):
+        return self._triples.get_values(context, k)
+
+    def get_cubes_array(self, context, k):
+        return self._cubes.get_values(context, k)
+
+    def get_zeros_array(self, context, k):
+        return self._zeros.get_values(context, k)
+
+    def get_rands_array(self, context, k, t=None):
+        return self._rands.get_values(context, k, t)
+
+    def get_bits_array(self, context, k):
+        return self._bits.get_values(context, k)
+
+    def get_one_minus_ones_array(self, context, k):
+        return self._one_minus_ones.get_values(context, k)
+
+    def get_double_shares_array(self, context, k):
+        return self._double_shares.get_values(context, k)
@@ -0,0 +1,83 @@
+"""
+Metrics on preprocessing inventory: how many elements of each kind are left, how
+fast they are used and produced, and when they will run out at that pace.
+
+`PreProcessedElements.metrics` returns one record per (kind, n, t, party), and
+`PreProcessedElements.log_metrics` writes them to the benchmark logger, alongside
+the other metrics of a node.
+"""
+import logging
+import time
+from collections import deque
+
+# Length in seconds of the sliding window rates are measured over.
+RATE_WINDOW_IN_SECONDS = 60
+
+
+class RateMeter(object):
+    """ Measures the rate of events, e.g. elements used, over a sliding window.
+    """
+
+    def __init__(self, window=RATE_WINDOW_IN_SECONDS, clock=time.monotonic):
+        self.window = window
+        self.clock = clock
+        self.total = 0
+        self._events = deque()
+
+    def _expire(self, now):
+        while self._events and self._events[0][0] <= now - self.window:
+            self._events.popleft()
+
+    def add(self, count=1):
+        """ Record count events happening now.
+        """
+        now = self.clock()
+        self.total += count
+
+        # Events are counted in buckets of a second, so memory use doesn't grow
+        # with the rate.
+        bucket = int(now)
+        if self._events and self._events[-1][0] == bucket:
+            self._events[-1][1] += count
+        else:
+            self._events.append([bucket, count])
+        self._expire(now)
+
+    def rate(self):
+        """ Average number of events per second over the last window seconds.
+        """
+        self._expire(self.clock())
+        return sum(count for _, count in self._events) / self.window
+
+
+def time_to_depletion(remaining, consumption_rate, production_rate):
+    """ Seconds until no elements are left if the current rates hold, or None if
+    elements aren't being used up faster than they are produced.
+    """
+    net_rate = consumption_rate - production_rate
+    if net_rate <= 0:
+        return None
+
+    return remaining / net_rate
+
+
+def log_metrics(metrics):
+    """ Write preprocessing metrics to the benchmark logger of each party.
+    """
+    for m in metrics:
+        benchmark_logger = logging.LoggerAdapter(
+            logging.getLogger("benchmark_logger"), {"node_id": m["party"]}
+        )
+        benchmark_logger.info(
+            "Preprocessing %s (n=%d, t=%d): %d remaining, %.2f/s used, "
+            "%.2f/s produced, depleted in %s seconds",
+            m["kind"],
+            m["n"],
+            m["t"],
+            m["remaining"],
+            m["consumption_rate"],
+            m["production_rate"],
+            "never"
+            if m["time_to_depletion"] is None
+            else f"{m['time_to_depletion']:.1f}",
+        )
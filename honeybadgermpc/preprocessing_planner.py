@@ -0,0 +1,250 @@
+"""
+Dry runs of MPC programs, to plan how much preprocessing they need.
+
+A dry run executes the program once for each party, on its own and without any
+communication. Preprocessing comes from `CountingPreProcessedElements`, which
+hands out shares of random values and counts the elements of each kind
+requested. Opening a share returns a random plaintext. Programs whose control
+flow depends on opened values may therefore take a different path than they
+would in a real run.
+
+Example:
+
+    plan = await plan_preprocessing(prog, n, t, config)
+    print(plan)
+    plan.generate(PreProcessedElements())
+"""
+import asyncio
+from collections import defaultdict
+
+from .mpc import Mpc
+from .preprocessing import PreProcessedElements, PreProcessingConstants
+
+# PreProcessedElements method generating each kind of preprocessing.
+GENERATE_METHODS = {
+    PreProcessingConstants.TRIPLES.value: "generate_triples",
+    PreProcessingConstants.CUBES.value: "generate_cubes",
+    PreProcessingConstants.ZEROS.value: "generate_zeros",
+    PreProcessingConstants.RANDS.value: "generate_rands",
+    PreProcessingConstants.BITS.value: "generate_bits",
+    PreProcessingConstants.ONE_MINUS_ONE.value: "generate_one_minus_ones",
+    PreProcessingConstants.DOUBLE_SHARES.value: "generate_double_shares",
+    PreProcessingConstants.SHARE_BITS.value: "generate_share_bits",
+}
+
+
+class CountingPreProcessedElements(object):
+    """ Stand-in for PreProcessedElements in dry runs. It returns shares of random
+    values, and counts the elements of each kind of preprocessing requested.
+    """
+
+    def __init__(self):
+        self.counts = defaultdict(int)
+
+    def _count(self, kind, k=1):
+        self.counts[str(kind)] += k
+
+    def _share(self, context, t=None):
+        return context.Share(context.field.random(), t)
+
+    def _shares(self, context, count, t=None):
+        return tuple(self._share(context, t) for _ in range(count))
+
+    def _array(self, context, k, t=None):
+        return context.ShareArray([context.field.random() for _ in range(k)], t)
+
+    def _arrays(self, context, k, count, t=None):
+        return tuple(self._array(context, k, t) for _ in range(count))
+
+    async def wait_for(self, context, kind, k=1, if_producing=False):
+        pass
+
+    def prefetch(self, context_id, n, t, kinds=None):
+        pass
+
+    ## Preprocessing retrieval methods:
+
+    def get_triples(self, context):
+        self._count(PreProcessingConstants.TRIPLES)
+        return self._shares(context, 3)
+
+    def get_cubes(self, context):
+        self._count(PreProcessingConstants.CUBES)
+        return self._shares(context, 3)
+
+    def get_zero(self, context):
+        self._count(PreProcessingConstants.ZEROS)
+        return self._share(context)
+
+    def get_rand(self, context, t=None):
+        self._count(PreProcessingConstants.RANDS)
+        return self._share(context, t)
+
+    def get_bit(self, context):
+        self._count(PreProcessingConstants.BITS)
+        return self._share(context)
+
+    def get_powers(self, context, z):
+        self._count(PreProcessingConstants.POWERS)
+        return [self._share(context)]
+
+    def get_share(self, context, sid, t=None):
+        self._count(PreProcessingConstants.SHARES)
+        return self._share(context, t)
+
+    def get_one_minus_ones(self, context):
+        self._count(PreProcessingConstants.ONE_MINUS_ONE)
+        return self._share(context)
+
+    def get_double_shares(self, context):
+        self._count(PreProcessingConstants.DOUBLE_SHARES)
+        return self._share(context), self._share(context, 2 * context.t)
+
+    def get_share_bits(self, context):
+        self._count(PreProcessingConstants.SHARE_BITS)
+        bit_length = context.field.modulus.bit_length()
+        return self._share(context), list(self._shares(context, bit_length))
+
+    ## Bulk preprocessing retrieval methods:
+
+    def get_triples_array(self, context, k):
+        self._count(PreProcessingConstants.TRIPLES, k)
+        return self._arrays(context, k, 3)
+
+    def get_cubes_array(self, context, k):
+        self._count(PreProcessingConstants.CUBES, k)
+        return self._arrays(context, k, 3)
+
+    def get_zeros_array(self, context, k):
+        self._count(PreProcessingConstants.ZEROS, k)
+        return self._array(context, k)
+
+    def get_rands_array(self, context, k, t=None):
+        self._count(PreProcessingConstants.RANDS, k)
+        return self._array(context, k, t)
+
+    def get_bits_array(self, context, k):
+        self._count(PreProcessingConstants.BITS, k)
+        return self._array(context, k)
+
+    def get_one_minus_ones_array(self, context, k):
+        self._count(PreProcessingConstants.ONE_MINUS_ONE, k)
+        return self._array(context, k)
+
+    def get_double_shares_array(self, context, k):
+        self._count(PreProcessingConstants.DOUBLE_SHARES, k)
+        return self._array(context, k), self._array(context, k, 2 * context.t)
+
+
+class DryRunMpc(Mpc):
+    """ Mpc context which runs a program for a single party with no communication.
+    Opening a share returns a random value.
+    """
+
+    def __init__(self, sid, n, t, myid, prog, config, **prog_args):
+        super(DryRunMpc, self).__init__(
+            sid,
+            n,
+            t,
+            myid,
+            None,
+            None,
+            prog,
+            config,
+            preproc=CountingPreProcessedElements(),
+            **prog_args,
+        )
+
+    def open_share(self, share):
+        self._get_share_id()
+        res = asyncio.Future()
+        res.set_result(self.field.random())
+        return res
+
+    def open_share_array(self, sharearray):
+        self._get_share_id()
+        res = asyncio.Future()
+        res.set_result([self.field.random() for _ in sharearray._shares])
+        return res
+
+    async def _run(self):
+        return await self.prog(self, **self.prog_args)
+
+
+class PreProcessingPlan(object):
+    """ Number of elements of each kind of preprocessing needed by each party to run
+    a program.
+    """
+
+    def __init__(self, n, t, counts):
+        """
+        args:
+            counts: counts[i] maps each kind of preprocessing to the number of
+                elements party i used
+        """
+        self.n, self.t = n, t
+        self.counts = counts
+
+    @property
+    def requirements(self):
+        """ Number of elements of each kind needed by the party needing the most.
+        """
+        requirements = defaultdict(int)
+        for party_counts in self.counts:
+            for kind, k in party_counts.items():
+                requirements[kind] = max(requirements[kind], k)
+
+        return dict(requirements)
+
+    @property
+    def unplanned(self):
+        """ Kinds of preprocessing used which depend on the inputs of the program,
+        e.g. shares of given secrets, and can't be generated in advance by a plan.
+        """
+        return sorted(set(self.requirements) - set(GENERATE_METHODS))
+
+    def generate(self, pp_elements=None, margin=0):
+        """ Generate the planned preprocessing.
+
+        args:
+            pp_elements: PreProcessedElements to generate into. Defaults to
+                PreProcessedElements()
+            margin: fraction of extra elements to generate on top of the plan
+        """
+        if pp_elements is None:
+            pp_elements = PreProcessedElements()
+
+        for kind, k in sorted(self.requirements.items()):
+            if kind not in GENERATE_METHODS:
+                continue
+
+            k = int(k * (1 + margin))
+            getattr(pp_elements, GENERATE_METHODS[kind])(k, self.n, self.t)
+
+    def __str__(self):
+        lines = [f"Preprocessing plan (n={self.n}, t={self.t}):"]
+        for kind, k in sorted(self.requirements.items()):
+            if kind in GENERATE_METHODS:
+                lines.append(f"    {GENERATE_METHODS[kind]}({k}, {self.n}, {self.t})")
+            else:
+                lines.append(f"    {kind}: {k} used, depends on the program inputs")
+
+        return "\n".join(lines)
+
+
+async def plan_preprocessing(prog, n, t, config={}, **prog_args):
+    """ Dry run prog for each of the n parties, and return the PreProcessingPlan
+    of the preprocessing it uses.
+
+    args:
+        prog: MPC program to plan for
+        config: mixins the program is run with, as for TaskProgramRunner
+        prog_args: arguments passed to the program
+    """
+    counts = []
+    for i in range(n):
+        context = DryRunMpc("mpc:dry-run", n, t, i, prog, config, **prog_args)
+        await context._run()
+        counts.append(dict(context.preproc.counts))
+
+    return PreProcessingPlan(n, t, counts)
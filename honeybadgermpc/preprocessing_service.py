@@ -0,0 +1,188 @@
+"""
+Online preprocessing: a service which runs the offline protocols in the background
+and feeds their output into `PreProcessedElements`, alongside the online phase.
+
+Each kind of preprocessing has a `Producer`, which runs one batch of an offline
+protocol at a time. Whenever fewer than low_watermark elements of its kind are
+left, the producer runs batches until there are at least high_watermark of them.
+Values are added to the same files and caches that the trusted dealer writes to,
+so `get_triples`, `get_rand`, etc. read them just like dealer generated values.
+Consumers which may get ahead of the producers wait for values with
+`PreProcessedElements.wait_for` before retrieving them. The multiplication and
+inversion mixins do so while a service produces the preprocessing they use.
+
+Every party runs the same producers. The offline protocols are interactive, so
+parties need to run the same batches. Since all parties use the same
+preprocessing in the same order, and every batch outputs the same number of
+values at each party, they cross their watermarks at the same points.
+
+Example:
+
+    producers = [
+        Producer(PreProcessingConstants.TRIPLES, randousha_triples),
+        Producer(PreProcessingConstants.RANDS, randousha_rands, 100, 1000),
+    ]
+    with PreProcessingService(n, t, my_id, send, recv, producers):
+        ...
+"""
+import asyncio
+import logging
+
+from .elliptic_curve import Subgroup
+from .field import GF
+from .offline_randousha import generate_bits, generate_triples, randousha_stream
+from .preprocessing import PreProcessedElements
+from .utils.misc import subscribe_recv, wrap_send
+
+
+def _to_ints(element):
+    """ Convert a preprocessing element to the tuple of share values making it up.
+    """
+    if isinstance(element, (tuple, list)):
+        return tuple(int(v) for v in element)
+
+    return (int(element),)
+
+
+async def randousha_rands(n, t, k, my_id, send, recv, field):
+    """ Random values, t shared, from randousha run in chunks.
+    """
+    shares = await randousha_double_shares(n, t, k, my_id, send, recv, field)
+    return [r_t for r_t, _ in shares]
+
+
+async def randousha_double_shares(n, t, k, my_id, send, recv, field):
+    """ Random values, both t and 2t shared, from randousha run in chunks.
+    """
+    shares = []
+    async for chunk in randousha_stream(n, t, k, my_id, send, recv, field):
+        shares += chunk
+    return shares
+
+
+async def randousha_triples(n, t, k, my_id, send, recv, field):
+    """ Beaver triples, from offline_randousha.generate_triples.
+    """
+    return await generate_triples(n, t, k, my_id, send, recv, field)
+
+
+async def randousha_bits(n, t, k, my_id, send, recv, field):
+    """ Random values in {-1, 1}, from offline_randousha.generate_bits. Produces
+    PreProcessingConstants.ONE_MINUS_ONE.
+    """
+    return await generate_bits(n, t, k, my_id, send, recv, field)
+
+
+def offline_robust_generator(generator):
+    """ Adapt a running generator from offline_robust, e.g. a RandomGenerator or
+    TripleGenerator, to a producer's generate function. The generator runs its own
+    protocol over its own channels, so the send and recv given are not used.
+    """
+
+    async def _generate(n, t, k, my_id, send, recv, field):
+        return [await generator.get() for _ in range(k)]
+
+    return _generate
+
+
+class Producer(object):
+    """ Produces one kind of preprocessing, keeping the number of elements left
+    between the given watermarks.
+    """
+
+    def __init__(self, kind, generate, low_watermark=100, high_watermark=1000, k=10):
+        """
+        args:
+            kind: kind of preprocessing produced, e.g. PreProcessingConstants.TRIPLES
+            generate: coroutine function generate(n, t, k, my_id, send, recv, field)
+                running one batch of an offline protocol, and returning the
+                elements output to this party
+            low_watermark: number of elements left below which production starts
+            high_watermark: number of elements left at which production stops
+            k: batch size passed to generate
+        """
+        assert 0 <= low_watermark <= high_watermark
+        self.kind = kind
+        self.generate = generate
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self.k = k
+
+
+class PreProcessingService(object):
+    """ Runs producers in the background, adding their output to the preprocessing
+    of this party. Use as a context manager: producers start on entry and are
+    cancelled on exit.
+    """
+
+    def __init__(self, n, t, my_id, send, recv, producers, preproc=None, field=None):
+        """
+        args:
+            producers: list of Producer, one per kind of preprocessing
+            preproc: PreProcessedElements to feed. Defaults to PreProcessedElements()
+            field: field to run the offline protocols in
+        """
+        self.n, self.t, self.my_id = n, t, my_id
+        self.producers = producers
+        self.preproc = preproc if preproc is not None else PreProcessedElements()
+        self.field = field if field is not None else GF(Subgroup.BLS12_381)
+
+        # Create a mechanism to split the `send` and `recv` channels based on `tag`
+        subscribe_recv_task, subscribe = subscribe_recv(recv)
+        self.tasks = [subscribe_recv_task]
+
+        def _get_send_recv(tag):
+            return wrap_send(tag, send), subscribe(tag)
+
+        self.get_send_recv = _get_send_recv
+
+    def _available(self, producer):
+        mixin = self.preproc._get_mixin(producer.kind)
+        return mixin.available(self.my_id, self.n, self.t)
+
+    async def _produce(self, producer, counter):
+        send, recv = self.get_send_recv(f"{producer.kind}-{counter}")
+        elements = await producer.generate(
+            self.n, self.t, producer.k, self.my_id, send, recv, self.field
+        )
+
+        values = [v for element in elements for v in _to_ints(element)]
+        self.preproc.add_values(self.my_id, self.n, self.t, producer.kind, values)
+        return len(elements)
+
+    async def _runner(self, producer):
+        counter = 0
+        logging.debug(
+            "[%d] Starting preprocessing producer: %s", self.my_id, producer.kind
+        )
+        while True:
+            while self._available(producer) >= producer.low_watermark:
+                await self.preproc.wait_for_change(
+                    self.my_id, self.n, self.t, producer.kind
+                )
+
+            while self._available(producer) < producer.high_watermark:
+                logging.debug(
+                    "[%d] Starting %s batch: %d", self.my_id, producer.kind, counter
+                )
+                produced = await self._produce(producer, counter)
+                logging.debug(
+                    "[%d] %s batch %d completed: %d elements",
+                    self.my_id,
+                    producer.kind,
+                    counter,
+                    produced,
+                )
+                counter += 1
+
+    def __enter__(self):
+        for producer in self.producers:
+            self.preproc.add_producer(self.my_id, self.n, self.t, producer.kind)
+            self.tasks.append(asyncio.create_task(self._runner(producer)))
+        return self
+
+    def __exit__(self, *args):
+        for task in self.tasks:
+            task.cancel()
+        for producer in self.producers:
+            self.preproc.remove_producer(self.my_id, self.n, self.t, producer.kind)
@@ -0,0 +1,403 @@
+"""
+Binary storage format for preprocessing share files.
+
+Each file starts with a fixed size header followed by the share values, each
+encoded as a fixed width little-endian integer:
+
+    magic      4 bytes   b"HBPP"
+    version    uint16
+    width      uint16    size in bytes of each element (ELEMENT_SIZE)
+    modulus    width bytes, little-endian
+    degree     uint32
+    context_id uint32
+    count      uint64    number of elements in the file
+    first      uint64    index of the first element in the stream of values
+                         written to this file, see `ConsumptionCursor`
+
+The header is padded to HEADER_SIZE bytes so that elements are aligned.
+Files are read through `mmap`, and values are only decoded when they are
+accessed. Appending writes the new elements at the end of the file and then
+bumps the count in the header, so a file is never left with a count covering
+elements which were not written.
+
+Files in the old text format (one decimal integer per line: modulus, degree,
+context id, then the values) can be converted with `convert_text_file`, or
+from the command line:
+
+    python -m honeybadgermpc.preprocessing_store sharedata/
+"""
+import logging
+import mmap
+import os
+import struct
+from argparse import ArgumentParser
+from os.path import isfile, join
+
+MAGIC = b"HBPP"
+VERSION = 1
+ELEMENT_SIZE = 32
+HEADER_SIZE = 64
+
+_HEADER_FORMAT = f"<4sHH{ELEMENT_SIZE}sIIQQ"
+_COUNT_OFFSET = struct.calcsize(_HEADER_FORMAT) - 2 * struct.calcsize("<Q")
+
+# Number of elements decoded at a time when iterating over a file.
+_READ_CHUNK_SIZE = 4096
+
+# Number of elements reserved by each write of a consumption cursor.
+CURSOR_BATCH_SIZE = 1024
+
+_CURSOR_FORMAT = "<Q"
+_CURSOR_SIZE = struct.calcsize(_CURSOR_FORMAT)
+
+
+def pack_values(values):
+    """ Encode values as consecutive ELEMENT_SIZE byte little-endian integers.
+    """
+    return b"".join(v.to_bytes(ELEMENT_SIZE, "little") for v in values)
+
+
+def unpack_values(buf):
+    """ Decode a buffer produced by `pack_values` into a list of integers.
+    """
+    return [
+        int.from_bytes(buf[i : i + ELEMENT_SIZE], "little")
+        for i in range(0, len(buf), ELEMENT_SIZE)
+    ]
+
+
+def is_share_file(file_name):
+    """ Returns True if the given file is in the binary share file format.
+    """
+    with open(file_name, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _fsync_directory(file_name):
+    """ Flush the directory entry of the given file, e.g. after renaming it.
+    """
+    fd = os.open(os.path.dirname(os.path.abspath(file_name)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class ShareFile(object):
+    """ Read access to a binary share file.
+
+    The header is read when the object is created, while the elements are only
+    mapped into memory the first time they are accessed. Indexing with an
+    integer or a slice, and iterating, decode just the elements requested.
+
+    The file is kept open, so the values stay readable even if the file is
+    replaced or removed in the meantime.
+    """
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+        self._mmap = None
+        self._file = open(file_name, "rb")
+
+        header = self._file.read(HEADER_SIZE)
+        size = os.fstat(self._file.fileno()).st_size
+
+        if len(header) < HEADER_SIZE or header[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(
+                f"{file_name} is not a binary share file. Files in the old text "
+                f"format can be converted with "
+                f"honeybadgermpc.preprocessing_store.convert_text_file"
+            )
+
+        (
+            _,
+            version,
+            width,
+            modulus,
+            degree,
+            context_id,
+            count,
+            first_index,
+        ) = struct.unpack(_HEADER_FORMAT, header[: struct.calcsize(_HEADER_FORMAT)])
+        if version != VERSION or width != ELEMENT_SIZE:
+            self.close()
+            raise ValueError(
+                f"Unsupported share file {file_name}: version {version}, "
+                f"element size {width}"
+            )
+
+        self.modulus = int.from_bytes(modulus, "little")
+        self.degree = degree
+        self.context_id = context_id
+        self.first_index = first_index
+
+        # An interrupted append may leave elements past the stored count, but
+        # never a count past the elements actually written.
+        self.count = min(count, (size - HEADER_SIZE) // ELEMENT_SIZE)
+
+    @staticmethod
+    def create(file_name, modulus, degree, context_id, values=(), first_index=0):
+        """ Write a new share file containing the given values, replacing any
+        existing file with the same name.
+
+        The file is written to a temporary path and moved into place, so any
+        `ShareFile` still mapping the old file keeps seeing its old contents.
+        """
+        return ShareFile._create(
+            file_name, modulus, degree, context_id, pack_values(values), first_index
+        )
+
+    @staticmethod
+    def _create(file_name, modulus, degree, context_id, data, first_index):
+        assert modulus.bit_length() <= 8 * ELEMENT_SIZE
+        header = struct.pack(
+            _HEADER_FORMAT,
+            MAGIC,
+            VERSION,
+            ELEMENT_SIZE,
+            modulus.to_bytes(ELEMENT_SIZE, "little"),
+            degree,
+            context_id,
+            len(data) // ELEMENT_SIZE,
+            first_index,
+        ).ljust(HEADER_SIZE, b"\x00")
+
+        tmp_file_name = f"{file_name}.tmp"
+        with open(tmp_file_name, "wb") as f:
+            f.write(header)
+            f.write(data)
+        os.replace(tmp_file_name, file_name)
+
+        return ShareFile(file_name)
+
+    def append(self, values):
+        """ Append values to the end of the file.
+        """
+        data = pack_values(values)
+        if not data:
+            return
+
+        count = self.count + len(data) // ELEMENT_SIZE
+        with open(self.file_name, "r+b") as f:
+            f.seek(HEADER_SIZE + self.count * ELEMENT_SIZE)
+            f.write(data)
+            f.truncate()
+            f.flush()
+            f.seek(_COUNT_OFFSET)
+            f.write(struct.pack("<Q", count))
+
+        # The existing mapping doesn't cover the new elements.
+        self._unmap()
+        self.count = count
+
+    def read(self, start=0, stop=None):
+        """ Decode the elements in [start, stop) into a list of integers.
+        """
+        start, stop, _ = slice(start, stop).indices(self.count)
+        if start >= stop:
+            return []
+
+        buf = self._buffer()
+        return unpack_values(
+            buf[HEADER_SIZE + start * ELEMENT_SIZE : HEADER_SIZE + stop * ELEMENT_SIZE]
+        )
+
+    def prefetch(self):
+        """ Ask for the elements of the file to be read into memory ahead of their use.
+        """
+        buf = self._buffer()
+        if hasattr(mmap, "MADV_WILLNEED"):
+            buf.madvise(mmap.MADV_WILLNEED)
+        else:
+            # Touch every page of the mapping to fault it in.
+            for i in range(0, len(buf), mmap.PAGESIZE):
+                buf[i]
+
+    def values(self, start=0):
+        """ Lazily iterate over the elements from start onwards.
+        """
+        for i in range(start, self.count, _READ_CHUNK_SIZE):
+            yield from self.read(i, i + _READ_CHUNK_SIZE)
+
+    def compact(self, start):
+        """ Drop the first start elements from the file.
+        The remaining elements are copied without being decoded, and keep their
+        position in the stream through `first_index`.
+        """
+        start = min(start, self.count)
+        buf = self._buffer()
+        data = buf[
+            HEADER_SIZE + start * ELEMENT_SIZE : HEADER_SIZE + self.count * ELEMENT_SIZE
+        ]
+        return ShareFile._create(
+            self.file_name,
+            self.modulus,
+            self.degree,
+            self.context_id,
+            data,
+            self.first_index + start,
+        )
+
+    def close(self):
+        self._unmap()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _unmap(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _buffer(self):
+        if self._mmap is None:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.count)
+            values = self.read(start, stop)
+            return values if step == 1 else values[::step]
+
+        if key < 0:
+            key += self.count
+        if not 0 <= key < self.count:
+            raise IndexError("share file index out of range")
+
+        return self.read(key, key + 1)[0]
+
+    def __iter__(self):
+        return self.values()
+
+    def __del__(self):
+        self.close()
+
+
+class ConsumptionCursor(object):
+    """ Durable record of how many elements of a share file have been used.
+
+    Positions count elements in the stream of values written to a share file
+    over its lifetime, so they stay valid when the file is compacted (see
+    `ShareFile.first_index`). To avoid a disk write per element, the cursor
+    reserves batch_size elements ahead of the position in use, and only writes
+    again once those are used up. After a restart consumption resumes from the
+    reserved position, so elements are skipped rather than ever reused. Since
+    the reserved position only depends on how many elements were used, parties
+    which used the same preprocessing all resume from the same element.
+    """
+
+    def __init__(self, file_name, batch_size=CURSOR_BATCH_SIZE):
+        self.file_name = file_name
+        self.batch_size = batch_size
+
+        self.reserved = ConsumptionCursor.read_reserved(file_name)
+        self.position = self.reserved
+
+    @staticmethod
+    def read_reserved(file_name):
+        """ Returns the position stored in the given cursor file, or 0 if there is
+        no such file. A truncated file is rejected rather than read as 0, which
+        would hand out used elements again.
+        """
+        if not isfile(file_name):
+            return 0
+
+        with open(file_name, "rb") as f:
+            data = f.read(_CURSOR_SIZE)
+        if len(data) < _CURSOR_SIZE:
+            raise ValueError(
+                f"Consumption cursor {file_name} is truncated, so the number of "
+                f"elements used from its share file is unknown"
+            )
+
+        (reserved,) = struct.unpack(_CURSOR_FORMAT, data)
+        return reserved
+
+    def advance(self, k=1):
+        """ Mark the next k elements as used.
+        """
+        self.position += k
+        if self.position > self.reserved:
+            self._write(self.position + self.batch_size)
+
+    def _write(self, reserved):
+        # Never move the stored position backwards, even if another cursor over
+        # the same file has reserved further ahead.
+        reserved = max(reserved, ConsumptionCursor.read_reserved(self.file_name))
+        tmp_file_name = f"{self.file_name}.tmp"
+        with open(tmp_file_name, "wb") as f:
+            f.write(struct.pack(_CURSOR_FORMAT, reserved))
+            # The new position must reach the disk before the rename does, and the
+            # rename before any of the reserved elements are used.
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file_name, self.file_name)
+        _fsync_directory(self.file_name)
+        self.reserved = reserved
+
+
+def read_text_file(file_name):
+    """ Read a share file in the old text format.
+
+    outputs:
+        Tuple of (modulus, degree, context_id, values)
+    """
+    with open(file_name, "r") as f:
+        values = list(map(int, f.read().splitlines()))
+
+    assert len(values) >= 3, f"{file_name} is missing its header"
+    return values[0], values[1], values[2], values[3:]
+
+
+def convert_text_file(file_name, output_file_name=None):
+    """ Convert a share file in the old text format to the binary format.
+    The file is converted in place unless output_file_name is given.
+    """
+    if output_file_name is None:
+        output_file_name = file_name
+
+    modulus, degree, context_id, values = read_text_file(file_name)
+    return ShareFile.create(output_file_name, modulus, degree, context_id, values)
+
+
+def convert_directory(data_dir):
+    """ Convert every text share file in data_dir to the binary format in place.
+
+    outputs:
+        List of file names which were converted
+    """
+    converted = []
+    for f in sorted(os.listdir(data_dir)):
+        file_name = join(data_dir, f)
+        if not f.endswith(".share") or not isfile(file_name):
+            continue
+        if is_share_file(file_name):
+            continue
+
+        convert_text_file(file_name)
+        converted.append(file_name)
+
+    return converted
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        description="Convert text preprocessing share files to the binary format."
+    )
+    parser.add_argument(
+        "paths", nargs="+", help="Share files, or directories containing them."
+    )
+    args = parser.parse_args()
+
+    for path in args.paths:
+        if os.path.isdir(path):
+            for file_name in convert_directory(path):
+                logging.info("Converted %s", file_name)
+        else:
+            convert_text_file(path)
+            logging.info("Converted %s", path)
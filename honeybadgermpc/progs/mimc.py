@@ -43,14 +43,14 @@ async def mimc_mpc_batch(context, xs, k):
     """
     # def cubing_share_array(): [x1,..., xK] -> [x1^3,..., xK^3]
     async def cubing_share_array(xs):
-        rs, rs_sq, rs_cube = zip(
-            *[context.preproc.get_cubes(context) for _ in range(len(xs))]
-        )
+        rs, rs_sq, rs_cube = context.preproc.get_cubes_array(context, len(xs))
 
-        ys = await (context.ShareArray(xs) - context.ShareArray(rs)).open()
+        ys = await (context.ShareArray(xs) - rs).open()
         return [
-            3 * y * rs_sq[i] + 3 * (y ** 2) * rs[i] + y ** 3 + rs_cube[i]
-            for i, y in enumerate(ys)
+            3 * y * r_sq + 3 * (y ** 2) * r + y ** 3 + r_cube
+            for y, r, r_sq, r_cube in zip(
+                ys, rs._shares, rs_sq._shares, rs_cube._shares
+            )
         ]
 
     # iterating the round function ROUND times
@@ -2,6 +2,7 @@ from honeybadgermpc.progs.mixins.base import AsyncMixin
 from honeybadgermpc.progs.mixins.constants import MixinConstants
 from honeybadgermpc.utils.typecheck import TypeCheck
 from honeybadgermpc.progs.mixins.dataflow import Share, ShareArray
+from honeybadgermpc.preprocessing import PreProcessingConstants
 
 from asyncio import gather
 
@@ -14,6 +15,10 @@ class BeaverMultiply(AsyncMixin):
     @staticmethod
     @TypeCheck()
     async def _prog(context: Mpc, x: Share, y: Share):
+        # Wait for triples if they are being produced online
+        await context.preproc.wait_for(
+            context, PreProcessingConstants.TRIPLES, if_producing=True
+        )
         a, b, ab = context.preproc.get_triples(context)
 
         d, e = await gather(*[(x - a).open(), (y - b).open()])
@@ -31,16 +36,15 @@ class BeaverMultiplyArrays(AsyncMixin):
     async def _prog(context: Mpc, j: ShareArray, k: ShareArray):
         assert len(j) == len(k)
 
-        a, b, ab = [], [], []
-        for _ in range(len(j)):
-            p, q, pq = context.preproc.get_triples(context)
-            a.append(p)
-            b.append(q)
-            ab.append(pq)
-
-        u, v = context.ShareArray(a), context.ShareArray(b)
+        await context.preproc.wait_for(
+            context, PreProcessingConstants.TRIPLES, len(j), if_producing=True
+        )
+        u, v, w = context.preproc.get_triples_array(context, len(j))
         f, g = await gather(*[(j - u).open(), (k - v).open()])
-        xy = [d * e + d * q + e * p + pq for (p, q, pq, d, e) in zip(a, b, ab, f, g)]
+        xy = [
+            d * e + d * q + e * p + pq
+            for (p, q, pq, d, e) in zip(u._shares, v._shares, w._shares, f, g)
+        ]
 
         return context.ShareArray(xy)
 
@@ -55,6 +59,9 @@ class DoubleSharingMultiply(AsyncMixin):
     async def reduce_degree_share(context: Mpc, x_2t: Share):
         assert x_2t.t == context.t * 2
 
+        await context.preproc.wait_for(
+            context, PreProcessingConstants.DOUBLE_SHARES, if_producing=True
+        )
         r_t, r_2t = context.preproc.get_double_shares(context)
         diff = await (x_2t - r_2t).open()
 
@@ -78,14 +85,10 @@ class DoubleSharingMultiplyArrays(AsyncMixin):
     async def reduce_degree_share_array(context: Mpc, x_2t: ShareArray):
         assert x_2t.t == context.t * 2
 
-        r_t, r_2t = [], []
-        for _ in range(len(x_2t)):
-            r_t_, r_2t_ = context.preproc.get_double_shares(context)
-            r_t.append(r_t_)
-            r_2t.append(r_2t_)
-
-        q_t = context.ShareArray(r_t)
-        q_2t = context.ShareArray(r_2t, 2 * context.t)
+        await context.preproc.wait_for(
+            context, PreProcessingConstants.DOUBLE_SHARES, len(x_2t), if_producing=True
+        )
+        q_t, q_2t = context.preproc.get_double_shares_array(context, len(x_2t))
         diff = await (x_2t - q_2t).open()
         return q_t + diff
 
@@ -111,6 +114,9 @@ class InvertShare(AsyncMixin):
     @staticmethod
     @TypeCheck()
     async def _prog(context: Mpc, x: Share):
+        await context.preproc.wait_for(
+            context, PreProcessingConstants.RANDS, if_producing=True
+        )
         r = context.preproc.get_rand(context)
         sig = await (x * r).open()
 
@@ -125,9 +131,10 @@ class InvertShareArray(AsyncMixin):
     @staticmethod
     @TypeCheck()
     async def _prog(context: Mpc, xs: ShareArray):
-        rs = context.ShareArray(
-            [context.preproc.get_rand(context) for _ in range(len(xs))]
+        await context.preproc.wait_for(
+            context, PreProcessingConstants.RANDS, len(xs), if_producing=True
         )
+        rs = context.preproc.get_rands_array(context, len(xs))
 
         sigs = await (await (xs * rs)).open()
         sig_invs = context.ShareArray([1 / sig for sig in sigs])
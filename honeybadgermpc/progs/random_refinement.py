@@ -1,19 +1,64 @@
 from honeybadgermpc.polynomial import EvalPoint
-from honeybadgermpc.reed_solomon import EncoderFactory
+from honeybadgermpc.reed_solomon import Algorithm, EncoderFactory
 
+# Refiners already set up, keyed by (n, t, modulus).
+_refiners = {}
 
-def refine_randoms(n, t, field, random_shares_int):
-    assert 3 * t + 1 <= n
 
-    # Number of nodes which have contributed values to this batch
-    k = len(random_shares_int)
-    assert k >= n - t and k <= n
+class RandomRefiner(object):
+    """Refines batches of random shares, each batch holding one share from each of
+    the parties which contributed to it, into shares of random values unknown to
+    any t parties.
+
+    The evaluation points (including omega) and the FFT encoder are set up once,
+    and many batches are refined with a single `fft_batch_evaluate` call.
+    """
+
+    def __init__(self, n, t, field):
+        assert 3 * t + 1 <= n
+        self.n, self.t, self.field = n, t, field
+        self.encoder = EncoderFactory.get(
+            EvalPoint(field, n, use_omega_powers=True), Algorithm.FFT
+        )
+
+    def refine(self, batches):
+        """Refine the given batches of random shares.
+
+        Arguments:
+            batches {list[list[int]]} -- Batches of random shares, each with
+            between n-t and n shares.
+
+        Returns:
+            list[int] -- Refined shares of all batches, in order.
+        """
+        if not batches:
+            return []
 
-    encoder = EncoderFactory.get(EvalPoint(field, n, use_omega_powers=True))
+        for batch in batches:
+            # Number of nodes which have contributed values to this batch
+            assert len(batch) >= self.n - self.t and len(batch) <= self.n
 
-    # Assume these shares to be the coefficients of a random polynomial. The
-    # refined shares are evaluations of this polynomial at powers of omega.
-    output_shares_int = encoder.encode(random_shares_int)
+        # Assume the shares of each batch to be the coefficients of a random
+        # polynomial. The refined shares are evaluations of this polynomial at
+        # powers of omega.
+        output_shares_int = self.encoder.encode_batch([list(b) for b in batches])
 
-    # Remove `t` shares since they might have been contributed by corrupt parties.
-    return output_shares_int[: k - t]
+        # Remove `t` shares of each batch since they might have been contributed by
+        # corrupt parties.
+        return [
+            share
+            for batch, shares in zip(batches, output_shares_int)
+            for share in shares[: len(batch) - self.t]
+        ]
+
+
+def get_random_refiner(n, t, field):
+    """Get the RandomRefiner for n, t and field, setting it up on first use."""
+    key = (n, t, field.modulus)
+    if key not in _refiners:
+        _refiners[key] = RandomRefiner(n, t, field)
+    return _refiners[key]
+
+
+def refine_randoms(n, t, field, random_shares_int):
+    return get_random_refiner(n, t, field).refine([random_shares_int])
@@ -1,4 +1,5 @@
 import asyncio
+from collections import defaultdict
 from honeybadgermpc.ntl import vandermonde_batch_evaluate
 from honeybadgermpc.ntl import vandermonde_batch_interpolate
 
@@ -29,62 +30,95 @@ async def refine_triples(context, a_dirty, b_dirty, c_dirty):
         list[Share] -- Shares of second part of the refined triples.
         list[Share] -- Shares of first*second part of the refined triples.
     """
+    [refined] = await refine_triples_batches(context, [(a_dirty, b_dirty, c_dirty)])
+    return refined
 
-    assert len(a_dirty) == len(b_dirty) == len(c_dirty)
+
+async def refine_triples_batches(context, batches):
+    """This method takes many batches of dirty triples and refines each of them,
+    as refine_triples does for a single batch.
+
+    Batches with the same number of dirty triples share their evaluation points,
+    so the polynomials of all of them are interpolated and evaluated together in
+    single NTL calls. The multiplications of all batches are done in a single
+    batch_beaver, so the number of rounds doesn't depend on the number of batches.
+
+    Arguments:
+        context {Mpc} -- MPC context.
+        batches {list[tuple]} -- (a_dirty, b_dirty, c_dirty) of each batch.
+
+    Returns:
+        list[tuple] -- (p, q, pq) refined triples of each batch, in order.
+    """
     n, t = context.N, context.t
-    m = len(a_dirty)
-    d = (m - 1) // 2  # d = 2*m + 1
     modulus = context.field.modulus
-    assert m >= n - t and m <= n
-
-    # Use the first `d+1` points to define the d-degree polynomials A() and B()
-    a, b = a_dirty[: d + 1], b_dirty[: d + 1]
-    a_coeffs = vandermonde_batch_interpolate(list(range(d + 1)), [a], modulus)[0]
-    b_coeffs = vandermonde_batch_interpolate(list(range(d + 1)), [b], modulus)[0]
-    assert len(a_coeffs) == len(b_coeffs) == d + 1
-
-    # Evaluate A() and B() at `d` more points
-    a_rest = vandermonde_batch_evaluate(
-        list(range(d + 1, 2 * d + 1)), [a_coeffs], modulus
-    )[0]
-    b_rest = vandermonde_batch_evaluate(
-        list(range(d + 1, 2 * d + 1)), [b_coeffs], modulus
-    )[0]
-    assert len(a_rest) == len(b_rest) == d
-
-    # Multiply these newly evaluated `d` points on A() and B() to
-    # obtain `d` more points on C() using batch beaver multiplication
-    x, y, z = (
-        a_dirty[d + 1 : 2 * d + 1],
-        b_dirty[d + 1 : 2 * d + 1],
-        c_dirty[d + 1 : 2 * d + 1],
-    )
-    assert len(x) == len(y) == len(z)
-    c_rest = await batch_beaver(context, a_rest, b_rest, x, y, z)
-    assert len(c_rest) == d
-
-    # The initial `d+1` points and the `d` points computed in the last step make a
-    # total of `2d+1` points which can now be used to completely define C() which
-    # is a 2d degree polynomial
-    c = c_dirty[: d + 1]
-    c_coeffs = vandermonde_batch_interpolate(
-        list(range(2 * d + 1)), [c + c_rest], modulus
-    )[0]
-    assert len(c_coeffs) == 2 * d + 1
-
-    # The total number of triples which can be extracted securely
-    k = d + 1 - t
-
-    # Evaluate the polynomial at `k` new points
-    p = vandermonde_batch_evaluate(list(range(n + 1, n + 1 + k)), [a_coeffs], modulus)[
-        0
-    ]
-    q = vandermonde_batch_evaluate(list(range(n + 1, n + 1 + k)), [b_coeffs], modulus)[
-        0
-    ]
-    pq = vandermonde_batch_evaluate(list(range(n + 1, n + 1 + k)), [c_coeffs], modulus)[
-        0
-    ]
 
-    assert len(p) == len(q) == len(pq) == k
-    return p, q, pq
+    # Group the batches by the degree `d` of their polynomials A() and B()
+    groups = defaultdict(list)
+    for i, (a_dirty, b_dirty, c_dirty) in enumerate(batches):
+        assert len(a_dirty) == len(b_dirty) == len(c_dirty)
+        m = len(a_dirty)
+        assert m >= n - t and m <= n
+        groups[(m - 1) // 2].append(i)
+
+    # Use the first `d+1` points to define the d-degree polynomials A() and B(),
+    # and evaluate them at `d` more points
+    a_coeffs, b_coeffs, a_rest, b_rest = {}, {}, {}, {}
+    for d, group in groups.items():
+        points = [batches[i][0][: d + 1] for i in group]
+        points += [batches[i][1][: d + 1] for i in group]
+        coeffs = vandermonde_batch_interpolate(list(range(d + 1)), points, modulus)
+        rest = vandermonde_batch_evaluate(
+            list(range(d + 1, 2 * d + 1)), coeffs, modulus
+        )
+        for j, i in enumerate(group):
+            a_coeffs[i], b_coeffs[i] = coeffs[j], coeffs[len(group) + j]
+            a_rest[i], b_rest[i] = rest[j], rest[len(group) + j]
+            assert len(a_coeffs[i]) == len(b_coeffs[i]) == d + 1
+            assert len(a_rest[i]) == len(b_rest[i]) == d
+
+    # Multiply these newly evaluated `d` points on A() and B() of every batch to
+    # obtain `d` more points on its C(), using a single batch beaver multiplication
+    a_, b_, x, y, z = [], [], [], [], []
+    for i, (a_dirty, b_dirty, c_dirty) in enumerate(batches):
+        d = len(a_rest[i])
+        a_ += a_rest[i]
+        b_ += b_rest[i]
+        x += a_dirty[d + 1 : 2 * d + 1]
+        y += b_dirty[d + 1 : 2 * d + 1]
+        z += c_dirty[d + 1 : 2 * d + 1]
+    c_rest_all = await batch_beaver(context, a_, b_, x, y, z)
+
+    c_rest, offset = {}, 0
+    for i in range(len(batches)):
+        d = len(a_rest[i])
+        c_rest[i] = c_rest_all[offset : offset + d]
+        offset += d
+    assert offset == len(c_rest_all)
+
+    refined = [None] * len(batches)
+    for d, group in groups.items():
+        # The initial `d+1` points and the `d` points computed in the last step make
+        # a total of `2d+1` points which can now be used to completely define C()
+        # which is a 2d degree polynomial
+        points = [batches[i][2][: d + 1] + c_rest[i] for i in group]
+        c_coeffs = vandermonde_batch_interpolate(
+            list(range(2 * d + 1)), points, modulus
+        )
+        assert all(len(coeffs) == 2 * d + 1 for coeffs in c_coeffs)
+
+        # The total number of triples which can be extracted securely
+        k = d + 1 - t
+
+        # Evaluate the polynomials at `k` new points
+        coeffs = [a_coeffs[i] for i in group] + [b_coeffs[i] for i in group] + c_coeffs
+        values = vandermonde_batch_evaluate(
+            list(range(n + 1, n + 1 + k)), coeffs, modulus
+        )
+        for j, i in enumerate(group):
+            p, q = values[j], values[len(group) + j]
+            pq = values[2 * len(group) + j]
+            assert len(p) == len(q) == len(pq) == k
+            refined[i] = (p, q, pq)
+
+    return refined
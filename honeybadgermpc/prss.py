@@ -0,0 +1,218 @@
+"""
+Pseudo-random secret sharing (PRSS), following Cramer, Damgard and Ishai,
+"Share Conversion, Pseudorandom Secret-Sharing and Applications to Secure
+Computation" (TCC 2005).
+
+Every set A of n - t parties shares a key k_A. Given a counter, each party i
+derives its share of a random value locally as
+
+    r_i = sum over A containing i of PRF(k_A, counter) * f_A(i)
+
+where f_A is the degree t polynomial with f_A(0) = 1 and f_A(j) = 0 for every
+party j outside A. Any t parties miss the key of the set made of all other
+parties, so the value is hidden from them. Random sharings of degree 2t replace
+PRF(k_A, counter) by q_A(i), with q_A the pseudo-random degree t polynomial whose
+j'th coefficient is PRF(k_A, counter, j).
+
+Sharings of zero of degree t are derived from a key common to all parties.
+Any t shares of such a sharing, together with the constant term being 0,
+determine the whole polynomial, so this reveals nothing which dealer generated
+zeros wouldn't.
+
+Once keys are set up, rands and zeros need no communication and no storage.
+The number of keys grows as (n choose t), so this is meant for small n.
+"""
+import os
+from collections import defaultdict
+from hashlib import blake2b
+from itertools import combinations
+
+from .preprocessing import PreProcessedElements
+
+PRSS_KEY_SIZE = 32
+
+
+def prss_subsets(n, t):
+    """ All of the sets of n - t parties which are assigned a PRSS key.
+    """
+    return list(combinations(range(n), n - t))
+
+
+def deal_prss_keys(n, t):
+    """ Trusted setup of PRSS keys, for testing and benchmarking.
+
+    outputs:
+        List whose i'th entry maps each set of parties containing i (including
+        the set of all parties) to its key
+    """
+    keys = [{} for _ in range(n)]
+    for subset in prss_subsets(n, t) + [tuple(range(n))]:
+        key = os.urandom(PRSS_KEY_SIZE)
+        for i in subset:
+            keys[i][subset] = key
+
+    return keys
+
+
+async def distribute_prss_keys(n, t, myid, send, recv):
+    """ Set up PRSS keys: the party with the lowest id in each set picks the key
+    for that set and sends it to the other parties in the set.
+
+    outputs:
+        Dictionary mapping each set of parties containing myid to its key
+    """
+    subsets = [s for s in prss_subsets(n, t) + [tuple(range(n))] if myid in s]
+
+    keys = {}
+    for subset in subsets:
+        if subset[0] != myid:
+            continue
+
+        keys[subset] = os.urandom(PRSS_KEY_SIZE)
+        for j in subset[1:]:
+            send(j, (subset, keys[subset]))
+
+    while len(keys) < len(subsets):
+        sender, (subset, key) = await recv()
+        assert (
+            subset in subsets and subset[0] == sender
+        ), f"Unexpected PRSS key for {subset} from {sender}"
+        keys[subset] = key
+
+    return keys
+
+
+class PRSS(object):
+    """ Derives shares of random values and of zero for one party from its PRSS
+    keys. Parties stay in sync as long as they request the same kinds of values in
+    the same order.
+    """
+
+    def __init__(self, field, n, t, myid, keys):
+        self.field = field
+        self.n = n
+        self.t = t
+        self.myid = myid
+
+        modulus = field.modulus
+        x = myid + 1
+        self._x_powers = [pow(x, j, modulus) for j in range(t + 1)]
+
+        # Each key together with f_A(x) for this party
+        self._weighted_keys = []
+        for subset in prss_subsets(n, t):
+            if myid not in subset:
+                continue
+
+            weight = 1
+            for j in set(range(n)) - set(subset):
+                weight = weight * (j + 1 - x) * pow(j + 1, modulus - 2, modulus)
+            self._weighted_keys.append((keys[subset], weight % modulus))
+
+        self._common_key = keys[tuple(range(n))]
+        self._digest_size = (modulus.bit_length() + 7) // 8 + 16
+        self._counters = defaultdict(int)
+
+    def _prf(self, key, label, counter, index=0):
+        """ Pseudo-random field element derived from key, with 128 more bits than
+        the modulus so that the reduction is close to uniform.
+        """
+        message = label + counter.to_bytes(8, "little") + index.to_bytes(4, "little")
+        digest = blake2b(message, key=key, digest_size=self._digest_size).digest()
+        return int.from_bytes(digest, "little") % self.field.modulus
+
+    def _next_counter(self, label):
+        counter = self._counters[label]
+        self._counters[label] += 1
+        return counter
+
+    def rand(self):
+        """ Share of a random value, of degree t.
+        """
+        counter = self._next_counter(b"rand")
+        share = 0
+        for key, weight in self._weighted_keys:
+            share += self._prf(key, b"rand", counter) * weight
+
+        return share % self.field.modulus
+
+    def rand_2t(self):
+        """ Share of a random value, of degree 2t.
+        """
+        counter = self._next_counter(b"rand2t")
+        share = 0
+        for key, weight in self._weighted_keys:
+            q = sum(
+                self._prf(key, b"rand2t", counter, j) * x_j
+                for j, x_j in enumerate(self._x_powers)
+            )
+            share += q * weight
+
+        return share % self.field.modulus
+
+    def zero(self):
+        """ Share of zero, of degree t.
+        """
+        counter = self._next_counter(b"zero")
+        share = sum(
+            self._prf(self._common_key, b"zero", counter, j) * self._x_powers[j]
+            for j in range(1, self.t + 1)
+        )
+
+        return share % self.field.modulus
+
+
+class PRSSPreProcessedElements(object):
+    """ Preprocessing accessor which derives rands (of degree t or 2t) and zeros
+    locally with PRSS, and delegates every other kind of preprocessing to a
+    PreProcessedElements. Pass it as the preproc of an Mpc program.
+    """
+
+    def __init__(self, prss, preproc=None):
+        """
+        args:
+            prss: PRSS objects of the parties using this accessor
+            preproc: PreProcessedElements to use for other kinds of preprocessing
+        """
+        self._prss = {(p.myid, p.n, p.t): p for p in prss}
+        self._preproc = preproc if preproc is not None else PreProcessedElements()
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._preproc, name)
+
+    def _get_prss(self, context):
+        return self._prss[context.myid, context.N, context.t]
+
+    def _rand_generator(self, context, t):
+        """ Returns the function producing rands of degree t, and that degree.
+        """
+        prss = self._get_prss(context)
+        if t is None or t == context.t:
+            return prss.rand, context.t
+        elif t == 2 * context.t:
+            return prss.rand_2t, t
+
+        raise ValueError(f"PRSS only provides rands of degree t or 2t, not {t}")
+
+    def get_rand(self, context, t=None):
+        rand, t = self._rand_generator(context, t)
+        return context.Share(rand(), t)
+
+    def get_zero(self, context):
+        return context.Share(self._get_prss(context).zero())
+
+    def get_rands_array(self, context, k, t=None):
+        rand, t = self._rand_generator(context, t)
+        return context.ShareArray([rand() for _ in range(k)], t)
+
+    def get_zeros_array(self, context, k):
+        prss = self._get_prss(context)
+        return context.ShareArray([prss.zero() for _ in range(k)])
+
+    def generate_rands(self, k, n, t, processes=None):
+        pass
+
+    def generate_zeros(self, k, n, t, processes=None):
+        pass
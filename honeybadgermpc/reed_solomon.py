@@ -1,5 +1,5 @@
 from honeybadgermpc.ntl import vandermonde_batch_evaluate, vandermonde_batch_interpolate
-from honeybadgermpc.ntl import gao_interpolate
+from honeybadgermpc.ntl import gao_interpolate, wb_interpolate, wb_batch_interpolate
 from honeybadgermpc.ntl import (
     fft,
     fft_interpolate,
@@ -8,13 +8,25 @@ from honeybadgermpc.ntl import (
     SetNumThreads,
     AvailableNTLThreads,
 )
-from honeybadgermpc.reed_solomon_wb import make_wb_encoder_decoder
 from honeybadgermpc.exceptions import HoneyBadgerMPCError
+import asyncio
+import json
 import logging
+import math
+import os
 import psutil
 from abc import ABC, abstractmethod
 
 
+async def run_in_executor(executor, func, *args):
+    """Run a blocking codec call in `executor` so the event loop stays responsive.
+    The NTL routines release the GIL, so several of these can use multiple cores.
+    If `executor` is None, the event loop's default thread pool is used.
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(executor, func, *args)
+
+
 class Encoder(ABC):
     """
     Generate encoding for given data
@@ -41,6 +53,10 @@ class Encoder(ABC):
         """
         raise NotImplementedError
 
+    async def encode_batch_async(self, data, executor=None):
+        """Same as `encode_batch`, but runs in `executor`"""
+        return await run_in_executor(executor, self.encode_batch, data)
+
 
 class Decoder(ABC):
     """
@@ -70,6 +86,10 @@ class Decoder(ABC):
         """
         raise NotImplementedError
 
+    async def decode_batch_async(self, z, encoded, executor=None):
+        """Same as `decode_batch`, but runs in `executor`"""
+        return await run_in_executor(executor, self.decode_batch, z, encoded)
+
 
 class RobustDecoder(ABC):
     @abstractmethod
@@ -81,6 +101,10 @@ class RobustDecoder(ABC):
         """
         raise NotImplementedError
 
+    async def robust_decode_async(self, z, encoded, executor=None):
+        """Same as `robust_decode`, but runs in `executor`"""
+        return await run_in_executor(executor, self.robust_decode, z, encoded)
+
 
 class VandermondeEncoder(Encoder):
     def __init__(self, point):
@@ -189,37 +213,43 @@ class WelchBerlekampRobustDecoder(RobustDecoder):
         self.d = d
         self.modulus = point.field.modulus
         self.point = point
-        _, dec, _ = make_wb_encoder_decoder(
-            self.n, self.d + 1, self.modulus, self.point
-        )
-        self._dec = dec
 
-    def robust_decode(self, z, encoded):
-        m = {zi: i for i, zi in enumerate(z)}
-        enc_extended = [
-            self.point.field(encoded[m[i]]) if i in m else None for i in range(self.n)
+    def _find_errors(self, coeffs, encoded_by_party):
+        x = [self.point(i).value for i in range(self.point.n)]
+        poly_eval = vandermonde_batch_evaluate(x, [coeffs], self.modulus)[0]
+        return [
+            i
+            for i, value in sorted(encoded_by_party.items())
+            if value % self.modulus != poly_eval[i]
         ]
-        try:
-            coeffs = self._dec(enc_extended)
-        except Exception as e:
-            # Welch-Berlekamp doesn't throw any specific exceptions.
-            # Just catch 'em all
-            if str(e) not in ("Wrong degree", "found no divisors!"):
-                raise e
-            coeffs = None
-
-        if coeffs is not None:
-            coeffs = [c.value for c in coeffs]
-            x = [self.point(i).value for i in range(self.point.n)]
-            poly_eval = vandermonde_batch_evaluate(x, [coeffs], self.modulus)[0]
-            errors = [
-                i
-                for i in range(self.point.n)
-                if enc_extended[i] is not None and enc_extended[i].value != poly_eval[i]
-            ]
-
-            return coeffs, errors
-        return None, None
+
+    def robust_decode(self, z, encoded):
+        x = [self.point(zi).value for zi in z]
+        coeffs = wb_interpolate(x, encoded, self.d + 1, self.modulus)
+        if coeffs is None:
+            return None, None
+
+        received = {zi: e for zi, e in zip(z, encoded) if e is not None}
+        return coeffs, self._find_errors(coeffs, received)
+
+    def robust_decode_batch(self, z, encoded):
+        """Decode several received words which were all sent by the parties in z
+
+        :type z: list of integers
+        :type encoded: list of lists of integers
+        :return: list of (decoded values or None, error locations) tuples
+        """
+        x = [self.point(zi).value for zi in z]
+        decoded = wb_batch_interpolate(x, encoded, self.d + 1, self.modulus)
+
+        results = []
+        for coeffs, word in zip(decoded, encoded):
+            if coeffs is None:
+                results.append((None, None))
+            else:
+                received = dict(zip(z, word))
+                results.append((coeffs, self._find_errors(coeffs, received)))
+        return results
 
 
 class DecodeValidationError(HoneyBadgerMPCError):
@@ -361,12 +391,14 @@ class IncrementalDecoder(object):
         if self._num_decoded == self.batch_size:
             self._result = self._partial_result
 
-    # Public API
-    def add(self, idx, data):
+    def _buffer(self, idx, data):
+        """ Store the data received from idx. Returns whether there is decoding to
+        do, i.e. whether _update should be called.
+        """
         if self.done():
-            return
+            return False
         elif idx in self._available_points or idx in self._confirmed_errors:
-            return
+            return False
 
         if not self._validate(data):
             logging.error("Validation failed for data from %d: %s", idx, str(data))
@@ -381,8 +413,16 @@ class IncrementalDecoder(object):
 
         # Nothing to do
         if len(self._available_points) <= self.degree:
-            return
+            return False
 
+        return (
+            self._optimistic
+            or len(self._available_points) >= self._min_points_required()
+        )
+
+    def _update(self, idx, data):
+        """ Decode with the data buffered, after data was added from idx.
+        """
         # I'm still optimistic. Let's guess or validate guess
         if self._optimistic and self._optimistic_update(idx, data):
             return
@@ -391,6 +431,20 @@ class IncrementalDecoder(object):
         if len(self._available_points) >= self._min_points_required():
             self._robust_update()
 
+    # Public API
+    def add(self, idx, data):
+        if self._buffer(idx, data):
+            self._update(idx, data)
+
+    async def add_async(self, idx, data, executor=None):
+        """Same as `add`, but the decoding runs in `executor` instead of blocking
+        the event loop. Data which doesn't allow any decoding yet is only buffered,
+        without leaving the event loop. Calls must not overlap: await each one
+        before adding more data.
+        """
+        if self._buffer(idx, data):
+            await run_in_executor(executor, self._update, idx, data)
+
     def done(self):
         return self._result is not None
 
@@ -400,6 +454,143 @@ class IncrementalDecoder(object):
         return None, None
 
 
+class CodecCalibration(object):
+    """Timings of the Vandermonde and FFT codecs measured on this machine.
+
+    Each result records how long an operation ("encode" or "decode") took with
+    both codecs for a given n, batch size and thread count. Lookups use the
+    measurement closest to the requested parameters (on a log scale for n and
+    batch size). Calibration files are generated by
+    `honeybadgermpc.reed_solomon_calibration`.
+    """
+
+    # Environment variable which can be used to override the default file location
+    PATH_ENV_VAR = "HBMPC_RS_CALIBRATION"
+    DEFAULT_PATH = os.path.expanduser("~/.hbmpc/reed_solomon_calibration.json")
+    VERSION = 1
+
+    def __init__(self, results, metadata=None):
+        self.results = results
+        self.metadata = metadata if metadata is not None else {}
+
+    @classmethod
+    def default_path(cls):
+        return os.environ.get(cls.PATH_ENV_VAR, cls.DEFAULT_PATH)
+
+    @classmethod
+    def load(cls, path=None):
+        """Returns the calibration stored at `path`, or None if there is no valid
+        calibration file there.
+        """
+        path = cls.default_path() if path is None else path
+        if not os.path.isfile(path):
+            return None
+
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            logging.warning("Ignoring unreadable codec calibration file: %s", path)
+            return None
+
+        if data.get("version") != cls.VERSION:
+            logging.warning("Ignoring outdated codec calibration file: %s", path)
+            return None
+
+        return cls(data["results"], data.get("metadata"))
+
+    def save(self, path=None):
+        path = self.default_path() if path is None else path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "version": self.VERSION,
+                    "metadata": self.metadata,
+                    "results": self.results,
+                },
+                f,
+                indent=2,
+            )
+
+    def _nearest(self, op, n, k, threads=None):
+        """Results for `op` measured at the grid point nearest to (n, k), restricted
+        to the nearest thread count if `threads` is given.
+        """
+        results = [r for r in self.results if r["op"] == op]
+        if len(results) == 0:
+            return []
+
+        def distance(r):
+            return abs(math.log2(r["n"]) - math.log2(n)) + abs(
+                math.log2(r["batch_size"]) - math.log2(max(k, 1))
+            )
+
+        best = min(distance(r) for r in results)
+        results = [r for r in results if distance(r) == best]
+        if threads is not None:
+            closest = min(abs(r["threads"] - threads) for r in results)
+            results = [r for r in results if abs(r["threads"] - threads) == closest]
+        return results
+
+    def best_algorithm(self, op, n, k, threads):
+        """Returns the fastest algorithm for the given parameters or None if there
+        is no measurement for `op`.
+        """
+        results = self._nearest(op, n, k, threads)
+        if len(results) == 0:
+            return None
+
+        result = results[0]
+        if result[Algorithm.FFT] < result[Algorithm.VANDERMONDE]:
+            return Algorithm.FFT
+        return Algorithm.VANDERMONDE
+
+    def best_thread_count(self, op, n, k):
+        """Returns the thread count with the lowest time for the given parameters or
+        None if there is no measurement for `op`.
+        """
+        results = self._nearest(op, n, k)
+        if len(results) == 0:
+            return None
+
+        def fastest(r):
+            return min(r[Algorithm.FFT], r[Algorithm.VANDERMONDE])
+
+        return min(results, key=lambda r: (fastest(r), r["threads"]))["threads"]
+
+
+_calibration = None
+_calibration_loaded = False
+
+
+def get_calibration():
+    """Returns the codec calibration for this machine, loading it on first use.
+    None is returned when no calibration file exists.
+    """
+    global _calibration, _calibration_loaded
+    if not _calibration_loaded:
+        _calibration = CodecCalibration.load()
+        _calibration_loaded = True
+    return _calibration
+
+
+def set_calibration(calibration):
+    """Override the calibration used by the selectors. Pass None to fall back to
+    the built-in heuristics.
+    """
+    global _calibration, _calibration_loaded
+    _calibration = calibration
+    _calibration_loaded = True
+
+
+def _default_thread_count(k):
+    return min(k, psutil.cpu_count(logical=False))
+
+
 class EncoderSelector(object):
     # If n is lesser than this value, always pick Vandermonde
     LOW_VAN_THRESHOLD = 8
@@ -407,13 +598,28 @@ class EncoderSelector(object):
     HIGH_VAN_THRESHOLD = 128
 
     @staticmethod
-    def set_optimal_thread_count(k):
-        SetNumThreads(min(k, psutil.cpu_count(logical=False)))
+    def set_optimal_thread_count(k, n=None):
+        calibration = get_calibration()
+        threads = None
+        if calibration is not None and n is not None:
+            threads = calibration.best_thread_count("encode", n, k)
+        SetNumThreads(threads or _default_thread_count(k))
 
     @staticmethod
     def select(point, k):
         assert point.use_omega_powers is True
         n = point.n
+
+        calibration = get_calibration()
+        if calibration is not None:
+            algorithm = calibration.best_algorithm(
+                "encode", n, k, AvailableNTLThreads()
+            )
+            if algorithm == Algorithm.VANDERMONDE:
+                return VandermondeEncoder(point)
+            elif algorithm == Algorithm.FFT:
+                return FFTEncoder(point)
+
         if n < EncoderSelector.LOW_VAN_THRESHOLD:
             return VandermondeEncoder(point)
         if n >= EncoderSelector.HIGH_VAN_THRESHOLD:
@@ -439,17 +645,30 @@ class DecoderSelector(object):
     BATCH_SIZE_THRESH_SLOPE = 0.5
 
     @staticmethod
-    def set_optimal_thread_count(k):
-        SetNumThreads(min(k, psutil.cpu_count(logical=False)))
+    def set_optimal_thread_count(k, n=None):
+        calibration = get_calibration()
+        threads = None
+        if calibration is not None and n is not None:
+            threads = calibration.best_thread_count("decode", n, k)
+        SetNumThreads(threads or _default_thread_count(k))
 
     @staticmethod
     def select(point, k):
         assert point.use_omega_powers is True
         n = point.n
+        nt = AvailableNTLThreads()
+
+        calibration = get_calibration()
+        if calibration is not None:
+            algorithm = calibration.best_algorithm("decode", n, k, nt)
+            if algorithm == Algorithm.VANDERMONDE:
+                return VandermondeDecoder(point)
+            elif algorithm == Algorithm.FFT:
+                return FFTDecoder(point)
+
         if n < DecoderSelector.LOW_VAN_THRESHOLD:
             return VandermondeDecoder(point)
 
-        nt = AvailableNTLThreads()
         if k > DecoderSelector.BATCH_SIZE_THRESH_SLOPE * n * nt:
             return VandermondeDecoder(point)
         else:
@@ -464,11 +683,11 @@ class OptimalEncoder(Encoder):
         self.point = point
 
     def encode_one(self, data):
-        EncoderSelector.set_optimal_thread_count(1)
+        EncoderSelector.set_optimal_thread_count(1, self.point.n)
         return EncoderSelector.select(self.point, 1).encode_one(data)
 
     def encode_batch(self, data):
-        EncoderSelector.set_optimal_thread_count(len(data))
+        EncoderSelector.set_optimal_thread_count(len(data), self.point.n)
         return EncoderSelector.select(self.point, len(data)).encode_batch(data)
 
 
@@ -480,11 +699,11 @@ class OptimalDecoder(Decoder):
         self.point = point
 
     def decode_one(self, z, data):
-        DecoderSelector.set_optimal_thread_count(1)
+        DecoderSelector.set_optimal_thread_count(1, self.point.n)
         return DecoderSelector.select(self.point, 1).decode_one(z, data)
 
     def decode_batch(self, z, data):
-        DecoderSelector.set_optimal_thread_count(len(data))
+        DecoderSelector.set_optimal_thread_count(len(data), self.point.n)
         return DecoderSelector.select(self.point, len(data)).decode_batch(z, data)
 
 
@@ -0,0 +1,131 @@
+"""
+Benchmarks the Vandermonde and FFT codecs on the current machine and stores
+the results so that `EncoderSelector` and `DecoderSelector` can pick the
+faster one.
+
+Run with:
+    python -m honeybadgermpc.reed_solomon_calibration [-o PATH]
+"""
+import logging
+import platform
+import random
+import time
+from argparse import ArgumentParser
+
+import psutil
+
+from honeybadgermpc.elliptic_curve import Subgroup
+from honeybadgermpc.field import GF
+from honeybadgermpc.ntl import SetNumThreads
+from honeybadgermpc.polynomial import EvalPoint
+from honeybadgermpc.reed_solomon import (
+    Algorithm,
+    CodecCalibration,
+    FFTDecoder,
+    FFTEncoder,
+    VandermondeDecoder,
+    VandermondeEncoder,
+)
+
+DEFAULT_NS = [4, 8, 16, 32, 64, 128, 256]
+DEFAULT_BATCH_SIZES = [1, 16, 256, 4096]
+
+
+def default_thread_counts():
+    cores = psutil.cpu_count(logical=False) or 1
+    counts, threads = [], 1
+    while threads < cores:
+        counts.append(threads)
+        threads *= 2
+    return counts + [cores]
+
+
+def _time(func, *args, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+
+def calibrate(
+    ns=DEFAULT_NS,
+    batch_sizes=DEFAULT_BATCH_SIZES,
+    thread_counts=None,
+    repeat=3,
+    field=GF(Subgroup.BLS12_381),
+):
+    """Time both codecs for encoding and decoding over every combination of
+    n, batch size and thread count and return the resulting `CodecCalibration`.
+    """
+    if thread_counts is None:
+        thread_counts = default_thread_counts()
+
+    modulus = field.modulus
+    results = []
+    for n in ns:
+        point = EvalPoint(field, n, use_omega_powers=True)
+        t = (n - 1) // 3
+        z = list(range(t + 1))
+        encoders = {
+            Algorithm.VANDERMONDE: VandermondeEncoder(point),
+            Algorithm.FFT: FFTEncoder(point),
+        }
+        decoders = {
+            Algorithm.VANDERMONDE: VandermondeDecoder(point),
+            Algorithm.FFT: FFTDecoder(point),
+        }
+
+        for k in batch_sizes:
+            coeffs = [
+                [random.randint(0, modulus - 1) for _ in range(t + 1)] for _ in range(k)
+            ]
+            encoded = encoders[Algorithm.VANDERMONDE].encode_batch(coeffs)
+            received = [[row[zi] for zi in z] for row in encoded]
+
+            for threads in thread_counts:
+                SetNumThreads(threads)
+                encode = {"op": "encode", "n": n, "batch_size": k, "threads": threads}
+                decode = {"op": "decode", "n": n, "batch_size": k, "threads": threads}
+                for algorithm in [Algorithm.VANDERMONDE, Algorithm.FFT]:
+                    encode[algorithm] = _time(
+                        encoders[algorithm].encode_batch, coeffs, repeat=repeat
+                    )
+                    decode[algorithm] = _time(
+                        decoders[algorithm].decode_batch, z, received, repeat=repeat
+                    )
+                logging.info("Calibrated %s", encode)
+                logging.info("Calibrated %s", decode)
+                results += [encode, decode]
+
+    metadata = {
+        "host": platform.node(),
+        "physical_cores": psutil.cpu_count(logical=False),
+        "logical_cores": psutil.cpu_count(logical=True),
+        "modulus": modulus,
+        "timestamp": time.time(),
+    }
+    return CodecCalibration(results, metadata)
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Calibrate Reed-Solomon codec selection.")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default=CodecCalibration.default_path(),
+        help="Where to write the calibration file.",
+    )
+    parser.add_argument("--ns", type=int, nargs="+", default=DEFAULT_NS)
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=DEFAULT_BATCH_SIZES
+    )
+    parser.add_argument("--threads", type=int, nargs="+", default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    calibration = calibrate(args.ns, args.batch_sizes, args.threads, args.repeat)
+    calibration.save(args.output)
+    logging.info("Wrote codec calibration to %s", args.output)
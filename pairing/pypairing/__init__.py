@@ -11,6 +11,9 @@ from .pypairing import (
     PyFq12,
     PyFqRepr,
     vec_sum,
+    g1_multiexp,
+    g2_multiexp,
+    py_multi_pairing,
 )
 
 __all__ = [
@@ -23,4 +26,7 @@ __all__ = [
     "PyFq12",
     "PyFqRepr",
     "vec_sum",
+    "g1_multiexp",
+    "g2_multiexp",
+    "py_multi_pairing",
 ]
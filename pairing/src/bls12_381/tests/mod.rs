@@ -609,3 +609,39 @@ fn test_g2_compressed_invalid_vectors() {
         }
     }
 }
+
+#[test]
+fn test_pptable_round_trip() {
+    use pptable;
+    use rand::{Rand, SeedableRng, XorShiftRng};
+    use std::env;
+
+    let mut rng = XorShiftRng::from_seed([0x5dbe6259, 0x8d313d76, 0x3237db17, 0xe5bc0654]);
+    let level = 3;
+    let size = pptable::table_size(level);
+    let g1s: Vec<G1> = (0..size).map(|_| G1::rand(&mut rng)).collect();
+    let g2s: Vec<G2> = (0..size).map(|_| G2::rand(&mut rng)).collect();
+    let fq12s: Vec<Fq12> = (0..size).map(|_| Fq12::rand(&mut rng)).collect();
+
+    let path = env::temp_dir().join(format!("pptable-{}", ::std::process::id()));
+    let path = path.to_str().unwrap();
+
+    pptable::save(path, level, &g1s).unwrap();
+    assert_eq!(pptable::load(path, level, &g1s[0]).unwrap(), g1s);
+    assert!(pptable::load(path, level + 1, &g1s[0]).is_err());
+
+    // A table of another element is rejected
+    assert!(pptable::load(path, level, &g1s[1]).is_err());
+
+    pptable::save(path, level, &g2s).unwrap();
+    assert_eq!(pptable::load(path, level, &g2s[0]).unwrap(), g2s);
+
+    pptable::save(path, level, &fq12s).unwrap();
+    assert_eq!(pptable::load(path, level, &fq12s[0]).unwrap(), fq12s);
+
+    // A table which is too short is rejected
+    pptable::save(path, level, &g1s[1..]).unwrap();
+    assert!(pptable::load(path, level, &g1s[1]).is_err());
+
+    ::std::fs::remove_file(path).unwrap();
+}
@@ -16,6 +16,7 @@
 extern crate pyo3;
 
 use pyo3::prelude::*;
+use pyo3::exc;
 
 
 extern crate byteorder;
@@ -27,9 +28,17 @@ extern crate rand;
 pub mod tests;
 
 pub mod bls12_381;
-use bls12_381::{G1, G2, Fr, Fq, Fq2, Fq6, Fq12, FqRepr, FrRepr};
+use bls12_381::{Bls12, G1, G2, Fr, Fq, Fq2, Fq6, Fq12, FqRepr, FrRepr};
 mod wnaf;
 pub use self::wnaf::Wnaf;
+mod multiexp;
+use multiexp::multiexp;
+mod multipairing;
+use multipairing::multi_pairing;
+mod pptable;
+
+// Number of bases from which multiexps release the GIL while they compute.
+const MULTIEXP_ALLOW_THREADS_MIN_SIZE: usize = 64;
 
 use ff::{Field,  PrimeField, PrimeFieldDecodingError, PrimeFieldRepr, ScalarEngine, SqrtField};
 use std::error::Error;
@@ -158,6 +167,10 @@ fn py_pairing(g1: &PyG1, g2: &PyG2) -> PyResult<()> {
     Ok(())
 }
 
+fn os_error(e: io::Error) -> PyErr {
+    PyErr::new::<exc::OSError, _>(e.to_string())
+}
+
 #[pyclass]
 struct PyG1 {
    g1 : G1,
@@ -356,6 +369,19 @@ impl PyG1 {
         //It's not really Ok. This is terrible.
         Ok(())
     }
+    /// Writes the table built by preprocess to the file at path.
+    fn save_pp(&self, path: &str) -> PyResult<()> {
+        pptable::save(path, self.pplevel, &self.pp).map_err(os_error)
+    }
+
+    /// Loads a table saved by save_pp, instead of building it with preprocess.
+    /// Fails if the table was saved from an element other than this one.
+    fn load_pp(&mut self, path: &str, level: usize) -> PyResult<()> {
+        self.pp = pptable::load(path, level, &self.g1).map_err(os_error)?;
+        self.pplevel = level;
+        Ok(())
+    }
+
     fn ppmul(&self, prodend: &PyFr, out: &mut PyG1) -> PyResult<()>
     {
         if self.pp.len() == 0
@@ -572,6 +598,19 @@ impl PyG2 {
         }
         Ok(())
     }
+    /// Writes the table built by preprocess to the file at path.
+    fn save_pp(&self, path: &str) -> PyResult<()> {
+        pptable::save(path, self.pplevel, &self.pp).map_err(os_error)
+    }
+
+    /// Loads a table saved by save_pp, instead of building it with preprocess.
+    /// Fails if the table was saved from an element other than this one.
+    fn load_pp(&mut self, path: &str, level: usize) -> PyResult<()> {
+        self.pp = pptable::load(path, level, &self.g2).map_err(os_error)?;
+        self.pplevel = level;
+        Ok(())
+    }
+
     fn ppmul(&self, prodend: &PyFr, out: &mut PyG2) -> PyResult<()>
     {
         if self.pp.len() == 0
@@ -925,6 +964,19 @@ impl PyFq12 {
         }
         Ok(())
     }
+    /// Writes the table built by preprocess to the file at path.
+    fn save_pp(&self, path: &str) -> PyResult<()> {
+        pptable::save(path, self.pplevel, &self.pp).map_err(os_error)
+    }
+
+    /// Loads a table saved by save_pp, instead of building it with preprocess.
+    /// Fails if the table was saved from an element other than this one.
+    fn load_pp(&mut self, path: &str, level: usize) -> PyResult<()> {
+        self.pp = pptable::load(path, level, &self.fq12).map_err(os_error)?;
+        self.pplevel = level;
+        Ok(())
+    }
+
     fn pppow(&self, prodend: &PyFr, out: &mut PyFq12) -> PyResult<()>
     {
         if self.pp.len() == 0
@@ -1003,6 +1055,83 @@ fn vec_sum(a: &PyList) -> PyResult<String>{
     Ok(format!("{}",sum))
 }
 
+/// Sets out to the sum of bases[i] * scalars[i], using Pippenger's method.
+#[pyfunction]
+fn g1_multiexp(bases: &PyList, scalars: &PyList, out: &mut PyG1) -> PyResult<()> {
+    let mut g1s = Vec::with_capacity(bases.len());
+    for item in bases.iter(){
+        let myg1: &PyG1 = item.try_into().unwrap();
+        g1s.push(myg1.g1);
+    }
+    let mut frs = Vec::with_capacity(scalars.len());
+    for item in scalars.iter(){
+        let myfr: &PyFr = item.try_into().unwrap();
+        frs.push(myfr.fr.into_repr());
+    }
+    if g1s.len() >= MULTIEXP_ALLOW_THREADS_MIN_SIZE {
+        let gil = Python::acquire_gil();
+        out.g1 = gil.python().allow_threads(|| multiexp(&g1s, &frs));
+    }
+    else {
+        out.g1 = multiexp(&g1s, &frs);
+    }
+    if out.pplevel != 0 {
+        out.pp = Vec::new();
+        out.pplevel = 0;
+    }
+    Ok(())
+}
+
+/// Sets out to the sum of bases[i] * scalars[i], using Pippenger's method.
+#[pyfunction]
+fn g2_multiexp(bases: &PyList, scalars: &PyList, out: &mut PyG2) -> PyResult<()> {
+    let mut g2s = Vec::with_capacity(bases.len());
+    for item in bases.iter(){
+        let myg2: &PyG2 = item.try_into().unwrap();
+        g2s.push(myg2.g2);
+    }
+    let mut frs = Vec::with_capacity(scalars.len());
+    for item in scalars.iter(){
+        let myfr: &PyFr = item.try_into().unwrap();
+        frs.push(myfr.fr.into_repr());
+    }
+    if g2s.len() >= MULTIEXP_ALLOW_THREADS_MIN_SIZE {
+        let gil = Python::acquire_gil();
+        out.g2 = gil.python().allow_threads(|| multiexp(&g2s, &frs));
+    }
+    else {
+        out.g2 = multiexp(&g2s, &frs);
+    }
+    if out.pplevel != 0 {
+        out.pp = Vec::new();
+        out.pplevel = 0;
+    }
+    Ok(())
+}
+
+/// Sets out to the product of the pairings of g1s[i] and g2s[i], computed with a
+/// single Miller loop and final exponentiation.
+#[pyfunction]
+fn py_multi_pairing(g1s: &PyList, g2s: &PyList, out: &mut PyFq12) -> PyResult<()> {
+    let mut a = Vec::with_capacity(g1s.len());
+    for item in g1s.iter(){
+        let myg1: &PyG1 = item.try_into().unwrap();
+        a.push(myg1.g1);
+    }
+    let mut b = Vec::with_capacity(g2s.len());
+    for item in g2s.iter(){
+        let myg2: &PyG2 = item.try_into().unwrap();
+        b.push(myg2.g2);
+    }
+    let gil = Python::acquire_gil();
+    out.fq12 = gil.python().allow_threads(|| multi_pairing::<Bls12>(&a, &b));
+    if out.pplevel != 0 {
+        out.pp = Vec::new();
+        out.pplevel = 0;
+    }
+    Ok(())
+}
+
 #[pymodinit]
 fn pypairing(py: Python, m: &PyModule) -> PyResult<()> {
     m.add_class::<PyG1>()?;
@@ -1016,6 +1145,9 @@ fn pypairing(py: Python, m: &PyModule) -> PyResult<()> {
     m.add_function(wrap_function!(py_pairing)).unwrap();
     //m.add_function(wrap_function!(vec_sum))?;
     m.add_function(wrap_function!(vec_sum)).unwrap();
+    m.add_function(wrap_function!(g1_multiexp)).unwrap();
+    m.add_function(wrap_function!(g2_multiexp)).unwrap();
+    m.add_function(wrap_function!(py_multi_pairing)).unwrap();
     Ok(())
 }
 
@@ -0,0 +1,71 @@
+use super::{CurveProjective, PrimeField, PrimeFieldRepr};
+
+/// Returns the window size in bits used by `multiexp` for the given number of
+/// bases.
+fn multiexp_window(num_bases: usize) -> usize {
+    if num_bases < 32 {
+        3
+    } else {
+        (num_bases as f64).ln().ceil() as usize + 2
+    }
+}
+
+/// Returns the `window` bits of `scalar` starting at bit `start`.
+fn scalar_window<S: PrimeFieldRepr>(scalar: &S, start: usize, window: usize) -> usize {
+    let limbs = scalar.as_ref();
+    let mut digit = 0usize;
+    for i in 0..window {
+        let bit = start + i;
+        if bit < 64 * limbs.len() && (limbs[bit / 64] >> (bit % 64)) & 1 == 1 {
+            digit |= 1 << i;
+        }
+    }
+    digit
+}
+
+/// Computes the sum of `bases[i] * scalars[i]` with Pippenger's bucket method.
+///
+/// Scalars are split into windows of `c` bits. For each window, every base is
+/// added to the bucket of its digit, and the buckets are summed so that bucket
+/// `d` is counted `d` times. This takes about `(b/c) * (n + 2^c)` additions for
+/// `n` scalars of `b` bits, instead of about `n * b` for separate scalar
+/// multiplications.
+pub(crate) fn multiexp<G: CurveProjective>(
+    bases: &[G],
+    scalars: &[<G::Scalar as PrimeField>::Repr],
+) -> G {
+    assert_eq!(bases.len(), scalars.len());
+
+    let c = multiexp_window(bases.len());
+    let num_bits = <G::Scalar as PrimeField>::NUM_BITS as usize;
+    let num_windows = (num_bits + c - 1) / c;
+
+    let mut result = G::zero();
+    let mut buckets = vec![G::zero(); (1 << c) - 1];
+    for w in (0..num_windows).rev() {
+        for _ in 0..c {
+            result.double();
+        }
+
+        for bucket in buckets.iter_mut() {
+            *bucket = G::zero();
+        }
+        for (base, scalar) in bases.iter().zip(scalars.iter()) {
+            let digit = scalar_window(scalar, w * c, c);
+            if digit != 0 {
+                buckets[digit - 1].add_assign(base);
+            }
+        }
+
+        // sum_d d * buckets[d-1], as a sum of running sums from the top bucket.
+        let mut running_sum = G::zero();
+        let mut window_sum = G::zero();
+        for bucket in buckets.iter().rev() {
+            running_sum.add_assign(bucket);
+            window_sum.add_assign(&running_sum);
+        }
+        result.add_assign(&window_sum);
+    }
+
+    result
+}
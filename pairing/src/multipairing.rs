@@ -0,0 +1,19 @@
+use super::{CurveAffine, CurveProjective, Engine};
+
+/// Computes the product of the pairings of `g1s[i]` and `g2s[i]`.
+///
+/// All pairs go through a single Miller loop, whose squarings are shared, and
+/// the result is raised to the final exponentiation once instead of once per
+/// pairing.
+pub(crate) fn multi_pairing<E: Engine>(g1s: &[E::G1], g2s: &[E::G2]) -> E::Fqk {
+    assert_eq!(g1s.len(), g2s.len());
+
+    let prepared: Vec<_> = g1s
+        .iter()
+        .zip(g2s.iter())
+        .map(|(a, b)| (a.into_affine().prepare(), b.into_affine().prepare()))
+        .collect();
+    let pairs: Vec<_> = prepared.iter().map(|&(ref a, ref b)| (a, b)).collect();
+
+    E::final_exponentiation(&E::miller_loop(&pairs)).unwrap()
+}
@@ -0,0 +1,165 @@
+//! Files holding the fixed-base tables built by `preprocess`, so that a table can
+//! be built once and loaded by later runs instead of being rebuilt.
+//!
+//! A file starts with a magic string, the level and the number of entries of the
+//! table, followed by the entries. Field elements are stored as their little
+//! endian representation, and points by their projective coordinates. The
+//! first entry of a table is the element it was built for, which is checked when
+//! loading it. Points are not checked to be on the curve when loaded, so only
+//! load tables written by `save`.
+
+use byteorder::{LittleEndian, ReadBytesExt, WriteBytesExt};
+use std::fs::{self, File};
+use std::io::{self, BufWriter, Read, Write};
+use std::process;
+
+use super::{CurveProjective, PrimeField, PrimeFieldRepr};
+use bls12_381::{Fq, Fq12, Fq2, Fq6, FqRepr, G1, G2};
+
+const MAGIC: &[u8; 8] = b"HBPPTBL1";
+
+/// Returns the number of entries in a table built by `preprocess` at `level`.
+pub(crate) fn table_size(level: usize) -> usize {
+    ((1 << level) - 1) * (255 + level - 1) / level
+}
+
+fn invalid_data(msg: &str) -> io::Error {
+    io::Error::new(io::ErrorKind::InvalidData, msg.to_string())
+}
+
+pub(crate) trait TableEntry: Sized {
+    fn write<W: Write>(&self, writer: &mut W) -> io::Result<()>;
+    fn read<R: Read>(reader: &mut R) -> io::Result<Self>;
+}
+
+impl TableEntry for Fq {
+    fn write<W: Write>(&self, writer: &mut W) -> io::Result<()> {
+        self.into_repr().write_le(&mut *writer)
+    }
+
+    fn read<R: Read>(reader: &mut R) -> io::Result<Self> {
+        let mut repr = FqRepr::default();
+        repr.read_le(&mut *reader)?;
+        Fq::from_repr(repr).map_err(|e| invalid_data(&e.to_string()))
+    }
+}
+
+impl TableEntry for Fq2 {
+    fn write<W: Write>(&self, writer: &mut W) -> io::Result<()> {
+        self.c0.write(writer)?;
+        self.c1.write(writer)
+    }
+
+    fn read<R: Read>(reader: &mut R) -> io::Result<Self> {
+        Ok(Fq2 {
+            c0: TableEntry::read(reader)?,
+            c1: TableEntry::read(reader)?,
+        })
+    }
+}
+
+impl TableEntry for Fq6 {
+    fn write<W: Write>(&self, writer: &mut W) -> io::Result<()> {
+        self.c0.write(writer)?;
+        self.c1.write(writer)?;
+        self.c2.write(writer)
+    }
+
+    fn read<R: Read>(reader: &mut R) -> io::Result<Self> {
+        Ok(Fq6 {
+            c0: TableEntry::read(reader)?,
+            c1: TableEntry::read(reader)?,
+            c2: TableEntry::read(reader)?,
+        })
+    }
+}
+
+impl TableEntry for Fq12 {
+    fn write<W: Write>(&self, writer: &mut W) -> io::Result<()> {
+        self.c0.write(writer)?;
+        self.c1.write(writer)
+    }
+
+    fn read<R: Read>(reader: &mut R) -> io::Result<Self> {
+        Ok(Fq12 {
+            c0: TableEntry::read(reader)?,
+            c1: TableEntry::read(reader)?,
+        })
+    }
+}
+
+macro_rules! point_table_entry {
+    ($point:ident) => {
+        impl TableEntry for $point {
+            fn write<W: Write>(&self, writer: &mut W) -> io::Result<()> {
+                self.x.write(writer)?;
+                self.y.write(writer)?;
+                self.z.write(writer)
+            }
+
+            fn read<R: Read>(reader: &mut R) -> io::Result<Self> {
+                let mut point = $point::zero();
+                point.x = TableEntry::read(reader)?;
+                point.y = TableEntry::read(reader)?;
+                point.z = TableEntry::read(reader)?;
+                Ok(point)
+            }
+        }
+    };
+}
+
+point_table_entry!(G1);
+point_table_entry!(G2);
+
+/// Writes the table built at `level` to the file at `path`.
+///
+/// The table is written to a temporary file which is then renamed, so other
+/// processes never load a partially written table.
+pub(crate) fn save<T: TableEntry>(path: &str, level: usize, table: &[T]) -> io::Result<()> {
+    let tmp_path = format!("{}.{}.tmp", path, process::id());
+    {
+        let mut writer = BufWriter::new(File::create(&tmp_path)?);
+        writer.write_all(MAGIC)?;
+        writer.write_u64::<LittleEndian>(level as u64)?;
+        writer.write_u64::<LittleEndian>(table.len() as u64)?;
+        for entry in table {
+            entry.write(&mut writer)?;
+        }
+        writer.flush()?;
+    }
+    fs::rename(&tmp_path, path)
+}
+
+/// Loads the table of the given `level` written by `save` to the file at `path`.
+/// Fails if the table was not built for `base`.
+pub(crate) fn load<T: TableEntry + PartialEq>(
+    path: &str,
+    level: usize,
+    base: &T,
+) -> io::Result<Vec<T>> {
+    let data = fs::read(path)?;
+    let mut reader = &data[..];
+
+    let mut magic = [0u8; 8];
+    reader.read_exact(&mut magic)?;
+    if &magic != MAGIC {
+        return Err(invalid_data("not a preprocessing table"));
+    }
+    if reader.read_u64::<LittleEndian>()? != level as u64 {
+        return Err(invalid_data("preprocessing table of a different level"));
+    }
+    let len = reader.read_u64::<LittleEndian>()? as usize;
+    if len != table_size(level) {
+        return Err(invalid_data("preprocessing table of the wrong size"));
+    }
+
+    let mut table = Vec::with_capacity(len);
+    table.push(T::read(&mut reader)?);
+    if table[0] != *base {
+        return Err(invalid_data("preprocessing table of a different element"));
+    }
+    for _ in 1..len {
+        table.push(T::read(&mut reader)?);
+    }
+    Ok(table)
+}
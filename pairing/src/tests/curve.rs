@@ -63,9 +63,32 @@ pub fn curve_tests<G: CurveProjective>() {
     random_negation_tests::<G>();
     random_transformation_tests::<G>();
     random_wnaf_tests::<G>();
+    random_multiexp_tests::<G>();
     random_encoding_tests::<G::Affine>();
 }
 
+fn random_multiexp_tests<G: CurveProjective>() {
+    use ff::PrimeField;
+    use multiexp::multiexp;
+
+    let mut rng = XorShiftRng::from_seed([0x5dbe6259, 0x8d313d76, 0x3237db17, 0xe5bc0654]);
+
+    for &n in &[0, 1, 2, 31, 32, 100] {
+        let bases: Vec<G> = (0..n).map(|_| G::rand(&mut rng)).collect();
+        let scalars: Vec<G::Scalar> = (0..n).map(|_| G::Scalar::rand(&mut rng)).collect();
+        let reprs: Vec<_> = scalars.iter().map(|s| s.into_repr()).collect();
+
+        let mut expected = G::zero();
+        for (base, scalar) in bases.iter().zip(scalars.iter()) {
+            let mut tmp = *base;
+            tmp.mul_assign(*scalar);
+            expected.add_assign(&tmp);
+        }
+
+        assert_eq!(multiexp(&bases, &reprs), expected);
+    }
+}
+
 fn random_wnaf_tests<G: CurveProjective>() {
     use ff::PrimeField;
     use wnaf::*;
@@ -45,6 +45,7 @@ pub fn engine_tests<E: Engine>() {
 
     random_bilinearity_tests::<E>();
     random_miller_loop_tests::<E>();
+    random_multi_pairing_tests::<E>();
 }
 
 fn random_miller_loop_tests<E: Engine>() {
@@ -90,6 +91,24 @@ fn random_miller_loop_tests<E: Engine>() {
     }
 }
 
+fn random_multi_pairing_tests<E: Engine>() {
+    use multipairing::multi_pairing;
+
+    let mut rng = XorShiftRng::from_seed([0x5dbe6259, 0x8d313d76, 0x3237db17, 0xe5bc0654]);
+
+    for &n in &[0, 1, 2, 5] {
+        let g1s: Vec<E::G1> = (0..n).map(|_| E::G1::rand(&mut rng)).collect();
+        let g2s: Vec<E::G2> = (0..n).map(|_| E::G2::rand(&mut rng)).collect();
+
+        let mut expected = E::Fqk::one();
+        for (a, b) in g1s.iter().zip(g2s.iter()) {
+            expected.mul_assign(&E::pairing(*a, *b));
+        }
+
+        assert_eq!(multi_pairing::<E>(&g1s, &g2s), expected);
+    }
+}
+
 fn random_bilinearity_tests<E: Engine>() {
     let mut rng = XorShiftRng::from_seed([0x5dbe6259, 0x8d313d76, 0x3237db17, 0xe5bc0654]);
 
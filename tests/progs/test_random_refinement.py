@@ -1,5 +1,5 @@
 from pytest import mark
-from honeybadgermpc.progs.random_refinement import refine_randoms
+from honeybadgermpc.progs.random_refinement import get_random_refiner, refine_randoms
 
 
 @mark.parametrize("n, t, k", [(4, 1, 3), (4, 1, 4), (7, 2, 5)])
@@ -16,3 +16,16 @@ async def test_random_refinement(n, t, k, galois_field, polynomial, test_runner)
 
     assert len(randoms) == n
     assert len(set(randoms)) == 1
+
+
+@mark.parametrize("n, t, ks", [(4, 1, [3, 4, 3]), (7, 2, [5, 7, 6])])
+def test_random_refinement_batches(n, t, ks, galois_field):
+    refiner = get_random_refiner(n, t, galois_field)
+    assert get_random_refiner(n, t, galois_field) is refiner
+
+    batches = [[galois_field.random().value for _ in range(k)] for k in ks]
+    expected = [
+        r for batch in batches for r in refine_randoms(n, t, galois_field, batch)
+    ]
+    assert refiner.refine(batches) == expected
+    assert len(expected) == sum(ks) - len(ks) * t
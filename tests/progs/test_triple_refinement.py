@@ -1,6 +1,9 @@
 import asyncio
 from pytest import mark
-from honeybadgermpc.progs.triple_refinement import refine_triples
+from honeybadgermpc.progs.triple_refinement import (
+    refine_triples,
+    refine_triples_batches,
+)
 
 
 @mark.asyncio
@@ -23,3 +26,28 @@ async def test_triple_refinement(n, t, k, test_runner):
             assert d * e == de
 
     await test_runner(_prog, n, t, ["triples"], n * k)
+
+
+@mark.asyncio
+@mark.parametrize("n, t, ks", [(4, 1, [3, 4, 3]), (7, 2, [5, 7, 6, 5])])
+async def test_triple_refinement_batches(n, t, ks, test_runner):
+    async def _prog(context):
+        batches = []
+        for k in ks:
+            _a, _b, _c = [], [], []
+            for _ in range(k):
+                p, q, pq = context.preproc.get_triples(context)
+                _a.append(p.v.value), _b.append(q.v.value), _c.append(pq.v.value)
+            batches.append((_a, _b, _c))
+        refined = await refine_triples_batches(context, batches)
+        assert len(refined) == len(ks)
+
+        for k, (p, q, pq) in zip(ks, refined):
+            p, q, pq = await asyncio.gather(
+                *[context.ShareArray(x).open() for x in (p, q, pq)]
+            )
+            assert len(p) == len(q) == len(pq) == (k - 2 * t + 1) // 2
+            for d, e, de in zip(p, q, pq):
+                assert d * e == de
+
+    await test_runner(_prog, n, t, ["triples"], n * sum(ks))
@@ -34,45 +34,35 @@ async def test_avss_value_processor_with_diff_inputs(test_router):
             stack.enter_context(avss_value_procs[i])
             get_tasks[i] = asyncio.create_task(avss_value_procs[i].get())
 
-        futures = await asyncio.gather(*get_tasks)
-        for i, future in enumerate(futures):
-            assert type(future) is asyncio.Future
-            if i == 3:
-                # node 3 does not receive the value dealt from node 0
-                assert not future.done()
-            else:
-                # all other nodes have received the value dealt from node 0
-                assert (await future) == f"0{i}"
+        # only node 2 has received all the values which have been agreed
+        assert (await asyncio.wait_for(get_tasks[2], 10)) == ["02", "22", "32"]
+        await asyncio.sleep(0.1)
+        assert not any(get_tasks[i].done() for i in [0, 1, 3])
 
         # this is based on node_inputs
         inputs = [[1, 1, 1, 0], [1, 0, 0, 0], [1, 0, 1, 1], [0, 0, 0, 1]]
-        # this is based on the fact that only values dealt by 0 and 2 have been agreed
+        # this is based on the fact that only values dealt by 0, 2 and 3 have been
+        # agreed
         outputs = [[1, 0, 1, 1], [1, 0, 1, 1], [1, 0, 1, 1], [1, 0, 1, 1]]
 
         for j, proc in enumerate(avss_value_procs):
             assert [len(proc.inputs_per_dealer[i]) for i in range(n)] == inputs[j]
-            assert [len(proc.outputs_per_dealer[i]) for i in range(n)] == outputs[j]
-            # 1 value was already retrieved, two values and 1 batch delimiter expected
-            assert proc.output_queue.qsize() == 3
+            assert proc.agreed_counts_per_dealer == outputs[j]
+            # the only batch has been retrieved
+            assert proc.output_queue.qsize() == 0
             # The values from 0, 2 and 3 have been added to the queue so their
             # next indices should be updated
             assert proc.next_idx_to_return_per_dealer == [1, 0, 1, 1]
 
-        for i in range(n):
-            if i in [0, 2]:
-                # only nodes 0 and 2 have received the value dealt by 2
-                # executing this sequentially also ensurs that ACS is not run again
-                # since this value is already available
-                assert (await (await avss_value_procs[i].get())) == f"2{i}"
-            else:
-                # nodes 1 and 3 have not received the value dealt by 2
-                assert not (await avss_value_procs[i].get()).done()
+        # the other nodes get their batch once they receive the agreed values
+        missing = {0: [3], 1: [2, 3], 3: [0, 2]}
+        for i, dealer_ids in missing.items():
+            for dealer_id in dealer_ids:
+                input_qs[i].put_nowait((dealer_id, 0, f"{dealer_id}{i}"))
 
-        for j, proc in enumerate(avss_value_procs):
-            assert [len(proc.inputs_per_dealer[i]) for i in range(n)] == inputs[j]
-            assert [len(proc.outputs_per_dealer[i]) for i in range(n)] == outputs[j]
-            # values from node 0 and 1 have been requested
-            assert proc.next_idx_to_return_per_dealer == [1, 0, 1, 1]
+        for i in [0, 1, 3]:
+            batch = await asyncio.wait_for(get_tasks[i], 10)
+            assert batch == [f"0{i}", f"2{i}", f"3{i}"]
 
 
 # [i][j] -> Represents the number of AVSSed values
@@ -298,16 +288,27 @@ async def test_acs_output(n, t, output_counts, next_idx, acs_outputs):
     input_q = asyncio.Queue()
     with AvssValueProcessor(None, None, n, t, my_id, None, None, input_q.get) as proc:
         proc._process_acs_output(acs_outputs)
-        assert [len(proc.outputs_per_dealer[i]) for i in range(n)] == output_counts
-        for i in range(n):
-            for output in proc.outputs_per_dealer[i]:
-                assert type(output) is asyncio.Future
+        assert proc.agreed_counts_per_dealer == output_counts
 
         # These are set by another method and shouldn't have been updated.
         assert all(len(proc.inputs_per_dealer[i]) == 0 for i in range(n))
         assert proc.next_idx_to_return_per_dealer == next_idx
 
 
+@mark.asyncio
+async def test_wait_for_agreed():
+    n, t = 4, 1
+    input_q = asyncio.Queue()
+    with AvssValueProcessor(None, None, n, t, 0, None, None, input_q.get) as proc:
+        waiter = asyncio.create_task(proc.wait_for_agreed(0, 2))
+        proc._process_acs_output(tuple(dumps([1, 0, 0, 0]) for _ in range(n)))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        proc._process_acs_output(tuple(dumps([2, 0, 0, 0]) for _ in range(n)))
+        await asyncio.wait_for(waiter, 1)
+
+
 # [i][j] -> Represents the number of AVSSed values
 # received by node `i` dealt by node `j`.
 @mark.parametrize(
@@ -357,11 +358,8 @@ async def test_with_agreed_values_on_same_node_with_input(k, acs_outputs):
         proc._process_acs_output(acs_outputs)
 
         assert [len(proc.inputs_per_dealer[i]) for i in range(n)] == [k, 0, 0, 0]
-        assert [len(proc.outputs_per_dealer[i]) for i in range(n)] == [k, 0, 0, 0]
-        for i in range(k):
-            assert type(proc.outputs_per_dealer[my_id][i]) is asyncio.Future
-            assert proc.outputs_per_dealer[my_id][i].done()
-            assert (await proc.outputs_per_dealer[my_id][i]) == i
+        assert proc.agreed_counts_per_dealer == [k, 0, 0, 0]
+        assert proc.inputs_per_dealer[my_id] == list(range(k))
 
         # This is set by another method and should not have been updated.
         assert all(proc.next_idx_to_return_per_dealer[i] == 0 for i in range(n))
@@ -405,11 +403,11 @@ async def test_with_agreed_values_on_another_node_with_input(k, acs_outputs):
         # 0th node has not received any AVSSed value from node 1 yet
         assert [len(proc.inputs_per_dealer[i]) for i in range(n)] == [0, 0, 0, 0]
         # 0th node should however know that one value sent by 1st node has been agreed
-        assert [len(proc.outputs_per_dealer[i]) for i in range(n)] == [0, k, 0, 0]
-        for i in range(k):
-            assert type(proc.outputs_per_dealer[sender_id][i]) is asyncio.Future
-            # This value is not yet available
-            assert not proc.outputs_per_dealer[sender_id][i].done()
+        assert proc.agreed_counts_per_dealer == [0, k, 0, 0]
+        # This value is not yet available
+        wait_task = asyncio.create_task(proc._wait_for_inputs(sender_id, k))
+        await asyncio.sleep(0.1)
+        assert not wait_task.done()
 
         # This is set by another method and should not have been updated.
         assert all(proc.next_idx_to_return_per_dealer[i] == 0 for i in range(n))
@@ -423,10 +421,9 @@ async def test_with_agreed_values_on_another_node_with_input(k, acs_outputs):
         # 0th node has received the AVSSed value from node 1
         assert [len(proc.inputs_per_dealer[i]) for i in range(n)] == [0, k, 0, 0]
         # 0th node already knows that one value sent by 1st node has been agreed
-        assert [len(proc.outputs_per_dealer[i]) for i in range(n)] == [0, k, 0, 0]
-        for i in range(k):
-            assert proc.outputs_per_dealer[sender_id][i].done()
-            assert (await proc.outputs_per_dealer[sender_id][i]) == i
+        assert proc.agreed_counts_per_dealer == [0, k, 0, 0]
+        await asyncio.wait_for(wait_task, 1)
+        assert proc.inputs_per_dealer[sender_id] == list(range(k))
 
         # This is set by another method and should not have been updated.
         assert all(proc.next_idx_to_return_per_dealer[i] == 0 for i in range(n))
@@ -569,14 +566,14 @@ async def test_add_to_output_queue(
     output_next_ids:    This denotes the next index to return after the values have been
                         added to the output queue. This is to verify the output.
     per_dealer_input:   This is the count of values that have been received by this node
-                        per dealer. We take this list and add as many values as the
-                        counts in the output list. The output list is the one which gets
-                        updated after ACS and all nodes have the same view of the output
-                        list.
+                        per dealer. We take this list and set the agreed counts to it.
+                        The agreed counts are the ones which get updated after ACS and
+                        all nodes have the same view of them.
     output_queue_vals:  This is for verification. This denotes the order in which the
-                        output values should be available in the queue. THe first
-                        character is the node who dealt the value and the second
-                        character is the count starting from 0 for each dealer.
+                        output values should be available in the queue, with `None`
+                        after each batch. THe first character is the node who dealt the
+                        value and the second character is the count starting from 0 for
+                        each dealer.
 
 
     We want to verify the AVSS Value Proessor Output Order.
@@ -602,9 +599,102 @@ async def test_add_to_output_queue(
     avss_proc.next_idx_to_return_per_dealer = input_next_ids
     for i in range(n):
         for j in range(per_dealer_input[i]):
-            avss_proc.outputs_per_dealer[i].append(f"{i}{j}")
+            avss_proc.inputs_per_dealer[i].append(f"{i}{j}")
+        avss_proc.agreed_counts_per_dealer[i] = per_dealer_input[i]
     avss_proc._add_to_output_queue()
     assert output_next_ids == avss_proc.next_idx_to_return_per_dealer
-    assert len(output_queue_vals) == avss_proc.output_queue.qsize()
-    for val in output_queue_vals:
-        assert val == avss_proc.output_queue.get_nowait()
+
+    # Batches are slices of the values of each dealer, `None` delimits them here.
+    assert output_queue_vals.count(None) == avss_proc.output_queue.qsize()
+    output_vals = []
+    while not avss_proc.output_queue.empty():
+        for dealer_id, start, end in avss_proc.output_queue.get_nowait():
+            output_vals += avss_proc.inputs_per_dealer[dealer_id][start:end]
+        output_vals.append(None)
+    assert output_queue_vals == output_vals
+
+
+@mark.asyncio
+async def test_acs_triggered_by_received_values(test_router, monkeypatch):
+    n, t = 4, 1
+    sends, recvs, _ = test_router(n)
+
+    # ACS must run as soon as values are received, not after a period.
+    monkeypatch.setattr(AvssValueProcessor, "ACS_PERIOD_IN_SECONDS", 100)
+
+    pk, sks = dealer(n, t + 1)
+    input_qs = [asyncio.Queue() for _ in range(n)]
+    with ExitStack() as stack:
+        avss_value_procs = [
+            stack.enter_context(
+                AvssValueProcessor(
+                    pk, sks[i], n, t, i, sends[i], recvs[i], input_qs[i].get
+                )
+            )
+            for i in range(n)
+        ]
+
+        # Nothing has been received, so no ACS is run.
+        await asyncio.sleep(0.1)
+        assert all(proc.output_queue.qsize() == 0 for proc in avss_value_procs)
+
+        # Only some of the parties receive values, the others join their ACS.
+        for i in range(n - t):
+            for dealer_id in range(n - t):
+                input_qs[i].put_nowait((dealer_id, 0, f"{dealer_id}{i}"))
+
+        batches = await asyncio.wait_for(
+            asyncio.gather(*[proc.get() for proc in avss_value_procs[: n - t]]), 10
+        )
+        for i in range(n - t):
+            assert batches[i] == [f"{dealer_id}{i}" for dealer_id in range(n - t)]
+
+        # The last party hasn't received the agreed values
+        batch = await asyncio.wait_for(avss_value_procs[n - 1].output_queue.get(), 1)
+        assert batch == [(dealer_id, 0, 1) for dealer_id in range(n - t)]
+
+        # A late message of the completed instance doesn't start it again.
+        sends[0](n - 1, (f"{AvssValueProcessor.ACS_SID_PREFIX}0", None))
+        await asyncio.sleep(0.1)
+        assert not avss_value_procs[n - 1]._acs_sids_started
+
+
+@mark.asyncio
+async def test_acs_batching_deadline(test_router):
+    n, t, max_acs_latency = 4, 1, 0.5
+    sends, recvs, _ = test_router(n)
+
+    pk, sks = dealer(n, t + 1)
+    input_qs = [asyncio.Queue() for _ in range(n)]
+    with ExitStack() as stack:
+        avss_value_procs = [
+            stack.enter_context(
+                AvssValueProcessor(
+                    pk,
+                    sks[i],
+                    n,
+                    t,
+                    i,
+                    sends[i],
+                    recvs[i],
+                    input_qs[i].get,
+                    acs_batch_size=10,
+                    max_acs_latency=max_acs_latency,
+                )
+            )
+            for i in range(n)
+        ]
+
+        start_time = asyncio.get_event_loop().time()
+        for i in range(n):
+            for dealer_id in range(n):
+                input_qs[i].put_nowait((dealer_id, 0, f"{dealer_id}{i}"))
+
+        # Fewer than acs_batch_size values are pending, so ACS only runs once the
+        # deadline is reached.
+        batches = await asyncio.wait_for(
+            asyncio.gather(*[proc.get() for proc in avss_value_procs]), 10
+        )
+        assert asyncio.get_event_loop().time() - start_time >= max_acs_latency
+        for i in range(n):
+            assert batches[i] == [f"{dealer_id}{i}" for dealer_id in range(n)]
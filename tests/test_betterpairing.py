@@ -78,3 +78,31 @@ def test_hashing():
     ghat2 = G2.hash(pickle.dumps(crs))
     assert g == g2
     assert ghat == ghat2
+
+
+def test_multiexp():
+    from honeybadgermpc.betterpairing import ZR, G1, G2
+
+    for n in [0, 1, 5, 40]:
+        g1s = [G1.rand() for _ in range(n)]
+        g2s = [G2.rand() for _ in range(n)]
+        scalars = [ZR.random() for _ in range(n - 1)] + [7] * min(n, 1)
+        expected1, expected2 = G1.one(), G2.one()
+        for g1, g2, scalar in zip(g1s, g2s, scalars):
+            expected1 *= g1 ** scalar
+            expected2 *= g2 ** scalar
+        assert G1.multiexp(g1s, scalars) == expected1
+        assert G2.multiexp(g2s, scalars) == expected2
+
+
+def test_multi_pair():
+    from honeybadgermpc.betterpairing import G1, G2, GT, pair, multi_pair
+
+    assert multi_pair([], []) == GT.one()
+    for n in [1, 2, 5]:
+        g1s = [G1.rand() for _ in range(n)]
+        g2s = [G2.rand() for _ in range(n)]
+        expected = GT.one()
+        for g1, g2 in zip(g1s, g2s):
+            expected *= pair(g1, g2)
+        assert multi_pair(g1s, g2s) == expected
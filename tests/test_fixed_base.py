@@ -0,0 +1,54 @@
+from pytest import fixture
+
+from honeybadgermpc import fixed_base
+from honeybadgermpc.betterpairing import G1, G2, GT, ZR
+from honeybadgermpc.fixed_base import preprocessed, preprocessed_all, table_key
+
+
+@fixture
+def tables(monkeypatch):
+    monkeypatch.setattr(fixed_base, "_tables", {})
+
+
+def test_preprocessed_is_shared(tables):
+    g, x = G1.rand(), ZR.random()
+    g_pp = preprocessed(g, 3, directory=None)
+    assert g_pp is not g
+    assert g_pp == g and g_pp ** x == g ** x
+    assert preprocessed(g.duplicate(), 3, directory=None) is g_pp
+    assert preprocessed(g, 4, directory=None) is not g_pp
+
+
+def test_preprocessed_tables_are_saved(tables, tmp_path, monkeypatch):
+    elements, x = [G1.rand(), G2.rand(), GT.rand()], ZR.random()
+    preprocessed_all(elements, 3, directory=str(tmp_path))
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        table_key(element, 3) for element in elements
+    )
+
+    # A later run loads the saved tables instead of building them
+    def _fail(self, level=4):
+        raise AssertionError("table was rebuilt")
+
+    monkeypatch.setattr(fixed_base, "_tables", {})
+    for cls in (G1, G2, GT):
+        monkeypatch.setattr(cls, "preprocess", _fail)
+    loaded = preprocessed_all(elements, 3, directory=str(tmp_path))
+    for element, element_pp in zip(elements, loaded):
+        assert element_pp == element and element_pp ** x == element ** x
+
+
+def test_invalid_table_is_rebuilt(tables, tmp_path):
+    g, x = G1.rand(), ZR.random()
+    (tmp_path / table_key(g, 3)).write_bytes(b"not a table")
+    g_pp = preprocessed(g, 3, directory=str(tmp_path))
+    assert g_pp ** x == g ** x
+
+
+def test_table_of_another_element_is_rebuilt(tables, tmp_path):
+    g, h, x = G1.rand(), G1.rand(), ZR.random()
+    preprocessed(g, 3, directory=str(tmp_path))
+    (tmp_path / table_key(g, 3)).rename(tmp_path / table_key(h, 3))
+    fixed_base._tables.clear()
+    h_pp = preprocessed(h, 3, directory=str(tmp_path))
+    assert h_pp == h and h_pp ** x == h ** x
@@ -381,6 +381,55 @@ async def test_hbavss_batch(test_router):
     assert recovered_values == values
 
 
+@mark.asyncio
+async def test_hbavss_batch_verifies_dealers_together(test_router):
+    t = 1
+    n = 3 * t + 1
+
+    g, h, pks, sks = get_avss_params(n, t)
+    sends, recvs, _ = test_router(n)
+    crs = gen_pc_const_crs(t, g=g, h=h)
+
+    values = [[ZR.random() for _ in range(t + 1)] for _ in range(n)]
+    verified = [[] for _ in range(n)]
+    avss_tasks = []
+
+    with ExitStack() as stack:
+        hbavss_list = [None] * n
+        for i in range(n):
+            # Only a full batch of one instance per dealer triggers verification
+            hbavss = HbAvssBatch(
+                pks, sks[i], crs, n, t, i, sends[i], recvs[i], verify_batch_delay=60
+            )
+            batch_verify_evals = hbavss.poly_commit.batch_verify_evals
+
+            def _batch_verify_evals(evals, i=i, batch_verify_evals=batch_verify_evals):
+                verified[i].append(len(evals))
+                return batch_verify_evals(evals)
+
+            hbavss.poly_commit.batch_verify_evals = _batch_verify_evals
+            hbavss_list[i] = hbavss
+            stack.enter_context(hbavss)
+            for dealer_id in range(n):
+                if i == dealer_id:
+                    task = hbavss.avss(0, values=values[i])
+                else:
+                    task = hbavss.avss(0, dealer_id=dealer_id)
+                avss_tasks.append(asyncio.create_task(task))
+                avss_tasks[-1].add_done_callback(print_exception_callback)
+
+        await asyncio.wait_for(
+            asyncio.gather(
+                *[hbavss_list[i].output_queue.get() for i in range(n) for _ in range(n)]
+            ),
+            60,
+        )
+        for task in avss_tasks:
+            task.cancel()
+
+    assert verified == [[n * (t + 1)]] * n
+
+
 @mark.asyncio
 async def test_hbavss_batch_share_fault(test_router):
     # Injects one invalid share
@@ -10,6 +10,10 @@ from honeybadgermpc.ntl import (
     sqrt_mod,
     partial_fft,
     fft_batch_evaluate,
+    ints_to_bytes,
+    bytes_to_ints,
+    wb_interpolate,
+    wb_batch_interpolate,
 )
 import random
 
@@ -53,6 +57,35 @@ def test_batch_vandermonde_evaluate(galois_field):
     assert y == [[1, 2], [3, 5]]
 
 
+def test_ints_to_bytes_round_trip(galois_field):
+    p = galois_field.modulus
+    values = [0, 1, p - 1, p, p + 5] + [galois_field.random().value for _ in range(20)]
+
+    packed = ints_to_bytes(values, p)
+
+    assert len(packed) == 32 * len(values)
+    assert bytes_to_ints(packed, p) == [v % p for v in values]
+
+
+def test_batch_vandermonde_buffer_inputs(galois_field):
+    # Given
+    p = galois_field.modulus
+    x = list(range(1, 11))
+    polynomials = [[galois_field.random().value for _ in range(5)] for _ in range(8)]
+    packed = [ints_to_bytes(poly, p) for poly in polynomials]
+
+    # When
+    y = vandermonde_batch_evaluate(x, polynomials, p)
+    y_packed = vandermonde_batch_evaluate(x, packed, p)
+    recovered = vandermonde_batch_interpolate(
+        x[:5], [memoryview(ints_to_bytes(row[:5], p)) for row in y], p
+    )
+
+    # Then
+    assert y == y_packed
+    assert recovered == polynomials
+
+
 def test_fft():
     # Given
     coeffs = [0, 1]
@@ -227,6 +260,56 @@ def test_gao_interpolate():
     assert coeffs == int_msg
 
 
+def test_wb_interpolate():
+    int_msg = [2, 3, 2, 8, 7, 5, 9, 5]
+    k = len(int_msg)  # length of message
+    n = 22  # size of encoded message
+    p = 53  # prime
+    t = k - 1  # degree of polynomial
+
+    x = list(range(n))
+    encoded = [
+        sum(int_msg[j] * pow(x[i], j, p) for j in range(k)) % p for i in range(n)
+    ]
+
+    # Check decoding with no errors
+    assert wb_interpolate(x, encoded, k, p) == int_msg
+
+    # Corrupt with maximum number of erasures:
+    cmax = n - 2 * t - 1
+    corrupted = corrupt(encoded, num_errors=0, num_nones=cmax)
+    assert wb_interpolate(x, corrupted, k, p) == int_msg
+
+    # Corrupt with maximum number of errors:
+    emax = (n - 2 * t - 1) // 2
+    corrupted = corrupt(encoded, num_errors=emax, num_nones=0)
+    assert wb_interpolate(x, corrupted, k, p) == int_msg
+
+    # Corrupt with a mixture of errors and erasures
+    e = emax // 2
+    c = cmax // 4
+    corrupted = corrupt(encoded, num_errors=e, num_nones=c)
+    assert wb_interpolate(x, corrupted, k, p) == int_msg
+
+
+def test_wb_batch_interpolate(galois_field):
+    p = galois_field.modulus
+    k, n, batch_size = 4, 13, 20
+    x = list(range(1, n + 1))
+    messages = [
+        [galois_field.random().value for _ in range(k)] for _ in range(batch_size)
+    ]
+    encoded = [
+        [sum(m[j] * pow(xi, j, p) for j in range(k)) % p for xi in x] for m in messages
+    ]
+    emax = (n - k) // 2
+    for i, word in enumerate(encoded):
+        for j in random.sample(range(n), i % (emax + 1)):
+            word[j] = (word[j] + 1) % p
+
+    assert wb_batch_interpolate(x, encoded, k, p) == messages
+
+
 def test_gao_interpolate_all_zeros():
     int_msg = [0, 0, 0, 0, 0, 0, 0, 0]
     k = len(int_msg)  # length of message
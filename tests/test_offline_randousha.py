@@ -1,7 +1,18 @@
 import asyncio
 from pytest import mark
+from honeybadgermpc import offline_randousha
+from honeybadgermpc.exceptions import HoneyBadgerMPCError
+from honeybadgermpc.mpc import TaskProgramRunner
 from honeybadgermpc.polynomial import EvalPoint
-from honeybadgermpc.offline_randousha import randousha, generate_triples, generate_bits
+from honeybadgermpc.offline_randousha import (
+    randousha,
+    randousha_stream,
+    generate_triples,
+    generate_bits,
+    OneMinusOneFactory,
+    TripleFactory,
+)
+from honeybadgermpc.preprocessing import PreProcessedElements
 from honeybadgermpc.reed_solomon import Algorithm, DecoderFactory
 
 
@@ -34,6 +45,81 @@ async def test_randousha(test_router, polynomial, galois_field, n, k):
     assert len(set(random_values)) == (n - 2 * t) * k
 
 
+@mark.asyncio
+@mark.parametrize("degree", [1, 2])
+async def test_randousha_detects_invalid_sharing(
+    test_router, galois_field, monkeypatch, degree
+):
+    n, t, k = 4, 1, 5
+    random_coeffs = offline_randousha._random_coeffs
+    corrupted = []
+
+    # A single sharing dealt by one party has too high a degree.
+    def _random_coeffs(secrets, d, modulus):
+        coeffs = random_coeffs(secrets, d, modulus)
+        if d == degree and not corrupted:
+            corrupted.append(d)
+            coeffs[k // 2] = coeffs[k // 2] + [1]
+        return coeffs
+
+    monkeypatch.setattr(offline_randousha, "_random_coeffs", _random_coeffs)
+
+    sends, receives, _ = test_router(n)
+    results = await asyncio.gather(
+        *[randousha(n, t, k, i, sends[i], receives[i], galois_field) for i in range(n)],
+        return_exceptions=True,
+    )
+    assert corrupted == [degree]
+    assert all(isinstance(result, HoneyBadgerMPCError) for result in results)
+
+
+@mark.asyncio
+@mark.parametrize("chunk_size, pipeline_depth", [(3, 2), (10, 1), (4, 3)])
+async def test_randousha_stream(
+    test_router, polynomial, galois_field, chunk_size, pipeline_depth
+):
+    n, t, k = 4, 1, 10
+
+    async def _collect(i):
+        chunks = []
+        async for chunk in randousha_stream(
+            n,
+            t,
+            k,
+            i,
+            sends[i],
+            receives[i],
+            galois_field,
+            chunk_size=chunk_size,
+            pipeline_depth=pipeline_depth,
+        ):
+            chunks.append(chunk)
+        return chunks
+
+    sends, receives, _ = test_router(n)
+    chunks_per_party = await asyncio.gather(*[_collect(i) for i in range(n)])
+
+    expected_sizes = [
+        (n - 2 * t) * min(chunk_size, k - i) for i in range(0, k, chunk_size)
+    ]
+    for chunks in chunks_per_party:
+        assert [len(chunk) for chunk in chunks] == expected_sizes
+
+    eval_point = EvalPoint(galois_field, n, use_omega_powers=False)
+    decoder = DecoderFactory.get(eval_point, Algorithm.VANDERMONDE)
+    shares_per_party = [[s for c in chunks for s in c] for chunks in chunks_per_party]
+    random_values = []
+    for shares in zip(*shares_per_party):
+        shares_t, shares_2t = zip(*shares)
+        poly_t = polynomial(decoder.decode(list(range(n)), shares_t))
+        poly_2t = polynomial(decoder.decode(list(range(n)), shares_2t))
+        assert len(poly_t.coeffs) == t + 1
+        assert len(poly_2t.coeffs) == 2 * t + 1
+        assert poly_t(0) == poly_2t(0)
+        random_values.append(poly_t(0))
+    assert len(set(random_values)) == (n - 2 * t) * k
+
+
 @mark.asyncio
 @mark.parametrize("n", [4])
 @mark.parametrize("k", [1])
@@ -108,3 +194,71 @@ async def test_bits(n, k, polynomial, galois_field, test_router, test_runner):
             assert bit in (galois_field(-1), galois_field(1))
 
     await test_runner(_prog, n, t)
+
+
+@mark.asyncio
+async def test_triple_factory(test_router, tmp_path):
+    n, t, k = 4, 1, 7
+    pp_elements = PreProcessedElements(data_directory=f"{tmp_path}/")
+    sends, receives, _ = test_router(n)
+    factories = [
+        TripleFactory(n, t, i, sends[i], receives[i], preproc=pp_elements, chunk_size=2)
+        for i in range(n)
+    ]
+    produced = await asyncio.gather(*[factory.run(k) for factory in factories])
+    assert produced == [k] * n
+    assert all(
+        factory.produced == k and factory.throughput() > 0 for factory in factories
+    )
+
+    async def _prog(context):
+        a, b, ab = context.preproc.get_triples_array(context, k)
+        a, b, ab = await a.open(), await b.open(), await ab.open()
+        assert [x * y for x, y in zip(a, b)] == ab
+        assert len(set(a)) == k
+
+    program_runner = TaskProgramRunner(n, t)
+    program_runner.add(_prog, preproc=pp_elements)
+    await program_runner.join()
+    assert pp_elements._triples.available(0, n, t) == 0
+
+
+@mark.asyncio
+async def test_one_minus_one_factory(test_router, galois_field, tmp_path):
+    n, t, high_watermark = 4, 1, 5
+    pp_elements = PreProcessedElements(data_directory=f"{tmp_path}/")
+    sends, receives, _ = test_router(n)
+    factories = [
+        OneMinusOneFactory(
+            n,
+            t,
+            i,
+            sends[i],
+            receives[i],
+            preproc=pp_elements,
+            chunk_size=1,
+            high_watermark=high_watermark,
+        )
+        for i in range(n)
+    ]
+
+    async def _prog(context):
+        values = []
+        for _ in range(3):
+            await context.preproc.wait_for(context, "one_minus_one", 4)
+            values += context.preproc.get_one_minus_ones_array(context, 4)._shares
+        values = await context.ShareArray(values).open()
+        assert set(values) <= {galois_field(-1), galois_field(1)}
+
+    for factory in factories:
+        factory.__enter__()
+    try:
+        program_runner = TaskProgramRunner(n, t)
+        program_runner.add(_prog, preproc=pp_elements)
+        await asyncio.wait_for(program_runner.join(), 30)
+    finally:
+        for factory in factories:
+            factory.__exit__(None, None, None)
+
+    # Production pauses at the high watermark
+    assert pp_elements._one_minus_ones.available(0, n, t) < high_watermark + n - 2 * t
@@ -1,3 +1,4 @@
+from pytest import mark
 from honeybadgermpc.betterpairing import G1, ZR
 from honeybadgermpc.polynomial import polynomials_over
 from honeybadgermpc.poly_commit_const import PolyCommitConst, gen_pc_const_crs
@@ -33,3 +34,40 @@ def test_pc_const_preprocess():
     pc.preprocess_verifier()
     assert pc.verify_eval(c, 3, phi(3), phi_hat(3), witness)
     assert not pc.verify_eval(c, 4, phi(3), phi_hat(3), witness)
+
+
+@mark.parametrize("preprocess", [False, True])
+def test_pc_const_batch_create_witness(preprocess):
+    t, n = 3, 10
+    alpha = ZR.random()
+    g = G1.rand()
+    h = G1.rand()
+    crs = gen_pc_const_crs(t, alpha=alpha, g=g, h=h)
+    pc = PolyCommitConst(crs)
+    if preprocess:
+        pc.preprocess_prover()
+    phi = polynomials_over(ZR).random(t)
+    c, phi_hat = pc.commit(phi)
+    witnesses = pc.batch_create_witness(phi, phi_hat, n)
+    assert len(witnesses) == n
+    for i in range(1, n + 1):
+        assert witnesses[i - 1] == pc.create_witness(phi, phi_hat, i)
+        assert pc.verify_eval(c, i, phi(i), phi_hat(i), witnesses[i - 1])
+
+
+def test_pc_const_batch_verify_evals():
+    t = 3
+    crs = gen_pc_const_crs(t)
+    pc = PolyCommitConst(crs)
+    evals = []
+    for i in range(1, 6):
+        phi = polynomials_over(ZR).random(t)
+        c, phi_hat = pc.commit(phi)
+        witness = pc.create_witness(phi, phi_hat, i)
+        evals.append((c, i, phi(i), phi_hat(i), witness))
+    assert pc.batch_verify_evals([]) == []
+    assert pc.batch_verify_evals(evals) == [True] * 5
+
+    c, i, phi_at_i, phi_hat_at_i, witness = evals[2]
+    evals[2] = (c, i, phi_at_i + 1, phi_hat_at_i, witness)
+    assert pc.batch_verify_evals(evals) == [True, True, False, True, True]
@@ -1,5 +1,6 @@
 from random import randint, shuffle
 from honeybadgermpc.polynomial import get_omega, fnt_decode_step1, fnt_decode_step2
+from honeybadgermpc.polynomial import LagrangeCache
 
 
 def test_poly_eval_at_k(galois_field, polynomial):
@@ -106,6 +107,49 @@ def test_poly_interpolate_at_random(galois_field, polynomial):
     assert polynomial.interpolate_at(values, k) == random_poly(k)
 
 
+def test_poly_interpolate_at_zero_uses_cache(galois_field, polynomial):
+    t = randint(10, 50)
+    random_poly = polynomial.random(t)
+    values = [(i + 1, random_poly(i + 1)) for i in range(t + 1)]
+    xs = tuple(x for x, _ in values)
+    assert polynomial.interpolate_at(values, 0) == random_poly(0)
+    assert ("zero", xs) in polynomial._lagrange_cache
+
+    hits = polynomial._lagrange_cache.hits
+    assert polynomial.interpolate_at(values, galois_field(0)) == random_poly(0)
+    assert polynomial._lagrange_cache.hits == hits + 1
+
+
+def test_poly_interpolate_keys_on_ints(galois_field, polynomial):
+    random_poly = polynomial.random(5)
+    int_points = [(i, random_poly(i)) for i in range(6)]
+    field_points = [(galois_field(i), y) for i, y in int_points]
+    assert polynomial.interpolate(int_points) == random_poly
+
+    misses = polynomial._lagrange_cache.misses
+    assert polynomial.interpolate(field_points) == random_poly
+    assert polynomial._lagrange_cache.misses == misses
+
+
+def test_lagrange_cache_evicts_least_recently_used():
+    cache = LagrangeCache(maxsize=2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    assert cache.get("a", lambda: None) == 1
+    cache.get("c", lambda: 3)
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["evictions"] == 1
+    assert stats["nbytes"] > 0
+
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
 ####################################################################################
 # Test cases to cover the scenario when ZR is used.
 ####################################################################################
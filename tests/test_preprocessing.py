@@ -1,8 +1,31 @@
+from collections import namedtuple
 from pytest import mark
+from honeybadgermpc import preprocessing
 from honeybadgermpc.mpc import TaskProgramRunner
-from honeybadgermpc.preprocessing import PreProcessedElements
+from honeybadgermpc.polynomial import polynomials_over
+from honeybadgermpc.preprocessing import (
+    PreProcessedElements,
+    PreProcessingMixin,
+    RandomPreProcessing,
+    TriplePreProcessing,
+    ZeroPreProcessing,
+    share_secrets,
+)
 import asyncio
 
+Context = namedtuple("Context", ["myid", "N", "t", "Share"])
+
+
+def _context(myid, n, t):
+    """ Stand-in for an MPC context, whose shares are the plain share values.
+    """
+    return Context(myid, n, t, lambda v, t=None: v)
+
+
+def _wait_for_compaction():
+    # The single compaction thread runs tasks in the order they were submitted
+    PreProcessingMixin._compaction_executor.submit(lambda: None).result()
+
 
 @mark.asyncio
 async def test_get_triple():
@@ -22,6 +45,29 @@ async def test_get_triple():
     await program_runner.join()
 
 
+@mark.asyncio
+async def test_get_triples_array():
+    n, t = 4, 1
+    pp_elements = PreProcessedElements()
+    pp_elements.generate_triples(1000, n, t)
+
+    async def _prog(ctx):
+        # Single and bulk retrieval consume the same triples in order
+        ctx.preproc.get_triples(ctx)
+        a_sh, b_sh, ab_sh = ctx.preproc.get_triples_array(ctx, 50)
+        assert len(a_sh) == len(b_sh) == len(ab_sh) == 50
+        a, b, ab = await a_sh.open(), await b_sh.open(), await ab_sh.open()
+        assert [x * y for x, y in zip(a, b)] == ab
+
+        a_sh, b_sh, ab_sh = ctx.preproc.get_triples(ctx)
+        a, b, ab = await a_sh.open(), await b_sh.open(), await ab_sh.open()
+        assert a * b == ab
+
+    program_runner = TaskProgramRunner(n, t)
+    program_runner.add(_prog)
+    await program_runner.join()
+
+
 @mark.asyncio
 async def test_get_cube():
     n, t = 4, 1
@@ -76,6 +122,26 @@ async def test_get_rand():
     await program_runner.join()
 
 
+@mark.asyncio
+async def test_get_zeros_and_rands_array():
+    n, t = 4, 1
+    pp_elements = PreProcessedElements()
+    pp_elements.generate_zeros(1000, n, t)
+    pp_elements.generate_rands(1000, n, t)
+
+    async def _prog(ctx):
+        zeros = ctx.preproc.get_zeros_array(ctx, 20)
+        assert await zeros.open() == [0] * 20
+
+        rands = ctx.preproc.get_rands_array(ctx, 20, 2 * t)
+        assert len(rands) == 20
+        assert rands.t == 2 * t
+
+    program_runner = TaskProgramRunner(n, t)
+    program_runner.add(_prog)
+    await program_runner.join()
+
+
 @mark.asyncio
 async def test_get_bit():
     n, t = 4, 1
@@ -150,6 +216,23 @@ async def test_get_double_share():
     await program_runner.join()
 
 
+@mark.asyncio
+async def test_get_double_shares_array():
+    n, t = 9, 2
+    pp_elements = PreProcessedElements()
+    pp_elements.generate_double_shares(1000, n, t)
+
+    async def _prog(ctx):
+        r_t_sh, r_2t_sh = ctx.preproc.get_double_shares_array(ctx, 10)
+        assert r_t_sh.t == ctx.t
+        assert r_2t_sh.t == ctx.t * 2
+        assert await r_t_sh.open() == await r_2t_sh.open()
+
+    program_runner = TaskProgramRunner(n, t)
+    program_runner.add(_prog)
+    await program_runner.join()
+
+
 @mark.asyncio
 async def test_get_share_bits():
     n, t, = 4, 1
@@ -166,3 +249,206 @@ async def test_get_share_bits():
     program_runner = TaskProgramRunner(n, t)
     program_runner.add(_prog)
     await program_runner.join()
+
+
+def test_consumed_values_not_reused(tmp_path, monkeypatch):
+    monkeypatch.setattr(PreProcessingMixin, "_cursors", {})
+    n, t = 4, 1
+    field = PreProcessedElements.DEFAULT_FIELD
+    poly = polynomials_over(field)
+    data_dir = f"{tmp_path}/"
+    context = _context(0, n, t)
+
+    rands = RandomPreProcessing(field, poly, data_dir)
+    rands.generate_values(4000, n, t)
+    used = [rands.get_value(context) for _ in range(2100)]
+
+    # Only values actually used are compacted away, not those reserved
+    _wait_for_compaction()
+    file_name = rands.build_filename(n, t, 0)
+    share_file = rands._read_preprocessing_file(file_name)
+    assert 2000 <= share_file.first_index <= 2100
+    assert share_file.first_index + len(share_file) == 4000
+
+    # Forget the cursors held in memory, as after a restart
+    monkeypatch.setattr(PreProcessingMixin, "_cursors", {})
+    restarted = RandomPreProcessing(field, poly, data_dir)
+    remaining = restarted.min_count(n, t)
+    assert 0 < remaining <= 4000 - 2100
+    assert not set(used) & {restarted.get_value(context) for _ in range(remaining)}
+
+
+def test_small_files_kept_until_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(PreProcessingMixin, "_cursors", {})
+    n, t = 4, 1
+    field = PreProcessedElements.DEFAULT_FIELD
+    poly = polynomials_over(field)
+    data_dir = f"{tmp_path}/"
+    context = _context(0, n, t)
+
+    rands = RandomPreProcessing(field, poly, data_dir)
+    for _ in range(2):
+        rands.add_values(0, n, t, list(range(10)))
+        rands.get_value(context)
+        _wait_for_compaction()
+    file_name = rands.build_filename(n, t, 0)
+    share_file = rands._read_preprocessing_file(file_name)
+    assert (share_file.first_index, len(share_file)) == (0, 20)
+
+    # A file whose values are all used is still appended to
+    for _ in range(18):
+        rands.get_value(context)
+    _wait_for_compaction()
+    rands.add_values(0, n, t, [7])
+    share_file = rands._read_preprocessing_file(file_name)
+    assert share_file.first_index + len(share_file) == 21
+    assert rands.get_value(context) == 7
+
+
+def test_files_loaded_on_first_use(tmp_path):
+    n, t = 4, 1
+    field = PreProcessedElements.DEFAULT_FIELD
+    poly = polynomials_over(field)
+    data_dir = f"{tmp_path}/"
+    ZeroPreProcessing(field, poly, data_dir).generate_values(10, n, t)
+
+    zeros = ZeroPreProcessing(field, poly, data_dir)
+    assert sorted(zeros._files) == [(i, n, t) for i in range(n)]
+    assert len(zeros.cache) == 0
+
+    zeros.get_value(_context(2, n, t))
+    assert list(zeros.cache) == [(2, n, t)]
+    assert zeros.count[2, n, t] == 9
+
+    zeros.prefetch(1, n, t)
+    assert sorted(zeros.cache) == [(1, n, t), (2, n, t)]
+    assert zeros.min_count(n, t) == 9
+    assert len(zeros._files) == 0
+
+
+@mark.parametrize("processes", [None, 2])
+def test_generate_values_in_chunks(tmp_path, monkeypatch, processes):
+
+    monkeypatch.setattr(preprocessing, "DEALER_CHUNK_SIZE", 4)
+    n, t, k = 4, 1, 10
+    field = PreProcessedElements.DEFAULT_FIELD
+    poly = polynomials_over(field)
+    data_dir = f"{tmp_path}/"
+    TriplePreProcessing(field, poly, data_dir).generate_values(
+        k, n, t, processes=processes
+    )
+
+    triples = TriplePreProcessing(field, poly, data_dir)
+    shares = [
+        list(triples._read_preprocessing_file(triples.build_filename(n, t, i)))
+        for i in range(n)
+    ]
+    assert all(len(s) == 3 * k for s in shares)
+
+    for j in range(3 * k):
+        points = [(i + 1, field(shares[i][j])) for i in range(n)]
+        p = poly.interpolate(points[: t + 1])
+        assert all(p(x) == y for x, y in points)
+
+    for j in range(k):
+        a, b, ab = [
+            poly.interpolate([(i + 1, field(shares[i][3 * j + m])) for i in range(n)])
+            for m in range(3)
+        ]
+        assert a(0) * b(0) == ab(0)
+
+
+def test_dealer_chunks_sized_by_stride(tmp_path, monkeypatch):
+    monkeypatch.setattr(preprocessing, "DEALER_CHUNK_SIZE", 7)
+    deal_shares, chunks = preprocessing._deal_shares, []
+
+    def _deal_shares(cls, modulus, n, t, args, k):
+        chunks.append(k)
+        return deal_shares(cls, modulus, n, t, args, k)
+
+    monkeypatch.setattr(preprocessing, "_deal_shares", _deal_shares)
+    field = PreProcessedElements.DEFAULT_FIELD
+    poly = polynomials_over(field)
+    TriplePreProcessing(field, poly, f"{tmp_path}/").generate_values(5, 4, 1)
+    assert chunks == [2, 2, 1]
+
+
+def test_dealer_output_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(preprocessing, "DEALER_CHUNK_SIZE", 2)
+    monkeypatch.setattr(PreProcessingMixin, "_cursors", {})
+    n, t, k = 4, 1, 100
+    field = PreProcessedElements.DEFAULT_FIELD
+    poly = polynomials_over(field)
+    rands = RandomPreProcessing(field, poly, f"{tmp_path}/")
+    rands.generate_values(k, n, t)
+    first = [rands.get_value(_context(i, n, t)) for i in range(n)]
+    rands.generate_values(k, n, t, append=True)
+
+    # Values written by the dealer are only read back from the files
+    assert not rands.cache and not rands.count
+    assert sorted(rands._files) == [(i, n, t) for i in range(n)]
+
+    shares = [[first[i]] for i in range(n)]
+    for i in range(n):
+        assert rands.available(i, n, t) == 2 * k - 1
+        shares[i] += [rands.get_value(_context(i, n, t)) for _ in range(2 * k - 1)]
+    for j in range(2 * k):
+        points = [(i + 1, field(shares[i][j])) for i in range(n)]
+        p = poly.interpolate(points[: t + 1])
+        assert all(p(x) == y for x, y in points)
+
+
+def test_share_secrets_degrees():
+
+    n, t = 7, 2
+    field = PreProcessedElements.DEFAULT_FIELD
+    poly = polynomials_over(field)
+    secrets = [5, 5, 11, 11]
+    shares = share_secrets(secrets, n, (t, 2 * t), field.modulus)
+
+    for j, secret in enumerate(secrets):
+        degree = t if j % 2 == 0 else 2 * t
+        points = [(i + 1, field(shares[i][j])) for i in range(n)]
+        p = poly.interpolate(points[: degree + 1])
+        assert p(0) == secret
+        assert all(p(x) == y for x, y in points)
+
+
+def test_metrics(tmp_path):
+    n, t = 4, 1
+    pp_elements = PreProcessedElements(data_directory=f"{tmp_path}/")
+    pp_elements.generate_triples(30, n, t)
+    pp_elements.generate_rands(100, n, t)
+
+    context = _context(1, n, t)
+    for _ in range(6):
+        pp_elements.get_triples(context)
+
+    metrics = {(m["kind"], m["party"]): m for m in pp_elements.metrics()}
+    assert len(metrics) == 2 * n
+
+    triples = metrics["triples", 1]
+    assert (triples["n"], triples["t"], triples["remaining"]) == (n, t, 24)
+    assert triples["consumption_rate"] == triples["production_rate"] / 5
+    assert triples["time_to_depletion"] is None
+    assert metrics["triples", 0]["remaining"] == 30
+    assert metrics["rands", 1]["consumption_rate"] == 0
+
+    pp_elements.log_metrics()
+
+
+def test_metrics_do_not_load_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(PreProcessingMixin, "_cursors", {})
+    n, t = 4, 1
+    field = PreProcessedElements.DEFAULT_FIELD
+    poly = polynomials_over(field)
+    data_dir = f"{tmp_path}/"
+    TriplePreProcessing(field, poly, data_dir).generate_values(10, n, t)
+
+    triples = TriplePreProcessing(field, poly, data_dir)
+    triples.get_value(_context(0, n, t))
+
+    remaining = {m["party"]: m["remaining"] for m in triples.metrics()}
+    assert remaining == {0: 9, 1: 10, 2: 10, 3: 10}
+    assert list(triples.cache) == [(0, n, t)]
+    assert sorted(triples._files) == [(i, n, t) for i in range(1, n)]
@@ -0,0 +1,38 @@
+from honeybadgermpc.preprocessing_metrics import RateMeter, time_to_depletion
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_rate_meter():
+    clock = FakeClock()
+    meter = RateMeter(window=10, clock=clock)
+    assert meter.rate() == 0
+
+    meter.add(20)
+    clock.now += 0.5
+    meter.add(30)
+    assert meter.rate() == 5
+    assert meter.total == 50
+
+    clock.now += 5
+    meter.add(10)
+    assert meter.rate() == 6
+
+    # Events older than the window are no longer counted
+    clock.now += 6
+    assert meter.rate() == 1
+    clock.now += 10
+    assert meter.rate() == 0
+    assert meter.total == 60
+
+
+def test_time_to_depletion():
+    assert time_to_depletion(100, 10, 5) == 20
+    assert time_to_depletion(100, 5, 5) is None
+    assert time_to_depletion(100, 0, 0) is None
@@ -0,0 +1,59 @@
+from pytest import mark
+
+from honeybadgermpc.mpc import TaskProgramRunner
+from honeybadgermpc.preprocessing import PreProcessedElements
+from honeybadgermpc.preprocessing_planner import plan_preprocessing
+from honeybadgermpc.progs.mixins.constants import MixinConstants
+from honeybadgermpc.progs.mixins.share_arithmetic import (
+    BeaverMultiply,
+    BeaverMultiplyArrays,
+)
+
+CONFIG = {
+    MixinConstants.MultiplyShare: BeaverMultiply(),
+    MixinConstants.MultiplyShareArray: BeaverMultiplyArrays(),
+}
+
+
+async def _prog(context, k):
+    x = context.preproc.get_rand(context)
+    for _ in range(k):
+        x = x * context.preproc.get_bit(context)
+
+    xs = context.preproc.get_rands_array(context, k)
+    ys = await (await (xs * xs)).open()
+
+    # Parties may not all use the same preprocessing
+    if context.myid == 0:
+        context.preproc.get_zero(context)
+
+    return await x.open(), ys
+
+
+@mark.asyncio
+async def test_plan_preprocessing():
+    n, t, k = 4, 1, 5
+    plan = await plan_preprocessing(_prog, n, t, CONFIG, k=k)
+
+    assert plan.counts[1] == {"rands": k + 1, "bits": k, "triples": 2 * k}
+    assert plan.counts[0] == {"rands": k + 1, "bits": k, "triples": 2 * k, "zeros": 1}
+    assert plan.requirements == plan.counts[0]
+    assert plan.unplanned == []
+    assert "generate_triples(10, 4, 1)" in str(plan)
+
+
+@mark.asyncio
+async def test_run_with_planned_preprocessing(tmp_path):
+    n, t, k = 4, 1, 3
+    plan = await plan_preprocessing(_prog, n, t, CONFIG, k=k)
+
+    pp_elements = PreProcessedElements(data_directory=f"{tmp_path}/")
+    plan.generate(pp_elements)
+
+    program_runner = TaskProgramRunner(n, t, CONFIG)
+    program_runner.add(_prog, preproc=pp_elements, k=k)
+    await program_runner.join()
+
+    for kind, count in plan.requirements.items():
+        assert pp_elements._get_mixin(kind).min_count(n, t) <= count
+    assert pp_elements._triples.available(1, n, t) == 0
@@ -0,0 +1,150 @@
+import asyncio
+
+from pytest import mark
+
+from honeybadgermpc.mpc import TaskProgramRunner
+from honeybadgermpc.preprocessing import PreProcessedElements, PreProcessingConstants
+from honeybadgermpc.preprocessing_service import (
+    PreProcessingService,
+    Producer,
+    randousha_double_shares,
+    randousha_rands,
+    randousha_triples,
+)
+from honeybadgermpc.progs.mixins.constants import MixinConstants
+from honeybadgermpc.progs.mixins.share_arithmetic import BeaverMultiply
+
+
+@mark.asyncio
+async def test_wait_for_values():
+    n, t = 4, 1
+    pp_elements = PreProcessedElements(append=False)
+    pp_elements.clear_preprocessing()
+
+    async def _prog(context):
+        await context.preproc.wait_for(context, PreProcessingConstants.RANDS, 2)
+        return await context.preproc.get_rands_array(context, 2).open()
+
+    program_runner = TaskProgramRunner(n, t)
+    program_runner.add(_prog)
+    program = asyncio.ensure_future(program_runner.join())
+
+    await asyncio.sleep(0.1)
+    assert not program.done()
+
+    pp_elements.generate_rands(2, n, t)
+
+    results = await asyncio.wait_for(program, 5)
+    assert len(set(map(tuple, results))) == 1
+
+
+@mark.asyncio
+async def test_preprocessing_service(test_router):
+    n, t = 4, 1
+    pp_elements = PreProcessedElements(append=False)
+    pp_elements.clear_preprocessing()
+
+    sends, recvs, _ = test_router(n)
+    services = [
+        PreProcessingService(
+            n,
+            t,
+            i,
+            sends[i],
+            recvs[i],
+            [
+                Producer(PreProcessingConstants.RANDS, randousha_rands, 4, 8, k=2),
+                Producer(PreProcessingConstants.TRIPLES, randousha_triples, 2, 4, k=2),
+                Producer(
+                    PreProcessingConstants.DOUBLE_SHARES, randousha_double_shares, 1, 2
+                ),
+            ],
+            preproc=pp_elements,
+        )
+        for i in range(n)
+    ]
+
+    async def _prog(context):
+        rands = []
+        for _ in range(5):
+            # Consumers wait for the producers to refill the store
+            await context.preproc.wait_for(context, PreProcessingConstants.RANDS, 6)
+            rands += await context.preproc.get_rands_array(context, 6).open()
+
+        await context.preproc.wait_for(context, PreProcessingConstants.TRIPLES, 3)
+        a, b, ab = context.preproc.get_triples_array(context, 3)
+        a, b, ab = await a.open(), await b.open(), await ab.open()
+        assert [x * y for x, y in zip(a, b)] == ab
+
+        await context.preproc.wait_for(context, PreProcessingConstants.DOUBLE_SHARES)
+        r_t, r_2t = context.preproc.get_double_shares(context)
+        assert await r_t.open() == await r_2t.open()
+
+        x, y = context.Share(3), context.Share(4)
+        assert await (x * y).open() == 12
+
+        return rands
+
+    for service in services:
+        service.__enter__()
+    try:
+        program_runner = TaskProgramRunner(
+            n, t, {MixinConstants.MultiplyShare: BeaverMultiply()}
+        )
+        program_runner.add(_prog, preproc=pp_elements)
+        results = await asyncio.wait_for(program_runner.join(), 60)
+    finally:
+        for service in services:
+            service.__exit__(None, None, None)
+
+    rands = results[0]
+    assert all(r == rands for r in results)
+    assert len(set(rands)) == len(rands) == 30
+
+    # Production stops at the high watermark
+    for i in range(n):
+        assert pp_elements._rands.available(i, n, t) < 8 + 2 * (n - 2 * t)
+
+
+@mark.asyncio
+async def test_mixins_wait_for_service(test_router):
+    n, t = 4, 1
+    pp_elements = PreProcessedElements(append=False)
+    pp_elements.clear_preprocessing()
+
+    sends, recvs, _ = test_router(n)
+    services = [
+        PreProcessingService(
+            n,
+            t,
+            i,
+            sends[i],
+            recvs[i],
+            [Producer(PreProcessingConstants.TRIPLES, randousha_triples, 2, 4, k=2)],
+            preproc=pp_elements,
+        )
+        for i in range(n)
+    ]
+
+    async def _prog(context):
+        # The store starts out empty, so multiplications wait for the service
+        assert pp_elements.available(context, PreProcessingConstants.TRIPLES) == 0
+        xs = [context.Share(i) for i in range(6)]
+        # The products are all computed before any is opened, as they finish in a
+        # different order at each party and opens must be issued in the same order
+        products = await asyncio.gather(*[x * x for x in xs])
+        return await asyncio.gather(*[p.open() for p in products])
+
+    for service in services:
+        service.__enter__()
+    try:
+        program_runner = TaskProgramRunner(
+            n, t, {MixinConstants.MultiplyShare: BeaverMultiply()}
+        )
+        program_runner.add(_prog, preproc=pp_elements)
+        results = await asyncio.wait_for(program_runner.join(), 60)
+    finally:
+        for service in services:
+            service.__exit__(None, None, None)
+
+    assert all(r == [i * i for i in range(6)] for r in results)
@@ -0,0 +1,144 @@
+import os
+from random import randint
+
+from pytest import fixture, raises
+
+from honeybadgermpc.preprocessing_store import (
+    ELEMENT_SIZE,
+    HEADER_SIZE,
+    ConsumptionCursor,
+    ShareFile,
+    convert_directory,
+    convert_text_file,
+    is_share_file,
+)
+
+
+@fixture
+def values(galois_field):
+    return [galois_field.random().value for _ in range(100)]
+
+
+def test_create_and_read(tmp_path, galois_field, values):
+    file_name = str(tmp_path / "triples_4_1-0.share")
+    ShareFile.create(file_name, galois_field.modulus, 1, 0, values)
+
+    share_file = ShareFile(file_name)
+    assert share_file.modulus == galois_field.modulus
+    assert share_file.degree == 1
+    assert share_file.context_id == 0
+    assert len(share_file) == len(values)
+    assert list(share_file) == values
+    assert share_file[5] == values[5]
+    assert share_file[-1] == values[-1]
+    assert share_file[10:20] == values[10:20]
+    assert share_file.read(90, 200) == values[90:]
+    assert os.path.getsize(file_name) == HEADER_SIZE + len(values) * ELEMENT_SIZE
+
+    with raises(IndexError):
+        share_file[len(values)]
+
+
+def test_append(tmp_path, galois_field, values):
+    file_name = str(tmp_path / "rands_4_1-2.share")
+    share_file = ShareFile.create(file_name, galois_field.modulus, 1, 2, values[:50])
+    assert list(share_file) == values[:50]
+
+    share_file.append(values[50:])
+    assert len(share_file) == len(values)
+    assert list(share_file) == values
+    assert list(ShareFile(file_name)) == values
+
+
+def test_create_replaces_mapped_file(tmp_path, galois_field, values):
+    file_name = str(tmp_path / "zeros_4_1-0.share")
+    old = ShareFile.create(file_name, galois_field.modulus, 1, 0, values)
+    assert old[0] == values[0]
+
+    ShareFile.create(file_name, galois_field.modulus, 1, 0, values[:1])
+    assert list(old) == values
+    assert list(ShareFile(file_name)) == values[:1]
+
+
+def test_ignores_partially_appended_elements(tmp_path, galois_field, values):
+    file_name = str(tmp_path / "bits_4_1-0.share")
+    ShareFile.create(file_name, galois_field.modulus, 1, 0, values)
+    with open(file_name, "ab") as f:
+        f.write(b"\x01" * (ELEMENT_SIZE + 3))
+
+    assert list(ShareFile(file_name)) == values
+
+
+def test_convert_text_file(tmp_path, galois_field, values):
+    file_name = str(tmp_path / "cubes_4_1-3.share")
+    with open(file_name, "w") as f:
+        print(galois_field.modulus, 1, 3, *values, file=f, sep="\n")
+
+    with raises(ValueError):
+        ShareFile(file_name)
+
+    convert_text_file(file_name)
+    share_file = ShareFile(file_name)
+    assert (share_file.modulus, share_file.degree, share_file.context_id) == (
+        galois_field.modulus,
+        1,
+        3,
+    )
+    assert list(share_file) == values
+
+
+def test_convert_directory(tmp_path, galois_field):
+    text_file = str(tmp_path / "triples_4_1-0.share")
+    binary_file = str(tmp_path / "triples_4_1-1.share")
+    other_file = str(tmp_path / "READY")
+
+    values = [randint(0, galois_field.modulus - 1) for _ in range(10)]
+    with open(text_file, "w") as f:
+        print(galois_field.modulus, 1, 0, *values, file=f, sep="\n")
+    ShareFile.create(binary_file, galois_field.modulus, 1, 1, values)
+    open(other_file, "w").close()
+
+    assert convert_directory(str(tmp_path)) == [text_file]
+    assert is_share_file(text_file)
+    assert list(ShareFile(text_file)) == values
+    assert list(ShareFile(binary_file)) == values
+
+
+def test_compact(tmp_path, galois_field, values):
+    file_name = str(tmp_path / "triples_4_1-0.share")
+    share_file = ShareFile.create(file_name, galois_field.modulus, 1, 0, values)
+
+    share_file = share_file.compact(30)
+    assert share_file.first_index == 30
+    assert list(share_file) == values[30:]
+
+    share_file = share_file.compact(20)
+    assert share_file.first_index == 50
+    assert list(ShareFile(file_name)) == values[50:]
+
+
+def test_consumption_cursor(tmp_path):
+    file_name = str(tmp_path / "triples_4_1-0.share.cursor")
+    cursor = ConsumptionCursor(file_name, batch_size=10)
+    assert (cursor.position, cursor.reserved) == (0, 0)
+
+    cursor.advance(3)
+    assert (cursor.position, cursor.reserved) == (3, 13)
+    cursor.advance(10)
+    assert (cursor.position, cursor.reserved) == (13, 13)
+    cursor.advance()
+    assert (cursor.position, cursor.reserved) == (14, 24)
+
+    # A restart resumes after everything that was reserved
+    cursor = ConsumptionCursor(file_name, batch_size=10)
+    assert (cursor.position, cursor.reserved) == (24, 24)
+
+
+def test_truncated_consumption_cursor(tmp_path):
+    file_name = str(tmp_path / "triples_4_1-0.share.cursor")
+    ConsumptionCursor(file_name, batch_size=10).advance()
+    with open(file_name, "r+b") as f:
+        f.truncate(3)
+
+    with raises(ValueError):
+        ConsumptionCursor(file_name)
@@ -0,0 +1,98 @@
+import asyncio
+
+from pytest import mark, raises
+
+from honeybadgermpc.mpc import TaskProgramRunner
+from honeybadgermpc.polynomial import polynomials_over
+from honeybadgermpc.preprocessing import PreProcessedElements
+from honeybadgermpc.progs.mixins.constants import MixinConstants
+from honeybadgermpc.progs.mixins.share_arithmetic import BeaverMultiply
+from honeybadgermpc.prss import (
+    PRSS,
+    PRSSPreProcessedElements,
+    deal_prss_keys,
+    distribute_prss_keys,
+)
+
+
+def _interpolate(galois_field, shares, degree):
+    """ Interpolates the first degree + 1 shares, and checks that the resulting
+    polynomial agrees with all of the shares.
+    """
+    poly = polynomials_over(galois_field).interpolate(
+        [(i + 1, s) for i, s in enumerate(shares[: degree + 1])]
+    )
+    assert all(poly(i + 1) == s for i, s in enumerate(shares))
+    return poly(0)
+
+
+def _prss(galois_field, n, t):
+    keys = deal_prss_keys(n, t)
+    return [PRSS(galois_field, n, t, i, keys[i]) for i in range(n)]
+
+
+@mark.parametrize("n, t", [(4, 1), (7, 2)])
+def test_prss_shares(galois_field, n, t):
+    prss = _prss(galois_field, n, t)
+
+    secrets = set()
+    for _ in range(5):
+        secrets.add(_interpolate(galois_field, [p.rand() for p in prss], t))
+        secrets.add(_interpolate(galois_field, [p.rand_2t() for p in prss], 2 * t))
+        assert _interpolate(galois_field, [p.zero() for p in prss], t) == 0
+
+    assert len(secrets) == 10
+
+
+def test_prss_2t_shares_are_not_degree_t(galois_field):
+    n, t = 7, 2
+    prss = _prss(galois_field, n, t)
+    with raises(AssertionError):
+        _interpolate(galois_field, [p.rand_2t() for p in prss], t)
+
+
+@mark.asyncio
+async def test_distribute_prss_keys(test_router, galois_field):
+    n, t = 5, 1
+    sends, recvs, _ = test_router(n)
+    keys = await asyncio.gather(
+        *[distribute_prss_keys(n, t, i, sends[i], recvs[i]) for i in range(n)]
+    )
+
+    for i in range(n):
+        for subset, key in keys[i].items():
+            assert i in subset
+            assert all(keys[j][subset] == key for j in subset)
+
+    prss = [PRSS(galois_field, n, t, i, keys[i]) for i in range(n)]
+    assert _interpolate(galois_field, [p.zero() for p in prss], t) == 0
+
+
+@mark.asyncio
+async def test_prss_preprocessing(galois_field):
+    n, t = 4, 1
+    pp_elements = PreProcessedElements()
+    pp_elements.generate_triples(100, n, t)
+    preproc = PRSSPreProcessedElements(_prss(galois_field, n, t), pp_elements)
+
+    async def _prog(context):
+        assert await (context.preproc.get_zero(context) + context.Share(5)).open() == 5
+
+        r = context.preproc.get_rand(context)
+        assert await context.preproc.get_rand(context, 2 * t).open() is not None
+        with raises(ValueError):
+            context.preproc.get_rand(context, 3 * t)
+
+        rands = context.preproc.get_rands_array(context, 10)
+        zeros = context.preproc.get_zeros_array(context, 10)
+        assert await (rands + zeros).open() == await rands.open()
+
+        # Other kinds of preprocessing come from the PreProcessedElements
+        r_open = await r.open()
+        assert await (r * r).open() == r_open * r_open
+
+    program_runner = TaskProgramRunner(
+        n, t, {MixinConstants.MultiplyShare: BeaverMultiply()}
+    )
+    program_runner.add(_prog, preproc=preproc)
+    await program_runner.join()
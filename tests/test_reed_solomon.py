@@ -10,6 +10,9 @@ from honeybadgermpc.reed_solomon import (
 from honeybadgermpc.polynomial import EvalPoint
 from honeybadgermpc.reed_solomon import EncoderFactory, DecoderFactory
 from honeybadgermpc.reed_solomon import EncoderSelector, DecoderSelector
+from honeybadgermpc.reed_solomon import IncrementalDecoder
+from honeybadgermpc.reed_solomon import Algorithm, CodecCalibration
+from honeybadgermpc.reed_solomon_calibration import calibrate
 from honeybadgermpc.ntl import AvailableNTLThreads
 from unittest.mock import patch
 
@@ -163,6 +166,36 @@ def test_auto_decode_fft_enabled(fft_decoding_test_cases):
         assert actual == decoded
 
 
+@pytest.mark.asyncio
+async def test_decode_batch_async(decoding_test_cases, fft_decoding_test_cases):
+    for test_case in decoding_test_cases + fft_decoding_test_cases:
+        z, encoded, decoded, point = test_case
+        if type(encoded[0]) is not list:
+            encoded, decoded = [encoded], [decoded]
+        dec = DecoderFactory.get(point)
+        enc = EncoderFactory.get(point)
+        assert await dec.decode_batch_async(z, encoded) == decoded
+        assert await enc.encode_batch_async(decoded) == enc.encode_batch(decoded)
+
+
+@pytest.mark.asyncio
+async def test_incremental_decoder_add_async(galois_field):
+    point = EvalPoint(galois_field, 4)
+    enc, dec = VandermondeEncoder(point), VandermondeDecoder(point)
+    robust_dec = GaoRobustDecoder(1, point)
+    decoded = [[1, 2], [2, 3]]
+    encoded = enc.encode_batch(decoded)
+
+    inc_decoder = IncrementalDecoder(
+        enc, dec, robust_dec, degree=1, batch_size=2, max_errors=1
+    )
+    for idx in range(4):
+        await inc_decoder.add_async(idx, [e[idx] for e in encoded])
+
+    assert inc_decoder.done()
+    assert inc_decoder.get_results() == (decoded, set())
+
+
 def test_gao_robust_decode(robust_decoding_test_cases):
     for test_case in robust_decoding_test_cases:
         z, encoded, decoded, expected_errors, t, point = test_case
@@ -181,7 +214,26 @@ def test_wb_robust_decode(robust_decoding_test_cases):
         assert actual_errors == expected_errors
 
 
-def test_encoder_selection(galois_field):
+def test_wb_robust_decode_batch(galois_field):
+    point = EvalPoint(galois_field, 7)
+    t = 2
+    z = [0, 1, 2, 3, 4, 5]
+    decoded = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    encoded = [
+        [sum(c * (zi + 1) ** j for j, c in enumerate(coeffs)) for zi in z]
+        for coeffs in decoded
+    ]
+    # One error in the second word
+    encoded[1][3] += 1
+
+    dec = WelchBerlekampRobustDecoder(t, point)
+    results = dec.robust_decode_batch(z, encoded)
+
+    assert results == [(decoded[0], []), (decoded[1], [3]), (decoded[2], [])]
+
+
+@patch("honeybadgermpc.reed_solomon.get_calibration", return_value=None)
+def test_encoder_selection(_, galois_field):
     # Very small n < 8. Vandermonde should always be picked
     point = EvalPoint(galois_field, 4, use_omega_powers=True)
     assert isinstance(EncoderSelector.select(point, 1), VandermondeEncoder)
@@ -217,8 +269,9 @@ def test_encoder_selection(galois_field):
     assert isinstance(EncoderSelector.select(point, 100000), FFTEncoder)
 
 
+@patch("honeybadgermpc.reed_solomon.get_calibration", return_value=None)
 @patch("psutil.cpu_count")
-def test_decoder_selection(mocked_cpu_count, galois_field):
+def test_decoder_selection(mocked_cpu_count, _, galois_field):
     # Very small n < 8. Vandermonde should always be picked
     point = EvalPoint(galois_field, 4, use_omega_powers=True)
     for cpu_count in [1, 100]:
@@ -273,3 +326,64 @@ def test_decoder_selection(mocked_cpu_count, galois_field):
                     assert isinstance(
                         DecoderSelector.select(point, batch_size), FFTDecoder
                     )
+
+
+def _calibration_result(op, n, k, threads, vandermonde, fft):
+    return {
+        "op": op,
+        "n": n,
+        "batch_size": k,
+        "threads": threads,
+        Algorithm.VANDERMONDE: vandermonde,
+        Algorithm.FFT: fft,
+    }
+
+
+def test_codec_calibration_lookup(tmp_path):
+    calibration = CodecCalibration(
+        [
+            _calibration_result("decode", 16, 1, 1, 2.0, 1.0),
+            _calibration_result("decode", 16, 1, 4, 2.0, 0.5),
+            _calibration_result("decode", 16, 4096, 1, 1.0, 3.0),
+            _calibration_result("decode", 16, 4096, 4, 0.2, 1.0),
+            _calibration_result("encode", 256, 1, 1, 1.0, 2.0),
+        ]
+    )
+    path = str(tmp_path / "calibration.json")
+    calibration.save(path)
+    calibration = CodecCalibration.load(path)
+
+    assert calibration.best_algorithm("decode", 16, 1, 1) == Algorithm.FFT
+    assert calibration.best_algorithm("decode", 20, 2, 3) == Algorithm.FFT
+    assert calibration.best_algorithm("decode", 16, 5000, 4) == Algorithm.VANDERMONDE
+    assert calibration.best_algorithm("encode", 16, 1, 1) == Algorithm.VANDERMONDE
+    assert calibration.best_thread_count("decode", 16, 1) == 4
+    assert calibration.best_thread_count("decode", 16, 4000) == 4
+    assert calibration.best_algorithm("unknown", 16, 1, 1) is None
+    assert CodecCalibration.load(str(tmp_path / "missing.json")) is None
+
+
+def test_selection_with_calibration(galois_field):
+    calibration = CodecCalibration(
+        [
+            _calibration_result("encode", 4, 1, 1, 2.0, 1.0),
+            _calibration_result("decode", 256, 1, 1, 1.0, 2.0),
+        ]
+    )
+    with patch("honeybadgermpc.reed_solomon.get_calibration", return_value=calibration):
+        # These would use Vandermonde and FFT without a calibration
+        point = EvalPoint(galois_field, 4, use_omega_powers=True)
+        assert isinstance(EncoderSelector.select(point, 1), FFTEncoder)
+        point = EvalPoint(galois_field, 256, use_omega_powers=True)
+        assert isinstance(DecoderSelector.select(point, 1), VandermondeDecoder)
+
+
+def test_calibrate(galois_field):
+    calibration = calibrate(ns=[4, 8], batch_sizes=[1, 4], thread_counts=[1], repeat=1)
+    assert len(calibration.results) == 2 * 2 * 2
+    for result in calibration.results:
+        assert result[Algorithm.VANDERMONDE] > 0 and result[Algorithm.FFT] > 0
+    assert calibration.best_algorithm("decode", 8, 4, 1) in [
+        Algorithm.VANDERMONDE,
+        Algorithm.FFT,
+    ]